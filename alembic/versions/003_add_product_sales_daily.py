@@ -0,0 +1,53 @@
+"""add product sales daily rollup
+
+Revision ID: 003
+Revises: d723ab25a5ed
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = 'd723ab25a5ed'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # Rollup diario de ventas por producto, mantenido al guardar órdenes
+    op.create_table(
+        'product_sales_daily',
+        sa.Column('product_name', sa.String(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('total_quantity', sa.Integer(), nullable=False),
+        sa.Column('total_price', sa.Numeric(14, 2), nullable=False),
+        sa.PrimaryKeyConstraint('product_name', 'day')
+    )
+
+    # Índice para filtrar el rollup por rango de días
+    op.create_index('ix_product_sales_daily_day', 'product_sales_daily', ['day'])
+
+    # Backfill con las órdenes existentes
+    connection = op.get_bind()
+    if connection.dialect.name == 'sqlite':
+        day_expression = "date(o.created_at)"
+    else:
+        day_expression = "CAST(o.created_at AS DATE)"
+
+    connection.execute(
+        sa.text(f"""
+            INSERT INTO product_sales_daily (product_name, day, total_quantity, total_price)
+            SELECT oi.product_name,
+                   {day_expression},
+                   SUM(oi.quantity),
+                   SUM(oi.quantity * oi.unit_price)
+            FROM order_items oi
+            JOIN orders o ON o.id = oi.order_id
+            GROUP BY oi.product_name, {day_expression}
+        """)
+    )
+
+def downgrade() -> None:
+    op.drop_index('ix_product_sales_daily_day', table_name='product_sales_daily')
+    op.drop_table('product_sales_daily')
@@ -0,0 +1,38 @@
+"""add covering indexes for the sales report
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # Índice para filtrar órdenes por fecha (reporte y listados por keyset)
+    op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'])
+
+    # Índice de cobertura para el join del reporte: order_items por order_id
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index(
+            'ix_order_items_order_id_covering',
+            'order_items',
+            ['order_id'],
+            postgresql_include=['product_name', 'quantity', 'unit_price']
+        )
+    else:
+        # SQLite no soporta INCLUDE: un índice compuesto también cubre la consulta
+        op.create_index(
+            'ix_order_items_order_id_covering',
+            'order_items',
+            ['order_id', 'product_name', 'quantity', 'unit_price']
+        )
+
+def downgrade() -> None:
+    op.drop_index('ix_order_items_order_id_covering', table_name='order_items')
+    op.drop_index('ix_orders_created_at_id', table_name='orders')
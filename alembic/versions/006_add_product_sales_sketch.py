@@ -0,0 +1,98 @@
+"""add product sales sketch
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+from src.shared.infrastructure.config.settings import get_settings
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # Contadores por mes de los SALES_SKETCH_CAPACITY productos más vendidos; desde la migración 010
+    # el job refresh-sales-sketch los reconstruye periódicamente desde product_sales_daily
+    op.create_table(
+        'product_sales_sketch',
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('product_name', sa.String(), nullable=False),
+        sa.Column('total_quantity', sa.Integer(), nullable=False),
+        sa.Column('total_price', sa.Numeric(14, 2), nullable=False),
+        sa.Column('max_error', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('month', 'product_name')
+    )
+
+    # Estado por mes; floor_quantity es la cantidad del primer producto que quedó fuera del sketch
+    sketch_months = op.create_table(
+        'product_sales_sketch_months',
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('floor_quantity', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('month')
+    )
+
+    # Backfill desde el rollup diario: los productos más vendidos de cada mes, con conteos exactos
+    connection = op.get_bind()
+    if connection.dialect.name == 'sqlite':
+        month_expression = "strftime('%Y-%m-01', day)"
+    else:
+        month_expression = "CAST(date_trunc('month', day) AS DATE)"
+
+    rows = connection.execute(
+        sa.text(f"""
+            SELECT {month_expression} AS month,
+                   product_name,
+                   SUM(total_quantity) AS total_quantity,
+                   SUM(total_price) AS total_price
+            FROM product_sales_daily
+            GROUP BY {month_expression}, product_name
+            ORDER BY month, total_quantity DESC, product_name
+        """)
+    ).all()
+
+    capacity = get_settings().SALES_SKETCH_CAPACITY
+    counters = []
+    floors = {}
+    for row in rows:
+        month = row.month
+        if isinstance(month, str):
+            month = datetime.strptime(month, '%Y-%m-%d').date()
+        kept = floors.setdefault(month, [0, 0])
+        if kept[0] < capacity:
+            kept[0] += 1
+            counters.append({
+                'month': month,
+                'product_name': row.product_name,
+                'total_quantity': row.total_quantity,
+                'total_price': row.total_price,
+                'max_error': 0
+            })
+        else:
+            # Las filas vienen ordenadas por cantidad: la primera descartada es el piso del mes
+            kept[1] = max(kept[1], row.total_quantity)
+
+    sketch = sa.table(
+        'product_sales_sketch',
+        sa.column('month', sa.Date()),
+        sa.column('product_name', sa.String()),
+        sa.column('total_quantity', sa.Integer()),
+        sa.column('total_price', sa.Numeric(14, 2)),
+        sa.column('max_error', sa.Integer())
+    )
+    if counters:
+        op.bulk_insert(sketch, counters)
+    if floors:
+        op.bulk_insert(
+            sketch_months,
+            [{'month': month, 'floor_quantity': floor} for month, (_, floor) in floors.items()]
+        )
+
+def downgrade() -> None:
+    op.drop_table('product_sales_sketch_months')
+    op.drop_table('product_sales_sketch')
@@ -0,0 +1,56 @@
+"""add waiter sales daily rollup
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # Rollup diario de órdenes, artículos e ingresos por mesero, mantenido al guardar órdenes
+    op.create_table(
+        'waiter_sales_daily',
+        sa.Column('waiter_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('order_count', sa.Integer(), nullable=False),
+        sa.Column('items_sold', sa.Integer(), nullable=False),
+        sa.Column('total_price', sa.Numeric(14, 2), nullable=False),
+        sa.ForeignKeyConstraint(['waiter_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('waiter_id', 'day')
+    )
+
+    # Índice para filtrar el rollup por rango de días
+    op.create_index('ix_waiter_sales_daily_day', 'waiter_sales_daily', ['day'])
+
+    # Backfill con las órdenes existentes
+    connection = op.get_bind()
+    if connection.dialect.name == 'sqlite':
+        day_expression = "date(o.created_at)"
+    else:
+        day_expression = "CAST(o.created_at AS DATE)"
+
+    connection.execute(
+        sa.text(f"""
+            INSERT INTO waiter_sales_daily (waiter_id, day, order_count, items_sold, total_price)
+            SELECT o.waiter_id,
+                   {day_expression},
+                   COUNT(DISTINCT o.id),
+                   SUM(oi.quantity),
+                   SUM(oi.quantity * oi.unit_price)
+            FROM orders o
+            JOIN order_items oi ON oi.order_id = o.id
+            GROUP BY o.waiter_id, {day_expression}
+        """)
+    )
+
+def downgrade() -> None:
+    op.drop_index('ix_waiter_sales_daily_day', table_name='waiter_sales_daily')
+    op.drop_table('waiter_sales_daily')
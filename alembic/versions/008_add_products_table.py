@@ -0,0 +1,118 @@
+"""add products table
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+# Tablas que pasan de product_name a product_id, con su clave primaria
+PRODUCT_TABLES = {
+    'order_items': None,
+    'product_sales_daily': ['product_id', 'day'],
+    'product_sales_sketch': ['month', 'product_id'],
+}
+
+def upgrade() -> None:
+    # Dimensión de productos: los reportes agrupan por id entero en lugar del nombre
+    op.create_table(
+        'products',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name', name='uq_products_name')
+    )
+
+    # Backfill con todos los nombres usados
+    op.execute("""
+        INSERT INTO products (name)
+        SELECT product_name FROM order_items
+        UNION
+        SELECT product_name FROM product_sales_daily
+        UNION
+        SELECT product_name FROM product_sales_sketch
+        ORDER BY 1
+    """)
+
+    # Los índices que incluyen product_name se recrean sobre product_id
+    op.drop_index('ix_order_items_product_stats', table_name='order_items')
+    op.drop_index('ix_order_items_order_id_covering', table_name='order_items')
+
+    dialect = op.get_bind().dialect.name
+    for table, primary_key in PRODUCT_TABLES.items():
+        op.add_column(table, sa.Column('product_id', sa.Integer(), nullable=True))
+        _copy_column(dialect, table, 'product_id', "p.id", "p.name = {table}.product_name")
+
+        with op.batch_alter_table(table) as batch_op:
+            if primary_key and dialect == 'postgresql':
+                batch_op.drop_constraint(f'{table}_pkey', type_='primary')
+            batch_op.drop_column('product_name')
+            batch_op.alter_column('product_id', existing_type=sa.Integer(), nullable=False)
+            if primary_key:
+                batch_op.create_primary_key(f'{table}_pkey', primary_key)
+            batch_op.create_foreign_key(f'fk_{table}_product_id', 'products', ['product_id'], ['id'])
+
+    # Índice para las búsquedas de order_items por producto (y la FK)
+    op.create_index('ix_order_items_product_id', 'order_items', ['product_id'])
+    _create_covering_index(dialect, 'product_id')
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    op.drop_index('ix_order_items_order_id_covering', table_name='order_items')
+    op.drop_index('ix_order_items_product_id', table_name='order_items')
+
+    for table, primary_key in PRODUCT_TABLES.items():
+        op.add_column(table, sa.Column('product_name', sa.String(), nullable=True))
+        _copy_column(dialect, table, 'product_name', "p.name", "p.id = {table}.product_id")
+
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(f'fk_{table}_product_id', type_='foreignkey')
+            if primary_key and dialect == 'postgresql':
+                batch_op.drop_constraint(f'{table}_pkey', type_='primary')
+            batch_op.drop_column('product_id')
+            batch_op.alter_column('product_name', existing_type=sa.String(), nullable=False)
+            if primary_key:
+                batch_op.create_primary_key(
+                    f'{table}_pkey', ['product_name' if c == 'product_id' else c for c in primary_key]
+                )
+
+    _create_covering_index(dialect, 'product_name')
+    op.create_index(
+        'ix_order_items_product_stats',
+        'order_items',
+        ['product_name', 'quantity', 'unit_price']
+    )
+    op.drop_table('products')
+
+def _copy_column(dialect: str, table: str, column: str, value: str, condition: str) -> None:
+    """Fills column of table from the matching products row"""
+    condition = condition.format(table=table)
+    if dialect == 'postgresql':
+        op.execute(f"UPDATE {table} SET {column} = {value} FROM products p WHERE {condition}")
+    else:
+        op.execute(f"UPDATE {table} SET {column} = (SELECT {value} FROM products p WHERE {condition})")
+
+def _create_covering_index(dialect: str, product_column: str) -> None:
+    """Covering index for the report join, as in migration 004"""
+    if dialect == 'postgresql':
+        op.create_index(
+            'ix_order_items_order_id_covering',
+            'order_items',
+            ['order_id'],
+            postgresql_include=[product_column, 'quantity', 'unit_price']
+        )
+    else:
+        # SQLite no soporta INCLUDE: un índice compuesto también cubre la consulta
+        op.create_index(
+            'ix_order_items_order_id_covering',
+            'order_items',
+            ['order_id', product_column, 'quantity', 'unit_price']
+        )
@@ -0,0 +1,210 @@
+"""partition orders by month
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+from src.shared.infrastructure.config.settings import get_settings
+from src.order.infrastructure.persistence.partitions import (
+    PARTITIONED_TABLES,
+    add_months,
+    default_partition_name,
+    ensure_monthly_partitions,
+    is_partitioned,
+    month_start
+)
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+# Columnas de cada tabla, en el orden usado para copiar los datos
+ORDER_COLUMNS = 'id, customer_name, waiter_id, created_at'
+ORDER_ITEM_COLUMNS = 'id, order_id, product_id, unit_price, quantity, created_at'
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    # created_at de la orden copiado en sus items: los filtros por fecha no necesitan el join
+    op.add_column('order_items', sa.Column('created_at', sa.DateTime(), nullable=True))
+    if dialect == 'postgresql':
+        op.execute(
+            "UPDATE order_items SET created_at = o.created_at FROM orders o WHERE o.id = order_items.order_id"
+        )
+    else:
+        op.execute(
+            "UPDATE order_items SET created_at = (SELECT o.created_at FROM orders o WHERE o.id = order_items.order_id)"
+        )
+    with op.batch_alter_table('order_items') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+
+    # Opcional: particiones mensuales, solo en PostgreSQL y con ORDERS_PARTITIONING=true
+    if dialect == 'postgresql' and get_settings().ORDERS_PARTITIONING:
+        _partition_tables()
+    else:
+        _create_items_created_at_index(dialect)
+
+def downgrade() -> None:
+    if is_partitioned(op.get_bind(), 'orders'):
+        _unpartition_tables()
+    else:
+        op.drop_index('ix_order_items_created_at', table_name='order_items')
+
+    with op.batch_alter_table('order_items') as batch_op:
+        batch_op.drop_column('created_at')
+
+def _partition_tables() -> None:
+    """Rebuilds orders and order_items as tables partitioned by month on created_at"""
+    bind = op.get_bind()
+    sequences = _detach_tables('unpartitioned')
+
+    # La clave de partición debe formar parte de la clave primaria y de la FK hacia orders
+    op.execute(f"""
+        CREATE TABLE orders (
+            id INTEGER NOT NULL DEFAULT nextval('{sequences['orders']}'),
+            customer_name VARCHAR NOT NULL,
+            waiter_id INTEGER NOT NULL REFERENCES users (id),
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT orders_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute(f"""
+        CREATE TABLE order_items (
+            id INTEGER NOT NULL DEFAULT nextval('{sequences['order_items']}'),
+            order_id INTEGER NOT NULL,
+            product_id INTEGER NOT NULL,
+            unit_price NUMERIC(10, 2) NOT NULL,
+            quantity INTEGER NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT order_items_pkey PRIMARY KEY (id, created_at),
+            CONSTRAINT order_items_order_id_fkey FOREIGN KEY (order_id, created_at)
+                REFERENCES orders (id, created_at) ON DELETE CASCADE,
+            CONSTRAINT fk_order_items_product_id FOREIGN KEY (product_id) REFERENCES products (id)
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    # Una partición por mes desde la primera orden hasta ORDER_PARTITIONS_AHEAD_MONTHS a futuro;
+    # la partición default recibe las filas de meses sin partición para que los INSERT no fallen
+    for table in PARTITIONED_TABLES:
+        op.execute(f"CREATE TABLE {default_partition_name(table)} PARTITION OF {table} DEFAULT")
+    first_order = bind.scalar(sa.text("SELECT MIN(created_at) FROM orders_unpartitioned"))
+    current_month = month_start(datetime.utcnow())
+    ensure_monthly_partitions(
+        bind,
+        month_start(first_order) if first_order else current_month,
+        add_months(current_month, get_settings().ORDER_PARTITIONS_AHEAD_MONTHS)
+    )
+
+    op.execute(f"INSERT INTO orders ({ORDER_COLUMNS}) SELECT {ORDER_COLUMNS} FROM orders_unpartitioned")
+    op.execute(
+        f"INSERT INTO order_items ({ORDER_ITEM_COLUMNS}) SELECT {ORDER_ITEM_COLUMNS} FROM order_items_unpartitioned"
+    )
+    _drop_detached_tables('unpartitioned', sequences)
+
+    # Los índices del padre se crean en cada partición, también en las futuras
+    _create_indexes()
+    _create_items_created_at_index('postgresql')
+    op.execute("ANALYZE orders")
+    op.execute("ANALYZE order_items")
+
+def _unpartition_tables() -> None:
+    """Rebuilds orders and order_items as plain tables, as before this migration"""
+    sequences = _detach_tables('partitioned')
+
+    op.execute(f"""
+        CREATE TABLE orders (
+            id INTEGER NOT NULL DEFAULT nextval('{sequences['orders']}'),
+            customer_name VARCHAR NOT NULL,
+            waiter_id INTEGER NOT NULL REFERENCES users (id),
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT orders_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute(f"""
+        CREATE TABLE order_items (
+            id INTEGER NOT NULL DEFAULT nextval('{sequences['order_items']}'),
+            order_id INTEGER NOT NULL,
+            product_id INTEGER NOT NULL,
+            unit_price NUMERIC(10, 2) NOT NULL,
+            quantity INTEGER NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT order_items_pkey PRIMARY KEY (id),
+            CONSTRAINT order_items_order_id_fkey FOREIGN KEY (order_id) REFERENCES orders (id) ON DELETE CASCADE,
+            CONSTRAINT fk_order_items_product_id FOREIGN KEY (product_id) REFERENCES products (id)
+        )
+    """)
+
+    op.execute(f"INSERT INTO orders ({ORDER_COLUMNS}) SELECT {ORDER_COLUMNS} FROM orders_partitioned")
+    op.execute(
+        f"INSERT INTO order_items ({ORDER_ITEM_COLUMNS}) SELECT {ORDER_ITEM_COLUMNS} FROM order_items_partitioned"
+    )
+    # Al borrar los padres se borran también sus particiones
+    _drop_detached_tables('partitioned', sequences)
+    _create_indexes()
+
+def _detach_tables(suffix: str) -> dict:
+    """
+    Renames orders and order_items out of the way of their replacements
+
+    Indexes are dropped and primary keys renamed so the new tables can reuse
+    the names; the id sequences are unlinked so dropping the old tables keeps
+    them. Returns the sequence of each table.
+    """
+    bind = op.get_bind()
+    sequences = {
+        table: bind.scalar(sa.text(f"SELECT pg_get_serial_sequence('{table}', 'id')"))
+        for table in PARTITIONED_TABLES
+    }
+    for index in (
+        'ix_order_items_created_at',
+        'ix_order_items_order_id_covering',
+        'ix_order_items_product_id',
+        'ix_orders_created_at_id'
+    ):
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+    for table in PARTITIONED_TABLES:
+        op.execute(f"ALTER SEQUENCE {sequences[table]} OWNED BY NONE")
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_{suffix}")
+        op.execute(f"ALTER INDEX {table}_pkey RENAME TO {table}_{suffix}_pkey")
+    return sequences
+
+def _drop_detached_tables(suffix: str, sequences: dict) -> None:
+    """Drops the tables renamed by _detach_tables and links the sequences to the new tables"""
+    op.execute(f"DROP TABLE order_items_{suffix}")
+    op.execute(f"DROP TABLE orders_{suffix}")
+    for table in PARTITIONED_TABLES:
+        op.execute(f"ALTER SEQUENCE {sequences[table]} OWNED BY {table}.id")
+
+def _create_indexes() -> None:
+    """Indexes of orders and order_items from migrations 004 and 008"""
+    op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'])
+    op.create_index('ix_order_items_product_id', 'order_items', ['product_id'])
+    op.create_index(
+        'ix_order_items_order_id_covering',
+        'order_items',
+        ['order_id'],
+        postgresql_include=['product_id', 'quantity', 'unit_price']
+    )
+
+def _create_items_created_at_index(dialect: str) -> None:
+    """Covering index for the report aggregations filtered on order_items.created_at"""
+    if dialect == 'postgresql':
+        op.create_index(
+            'ix_order_items_created_at',
+            'order_items',
+            ['created_at'],
+            postgresql_include=['product_id', 'quantity', 'unit_price']
+        )
+    else:
+        # SQLite no soporta INCLUDE: un índice compuesto también cubre la consulta
+        op.create_index(
+            'ix_order_items_created_at',
+            'order_items',
+            ['created_at', 'product_id', 'quantity', 'unit_price']
+        )
@@ -0,0 +1,34 @@
+"""add sales sketch refreshed_at, drop counter max_error
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # Último rebuild del sketch desde el rollup diario; NULL hasta que lo reconstruye el job,
+    # mientras tanto el reporte aproximado calcula ese mes exacto
+    op.add_column(
+        'product_sales_sketch_months',
+        sa.Column('refreshed_at', sa.DateTime(), nullable=True)
+    )
+
+    # Los contadores se reconstruyen con totales exactos: su max_error siempre es 0
+    with op.batch_alter_table('product_sales_sketch') as batch_op:
+        batch_op.drop_column('max_error')
+
+def downgrade() -> None:
+    with op.batch_alter_table('product_sales_sketch') as batch_op:
+        batch_op.add_column(sa.Column('max_error', sa.Integer(), nullable=False, server_default='0'))
+
+    with op.batch_alter_table('product_sales_sketch_months') as batch_op:
+        batch_op.drop_column('refreshed_at')
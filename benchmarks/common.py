@@ -0,0 +1,46 @@
+import json
+import math
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+root_dir = Path(__file__).parent.parent
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+def summarize(latencies_ms: List[float], wall_seconds: float, errors: int = 0) -> Dict[str, float]:
+    """Latency percentiles and throughput for one scenario"""
+    samples = sorted(latencies_ms)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "max_ms": round(samples[-1], 3) if samples else 0.0,
+        "rps": round(len(samples) / wall_seconds, 1) if wall_seconds else 0.0
+    }
+
+def git_revision() -> Optional[str]:
+    """Current commit, so results from different commits can be compared"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=root_dir,
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def emit(result: dict, output: Optional[str]) -> None:
+    """Prints the result as JSON, also writing it to output when given"""
+    result = {"revision": git_revision(), **result}
+    text = json.dumps(result, indent=2, default=str)
+    if output:
+        Path(output).write_text(text + "\n")
+    print(text)
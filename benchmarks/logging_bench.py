@@ -0,0 +1,95 @@
+"""
+Request latency of POST /users with logging off, with the previous synchronous
+file sinks and with the batching sinks of src.shared.infrastructure.logging.
+
+Each mode replaces the loguru handlers and then creates `--requests` users
+in-process against a migrated benchmark database, so the only difference
+between runs is how log records reach the disk. Results are printed as JSON.
+
+    python benchmarks/logging_bench.py --requests 2000 --concurrency 20
+"""
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+import click
+
+# Validate if src is in the path
+root_dir = Path(__file__).parent.parent
+sys.path.append(str(root_dir))
+
+from sqlalchemy import create_engine
+from benchmarks.common import emit
+from benchmarks.load_test import in_process_client, run_scenario
+from benchmarks.seed import migrate
+
+MODES = ("off", "sync", "batched")
+
+def configure_mode(mode: str, log_dir: str) -> None:
+    """Installs the handlers of one mode; "sync" is the configuration before the batching sinks"""
+    from loguru import logger
+    from src.shared.infrastructure.logging.logger import configure_logging, log_format
+
+    if mode == "batched":
+        configure_logging(log_dir)
+        return
+    logger.remove()
+    if mode == "sync":
+        for name, level in (("app.log", "INFO"), ("error.log", "ERROR")):
+            logger.add(
+                os.path.join(log_dir, name),
+                rotation="500 MB",
+                format=log_format,
+                level=level,
+                backtrace=True,
+                diagnose=True
+            )
+
+async def run_mode(mode: str, requests: int, concurrency: int, log_dir: str) -> Dict[str, float]:
+    from loguru import logger
+
+    configure_mode(mode, log_dir)
+
+    def create_user(c, i):
+        return c.post("/users/", json={"email": f"{mode}-{i}@example.com", "name": f"Bench User {i}"})
+
+    async with in_process_client() as client:
+        result = await run_scenario(mode, create_user, client, requests, concurrency)
+    # Waits for the batching sinks to drain so the next mode starts idle
+    logger.remove()
+    return result
+
+@click.command()
+@click.option("--db-url", default="sqlite:///./logging_bench.db", help="Empty database to use")
+@click.option("--requests", default=1000, show_default=True, help="Users created per mode")
+@click.option("--concurrency", default=10, show_default=True, help="Concurrent requests")
+@click.option("--mode", "modes", multiple=True, type=click.Choice(MODES), help="Modes to run (default: all)")
+@click.option("--output", default=None, help="Also write the JSON result to this file")
+def main(db_url: str, requests: int, concurrency: int, modes, output: Optional[str]):
+    # src reads its settings on first import, so point it at the benchmark database first
+    os.environ["DB_URL"] = db_url
+    # The console handler would be the same in every mode
+    os.environ["DEBUG"] = "False"
+    engine = create_engine(db_url)
+    with engine.begin() as connection:
+        migrate(connection)
+    engine.dispose()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as log_dir:
+        for mode in modes or MODES:
+            results[mode] = asyncio.run(run_mode(mode, requests, concurrency, log_dir))
+
+    emit(
+        {
+            "config": {"db_url": db_url, "requests": requests, "concurrency": concurrency},
+            "modes": results
+        },
+        output
+    )
+
+if __name__ == "__main__":
+    main()
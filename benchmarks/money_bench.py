@@ -0,0 +1,125 @@
+"""
+Measures the per-order cost of Money arithmetic and OrderResponseDTO serialization.
+
+Runs the same workload twice: once with the previous Pydantic-based Money
+(kept below as the baseline) and once with the current slotted Money. No
+database is needed. Results are printed as JSON.
+
+    python benchmarks/money_bench.py --orders 10000 --items-per-order 5
+"""
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional
+
+import click
+from pydantic import BaseModel, Field, field_validator
+
+# Validate if src is in the path
+root_dir = Path(__file__).parent.parent
+sys.path.append(str(root_dir))
+
+from src.order.application.dto.order_dto import OrderResponseDTO
+from src.order.domain.model import order as order_module
+from src.order.domain.model.order import Order, OrderItem
+from src.shared.domain.value_objects import Money
+from benchmarks.common import emit
+from benchmarks.seed import PRODUCTS
+
+class PydanticMoney(BaseModel):
+    """Money as implemented before the slotted value object"""
+    amount: Decimal = Field(..., gt=0)
+    currency: str = "MXN"
+
+    @field_validator('amount', mode='before')
+    def validate_amount(cls, v):
+        if not isinstance(v, Decimal):
+            v = Decimal(str(v))
+        return v
+
+    def __add__(self, other: 'PydanticMoney') -> 'PydanticMoney':
+        return PydanticMoney(amount=self.amount + other.amount, currency=self.currency)
+
+    def __mul__(self, quantity: int) -> 'PydanticMoney':
+        return PydanticMoney(amount=self.amount * quantity, currency=self.currency)
+
+    @classmethod
+    def from_trusted(cls, amount: Decimal, currency: str = "MXN") -> 'PydanticMoney':
+        return cls(amount=amount, currency=currency)
+
+@contextmanager
+def money_class(cls):
+    """Makes the order model build its totals with cls"""
+    previous = order_module.Money
+    order_module.Money = cls
+    try:
+        yield
+    finally:
+        order_module.Money = previous
+
+def build_orders(cls, orders: int, items_per_order: int) -> list:
+    created_at = datetime.now(timezone.utc)
+    return [
+        Order(
+            id=i + 1,
+            customer_name="Benchmark Customer",
+            items=[
+                OrderItem(
+                    id=j + 1,
+                    product_name=PRODUCTS[(i + j) % len(PRODUCTS)],
+                    unit_price=cls.from_trusted(Decimal(10 + (i + j) % len(PRODUCTS)) + Decimal("0.50")),
+                    quantity=j + 1
+                )
+                for j in range(items_per_order)
+            ],
+            waiter_id=1,
+            created_at=created_at
+        )
+        for i in range(orders)
+    ]
+
+def run(cls, orders: int, items_per_order: int, repeat: int) -> dict:
+    with money_class(cls):
+        entities = build_orders(cls, orders, items_per_order)
+
+        best_totals = best_dto = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for order in entities:
+                order.total_price
+            best_totals = min(best_totals, time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for order in entities:
+                OrderResponseDTO.from_entity(order)
+            best_dto = min(best_dto, time.perf_counter() - started)
+
+    return {
+        "total_price_us_per_order": round(best_totals / orders * 1e6, 3),
+        "from_entity_us_per_order": round(best_dto / orders * 1e6, 3)
+    }
+
+@click.command()
+@click.option("--orders", default=10_000, show_default=True, help="Orders built per run")
+@click.option("--items-per-order", default=5, show_default=True)
+@click.option("--repeat", default=5, show_default=True, help="Runs per implementation; the best is reported")
+@click.option("--output", default=None, help="Also write the JSON result to this file")
+def main(orders: int, items_per_order: int, repeat: int, output: Optional[str]):
+    baseline = run(PydanticMoney, orders, items_per_order, repeat)
+    current = run(Money, orders, items_per_order, repeat)
+    emit({
+        "orders": orders,
+        "items_per_order": items_per_order,
+        "baseline": baseline,
+        "current": current,
+        "speedup": {
+            key: round(baseline[key] / current[key], 2) if current[key] else None
+            for key in current
+        }
+    }, output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import random
+import sys
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List
+
+# Validate if src is in the path
+root_dir = Path(__file__).parent.parent
+sys.path.append(str(root_dir))
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import DateTime, Integer, Numeric, String, column, inspect, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from src.order.infrastructure.persistence.models import OrderModel, ProductModel
+from src.order.infrastructure.persistence.postgresql_order_repository import PostgresqlOrderRepository
+
+PRODUCTS = [f"Product {i:03d}" for i in range(50)]
+
+def migrate(connection: Connection, revision: str = "head") -> None:
+    """Runs the Alembic migrations up to revision on connection"""
+    cfg = Config(str(root_dir / "alembic.ini"))
+    cfg.set_main_option("script_location", str(root_dir / "alembic"))
+    cfg.attributes["connection"] = connection
+    command.upgrade(cfg, revision)
+
+def seed_users(connection: Connection, users: int) -> List[int]:
+    """Inserts waiters bench-0@example.com ... and returns their ids"""
+    # Only the columns of revision 001, so older revisions can be seeded too
+    users_table = table("users", column("email", String), column("name", String), column("created_at", DateTime))
+    connection.execute(
+        users_table.insert(),
+        [
+            {
+                "email": f"bench-{i}@example.com",
+                "name": f"Bench Waiter {i}",
+                "created_at": datetime.utcnow()
+            }
+            for i in range(users)
+        ]
+    )
+    return list(connection.scalars(
+        text("SELECT id FROM users WHERE email LIKE 'bench-%' ORDER BY id")
+    ))
+
+def seed_orders(
+    connection: Connection,
+    orders: int,
+    items_per_order: int,
+    days: int,
+    waiter_ids: List[int],
+    end: datetime = None,
+    chunk_size: int = 10_000,
+    seed: int = 42,
+    products: List[str] = PRODUCTS
+) -> None:
+    """
+    Inserts orders spread uniformly over the last `days` days, each with
+    `items_per_order` distinct products. Uses a fixed random seed so runs
+    are reproducible. Works before migration 008 too, when order items
+    still store product_name instead of product_id, and before migration
+    009, when they have no created_at.
+    """
+    item_columns = {c["name"] for c in inspect(connection).get_columns("order_items")}
+    if "product_id" in item_columns:
+        product_key = "product_id"
+        product_values = seed_products(connection, products)
+    else:
+        product_key = "product_name"
+        product_values = {name: name for name in products}
+    order_items = table(
+        "order_items",
+        column("order_id", Integer),
+        column(product_key, Integer if product_key == "product_id" else String),
+        column("unit_price", Numeric(10, 2)),
+        column("quantity", Integer),
+        *([column("created_at", DateTime)] if "created_at" in item_columns else [])
+    )
+
+    rng = random.Random(seed)
+    end = end or datetime.utcnow()
+    span_seconds = days * 24 * 3600
+    next_id = (connection.scalar(text("SELECT MAX(id) FROM orders")) or 0) + 1
+
+    for chunk_start in range(0, orders, chunk_size):
+        order_rows = []
+        item_rows = []
+        for order_id in range(next_id + chunk_start, next_id + min(chunk_start + chunk_size, orders)):
+            created_at = end - timedelta(seconds=rng.randrange(span_seconds))
+            order_rows.append({
+                "id": order_id,
+                "customer_name": f"Customer {order_id}",
+                "waiter_id": rng.choice(waiter_ids),
+                "created_at": created_at
+            })
+            for product_name in rng.sample(products, items_per_order):
+                item_row = {
+                    "order_id": order_id,
+                    product_key: product_values[product_name],
+                    "unit_price": Decimal(rng.randrange(500, 50_000)) / 100,
+                    "quantity": rng.randint(1, 5)
+                }
+                if "created_at" in item_columns:
+                    item_row["created_at"] = created_at
+                item_rows.append(item_row)
+        connection.execute(OrderModel.__table__.insert(), order_rows)
+        connection.execute(order_items.insert(), item_rows)
+
+def seed_products(connection: Connection, products: List[str]) -> Dict[str, int]:
+    """Inserts the missing products and returns the id of every name"""
+    existing = dict(connection.execute(text("SELECT name, id FROM products")).all())
+    missing = [name for name in products if name not in existing]
+    if missing:
+        connection.execute(ProductModel.__table__.insert(), [{"name": name} for name in missing])
+        existing = dict(connection.execute(text("SELECT name, id FROM products")).all())
+    return existing
+
+def rebuild_daily_sales(connection: Connection) -> None:
+    """Rebuilds the product_sales_daily rollup from the seeded orders"""
+    if connection.dialect.name == "sqlite":
+        day_expression = "date(o.created_at)"
+    else:
+        day_expression = "CAST(o.created_at AS DATE)"
+
+    connection.execute(text("DELETE FROM product_sales_daily"))
+    connection.execute(text(f"""
+        INSERT INTO product_sales_daily (product_id, day, total_quantity, total_price)
+        SELECT oi.product_id,
+               {day_expression},
+               SUM(oi.quantity),
+               SUM(oi.quantity * oi.unit_price)
+        FROM order_items oi
+        JOIN orders o ON o.id = oi.order_id
+        GROUP BY oi.product_id, {day_expression}
+    """))
+
+def rebuild_waiter_sales(connection: Connection) -> None:
+    """Rebuilds the waiter_sales_daily rollup from the seeded orders"""
+    if connection.dialect.name == "sqlite":
+        day_expression = "date(o.created_at)"
+    else:
+        day_expression = "CAST(o.created_at AS DATE)"
+
+    connection.execute(text("DELETE FROM waiter_sales_daily"))
+    connection.execute(text(f"""
+        INSERT INTO waiter_sales_daily (waiter_id, day, order_count, items_sold, total_price)
+        SELECT o.waiter_id,
+               {day_expression},
+               COUNT(DISTINCT o.id),
+               SUM(oi.quantity),
+               SUM(oi.quantity * oi.unit_price)
+        FROM orders o
+        JOIN order_items oi ON oi.order_id = o.id
+        GROUP BY o.waiter_id, {day_expression}
+    """))
+
+def rebuild_sales_sketch(connection: Connection, capacity: int) -> None:
+    """
+    Rebuilds the monthly top products sketch from product_sales_daily
+
+    Runs the same rebuild as `scripts/db.py refresh-sales-sketch` over every
+    ended month: the `capacity` best sellers of each month with exact counts,
+    and the largest dropped quantity as the month's floor.
+    """
+    connection.execute(text("DELETE FROM product_sales_sketch"))
+    connection.execute(text("DELETE FROM product_sales_sketch_months"))
+    with Session(bind=connection) as session:
+        PostgresqlOrderRepository(session, sketch_capacity=capacity).refresh_sales_sketch()
@@ -3,5 +3,14 @@
 # Agregar el directorio src al PYTHONPATH
 export PYTHONPATH="${PYTHONPATH}:/opt/app"
 
+# Aplicar migraciones una sola vez antes de levantar los workers
+python scripts/db.py init
+
+# Particiones de los próximos meses (sin efecto si orders no está particionada)
+python scripts/db.py create-partitions
+
+# Sketch del reporte aproximado de los meses cerrados (agendar también a diario)
+python scripts/db.py refresh-sales-sketch
+
 # Ejecutar la aplicación desde el módulo correcto
-uvicorn src.main:app --host 0.0.0.0 --port 8000
+uvicorn src.main:app --host 0.0.0.0 --port 8000 --workers ${WEB_CONCURRENCY:-1}
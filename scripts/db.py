@@ -1,4 +1,5 @@
 import sys
+from datetime import datetime
 from pathlib import Path
 import click
 from alembic import command
@@ -9,8 +10,18 @@ root_dir = Path(__file__).parent.parent
 sys.path.append(str(root_dir))
 
 from src.shared.infrastructure.config.settings import get_settings
-from src.shared.infrastructure.logging.logger import get_logger
+from src.shared.infrastructure.logging.logger import configure_logging, get_logger
+from sqlalchemy.orm import Session
+from src.shared.infrastructure.persistence.database import engine
+from src.order.infrastructure.persistence.postgresql_order_repository import PostgresqlOrderRepository
+from src.order.infrastructure.persistence.partitions import (
+    add_months,
+    default_partition_rows,
+    ensure_monthly_partitions,
+    month_start
+)
 
+configure_logging()
 logger = get_logger("DatabaseCLI")
 
 def get_alembic_config():
@@ -18,7 +29,7 @@ def get_alembic_config():
         logger.debug("Getting Alembic configuration")
         settings = get_settings()
         alembic_cfg = Config("alembic.ini")
-        alembic_cfg.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+        alembic_cfg.set_main_option("sqlalchemy.url", settings.DB_URL)
         return alembic_cfg
     except Exception as e:
         logger.error(f"Error getting Alembic config: {str(e)}", exc_info=True)
@@ -79,6 +90,38 @@ def downgrade():
         click.echo(f"❌ Error reverting migration: {e}", err=True)
         sys.exit(1)
 
+@cli.command()
+@click.option('--months-ahead', type=int, default=None, help='Defaults to ORDER_PARTITIONS_AHEAD_MONTHS')
+def create_partitions(months_ahead):
+    """Create the monthly partitions of orders and order_items for the coming months"""
+    try:
+        if months_ahead is None:
+            months_ahead = get_settings().ORDER_PARTITIONS_AHEAD_MONTHS
+        current_month = month_start(datetime.utcnow())
+        with engine.begin() as connection:
+            created = ensure_monthly_partitions(
+                connection, current_month, add_months(current_month, months_ahead)
+            )
+            default_rows = default_partition_rows(connection)
+        click.echo(f"✅ Created {len(created)} partitions: {', '.join(created) or '-'}")
+        for table, rows in default_rows.items():
+            if rows:
+                logger.warning(f"{rows} rows of {table} are in its default partition")
+    except Exception as e:
+        click.echo(f"❌ Error creating partitions: {e}", err=True)
+        sys.exit(1)
+
+@cli.command()
+def refresh_sales_sketch():
+    """Rebuild the top products sketch of the ended months from the daily rollup"""
+    try:
+        with Session(engine) as session:
+            months = PostgresqlOrderRepository(session).refresh_sales_sketch()
+        click.echo(f"✅ Rebuilt the sales sketch of {len(months)} months: {', '.join(map(str, months)) or '-'}")
+    except Exception as e:
+        click.echo(f"❌ Error refreshing the sales sketch: {e}", err=True)
+        sys.exit(1)
+
 @cli.command()
 def status():
     """Show current migration status"""
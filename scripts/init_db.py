@@ -18,7 +18,7 @@ def init_db():
     settings = get_settings()
 
     alembic_cfg = Config("alembic.ini")
-    alembic_cfg.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+    alembic_cfg.set_main_option("sqlalchemy.url", settings.DB_URL)
 
     try:
         # Execute all migrations including seed data
@@ -8,3 +8,8 @@ class TokenResponseDTO(BaseModel):
     """DTO for token responses"""
     access_token: str
     token_type: str = "bearer"
+
+class AuthenticatedUserDTO(BaseModel):
+    """DTO for the user making the request, as identified by the token"""
+    id: int
+    email: str
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from src.user.domain.service.user_service import UserService
 from src.auth.infrastructure.jwt_service import JWTService
-from src.auth.application.dto.auth_dto import LoginDTO, TokenResponseDTO
-from src.shared.infrastructure.api.dependencies import get_user_service
+from src.auth.infrastructure.revocation_list import revocation_list
+from src.auth.application.dto.auth_dto import AuthenticatedUserDTO, LoginDTO, TokenResponseDTO
+from src.shared.infrastructure.api.dependencies import get_authenticated_user, get_user_service
 
 router = APIRouter(tags=["auth"])
 
@@ -12,7 +13,7 @@ async def login(
     user_service: UserService = Depends(get_user_service)
 ):
     """Login endpoint"""
-    user = user_service.get_user_by_email(credentials.email)
+    user = await user_service.get_user_by_email(credentials.email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -22,10 +23,22 @@ async def login(
 
     token = JWTService.create_access_token({
         "sub": credentials.email,
-        "user_id": user.id
+        "user_id": user.id,
+        "ver": user.token_version
     })
 
     return TokenResponseDTO(
         access_token=token,
         token_type="bearer"
     )
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    current_user: AuthenticatedUserDTO = Depends(get_authenticated_user),
+    user_service: UserService = Depends(get_user_service)
+):
+    """Revokes every token issued to the current user"""
+    token_version = await user_service.revoke_tokens(current_user.id)
+    if token_version is not None:
+        revocation_list.revoke(current_user.id, token_version)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
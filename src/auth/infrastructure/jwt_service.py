@@ -1,10 +1,19 @@
+import hashlib
+import time
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
 from typing import Dict
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
 from src.shared.infrastructure.config.settings import get_settings
 
 settings = get_settings()
 
+# Process-wide cache of verified tokens: sha256(token) -> payload, until the token's exp
+token_cache = TTLCache(
+    maxsize=settings.JWT_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
 class JWTService:
     """Service for handling JWT tokens"""
 
@@ -28,7 +37,28 @@ class JWTService:
 
     @classmethod
     def verify_token(cls, token: str) -> Dict:
-        """Verifies a JWT token"""
+        """
+        Verifies a JWT token
+
+        Valid tokens are cached by digest until their exp, so repeated
+        requests with the same token skip decoding and signature checks.
+        Invalid tokens are never cached.
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        payload = token_cache.get(digest)
+        if payload is not None:
+            return dict(payload)
+
+        payload = cls._decode(token)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            remaining = exp - time.time()
+            if remaining > 0:
+                token_cache.set(digest, payload, ttl=remaining)
+        return dict(payload)
+
+    @classmethod
+    def _decode(cls, token: str) -> Dict:
         try:
             payload = jwt.decode(token, cls.SECRET_KEY, algorithms=[cls.ALGORITHM])
 
@@ -36,5 +66,5 @@ class JWTService:
                 raise ValueError("Token must include 'sub' and 'user_id'")
 
             return payload
-        except (JWTError, ValueError) as e:
+        except (JWTError, ValueError):
             raise ValueError("Could not validate credentials")
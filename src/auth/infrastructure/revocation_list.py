@@ -0,0 +1,72 @@
+import time
+from threading import Lock
+from typing import Awaitable, Callable, Dict
+from src.shared.infrastructure.config.settings import get_settings
+
+settings = get_settings()
+
+class RevocationList:
+    """
+    In-memory copy of the users' token versions, for stateless authentication
+
+    Only users that have revoked tokens are listed, so the map stays small.
+    A token is revoked when its version is older than the user's current
+    one. The map is reloaded at most every refresh_seconds; revocations made
+    by this process are applied immediately.
+    """
+
+    def __init__(self, refresh_seconds: float, timer: Callable[[], float] = time.monotonic):
+        self._refresh_seconds = refresh_seconds
+        self._timer = timer
+        self._versions: Dict[int, int] = {}
+        self._loaded_at = None
+        self._lock = Lock()
+        self._refreshing = False
+
+    def is_revoked(self, user_id: int, token_version: int) -> bool:
+        return token_version < self._versions.get(user_id, 0)
+
+    def revoke(self, user_id: int, token_version: int) -> None:
+        """Records a new token version for the user without waiting for a refresh"""
+        with self._lock:
+            if token_version > self._versions.get(user_id, 0):
+                self._versions = {**self._versions, user_id: token_version}
+
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or self._timer() - self._loaded_at >= self._refresh_seconds
+
+    def replace(self, versions: Dict[int, int]) -> None:
+        """Swaps in a freshly loaded map, keeping newer local revocations"""
+        with self._lock:
+            merged = dict(versions)
+            for user_id, token_version in self._versions.items():
+                if token_version > merged.get(user_id, 0):
+                    merged[user_id] = token_version
+            self._versions = merged
+            self._loaded_at = self._timer()
+
+    async def refresh_if_stale(self, loader: Callable[[], Awaitable[Dict[int, int]]]) -> None:
+        """
+        Reloads the map with loader when stale
+
+        While a reload is in flight, other callers keep using the current
+        map; only before the first load does every caller wait for one.
+        """
+        if not self.is_stale() or (self._refreshing and self._loaded_at is not None):
+            return
+        self._refreshing = True
+        try:
+            self.replace(await loader())
+        finally:
+            self._refreshing = False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._versions = {}
+            self._loaded_at = None
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+# Process-wide revocation list used when AUTH_STATELESS is enabled
+revocation_list = RevocationList(refresh_seconds=settings.AUTH_REVOCATION_REFRESH_SECONDS)
@@ -1,9 +1,16 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from src.shared.infrastructure.config.settings import get_settings
-from src.shared.infrastructure.persistence.database import Base, engine
+from src.shared.infrastructure.persistence.database import engine, async_engine
+from src.shared.infrastructure.api.responses import FastJSONResponse
+from src.shared.infrastructure.api.metrics_middleware import MetricsMiddleware
+from src.shared.infrastructure.api.metrics_routes import router as metrics_routes
+from src.shared.infrastructure.logging.logger import configure_logging, file_sinks, shutdown_logging
+from src.shared.infrastructure.metrics.registry import registry
+from src.shared.infrastructure.metrics.instrumentation import cache_collector, log_sink_collector, pool_collector
 from src.shared.infrastructure.api.error_handlers import (
     domain_exception_handler,
     not_found_exception_handler,
@@ -18,14 +25,34 @@ from src.shared.domain.exceptions import (
 from src.user.infrastructure.api.user_routes import router as user_routes
 from src.order.infrastructure.api.order_routes import router as order_routes
 from src.auth.infrastructure.api.auth_routes import router as auth_routes
+from src.auth.infrastructure.jwt_service import token_cache
+from src.user.infrastructure.persistence.cached_user_repository import user_cache
+from src.order.infrastructure.persistence.cached_order_repository import report_cache
+from src.order.infrastructure.persistence.postgresql_order_repository import product_cache
 
 # Get settings first
 settings = get_settings()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Configures the log sinks when a worker starts and releases its resources on shutdown
+
+    The schema is managed with Alembic (alembic upgrade head), so startup
+    does not touch the database; connections are opened by the first request.
+    """
+    configure_logging()
+    yield
+    await async_engine.dispose()
+    engine.dispose()
+    shutdown_logging()
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure exception handlers
@@ -62,9 +89,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 # Configure specific exception handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
@@ -87,18 +111,23 @@ async def unauthorized_exception_handler(request: Request, exc: UnauthorizedExce
         headers={"WWW-Authenticate": "Bearer"}
     )
 
-@app.middleware("http")
-async def db_session_middleware(request: Request, call_next):
-    response = await call_next(request)
+# Record latency and database work per route, exposed on /metrics
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    registry.register_collector(pool_collector({"sync": engine, "async": async_engine}))
+    registry.register_collector(cache_collector({
+        "user": user_cache,
+        "report": report_cache,
+        "token": token_cache,
+        "product": product_cache
+    }))
+    registry.register_collector(log_sink_collector(file_sinks))
+    app.include_router(metrics_routes)
 
-    if hasattr(engine.pool, "status"):
-        app.state.db_pool_status = {
-            "checkedin": engine.pool.checkedin(),
-            "checkedout": engine.pool.checkedout(),
-            "size": engine.pool.size(),
-            "overflow": engine.pool.overflow()
-        }
-    return response
+@app.get("/health", include_in_schema=False)
+async def health():
+    """Readiness probe; answers without touching the database"""
+    return {"status": "ok"}
 
 # Include routers
 app.include_router(user_routes, prefix=settings.API_V1_STR)
@@ -2,6 +2,7 @@ from src.order.domain.service.order_service import OrderService
 from src.user.domain.service.user_service import UserService
 from src.order.application.dto.order_dto import CreateOrderDTO, OrderResponseDTO
 from src.shared.domain.exceptions import ValidationException
+from typing import Optional
 
 class CreateOrderCommand:
     """Command to create a new order"""
@@ -10,12 +11,26 @@ class CreateOrderCommand:
         self._order_service = order_service
         self._user_service = user_service
 
-    def execute(self, order_data: CreateOrderDTO, waiter_email: str) -> OrderResponseDTO:
-        """Executes the order creation command"""
-        waiter_id = self._user_service.get_user_id_by_email(waiter_email)
+    async def execute(
+        self,
+        order_data: CreateOrderDTO,
+        waiter_email: str,
+        waiter_id: Optional[int] = None
+    ) -> OrderResponseDTO:
+        """
+        Executes the order creation command
+
+        Args:
+            order_data: Order to create
+            waiter_email: Email of the waiter taking the order
+            waiter_id: Id of the waiter when already resolved (e.g. by authentication),
+                which skips the lookup by email
+        """
+        if waiter_id is None:
+            waiter_id = await self._user_service.get_user_id_by_email(waiter_email)
         if not waiter_id:
             raise ValidationException(f"Waiter with email {waiter_email} not found")
 
         order = order_data.to_domain(waiter_id)
-        created_order = self._order_service.create_order(order)
+        created_order = await self._order_service.create_order(order)
         return OrderResponseDTO.from_entity(created_order)
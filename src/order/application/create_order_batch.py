@@ -0,0 +1,66 @@
+from typing import Dict, List
+from pydantic import ValidationError
+from src.order.domain.model.order import Order
+from src.order.domain.service.order_service import OrderService
+from src.order.application.dto.order_dto import (
+    CreateOrderBatchDTO,
+    CreateOrderDTO,
+    OrderBatchResponseDTO,
+    OrderBatchResultDTO,
+    OrderResponseDTO
+)
+from src.shared.domain.exceptions import ValidationException
+
+class CreateOrderBatchCommand:
+    """Command to create many orders at once, e.g. when replaying offline POS terminals"""
+
+    def __init__(self, order_service: OrderService):
+        self._order_service = order_service
+
+    async def execute(self, batch: CreateOrderBatchDTO, waiter_id: int) -> OrderBatchResponseDTO:
+        """
+        Executes the batch creation command
+
+        Every order is validated on its own; the valid ones are saved in a
+        single transaction and invalid ones are reported with their error.
+
+        Args:
+            batch: Raw orders to create
+            waiter_id: Id of the waiter submitting the batch
+
+        Returns:
+            Per-order results, in the same order as the request
+        """
+        results: List[OrderBatchResultDTO] = []
+        valid_orders: Dict[int, Order] = {}
+
+        for index, raw_order in enumerate(batch.orders):
+            try:
+                order_data = CreateOrderDTO.model_validate(raw_order)
+                valid_orders[index] = order_data.to_domain(waiter_id)
+            except ValidationError as e:
+                results.append(self._failure(index, e.errors()[0].get("msg", str(e))))
+            except (ValidationException, ValueError) as e:
+                results.append(self._failure(index, str(e)))
+
+        created_orders = await self._order_service.create_orders(list(valid_orders.values()))
+
+        for index, created_order in zip(valid_orders.keys(), created_orders):
+            results.append(
+                OrderBatchResultDTO(
+                    index=index,
+                    success=True,
+                    order=OrderResponseDTO.from_entity(created_order)
+                )
+            )
+
+        results.sort(key=lambda r: r.index)
+        return OrderBatchResponseDTO(
+            created=len(created_orders),
+            failed=len(results) - len(created_orders),
+            results=results
+        )
+
+    @staticmethod
+    def _failure(index: int, error: str) -> OrderBatchResultDTO:
+        return OrderBatchResultDTO(index=index, success=False, error=error)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import List
+from typing import List, Optional, Dict, Any
 from src.order.domain.model.order import Order
 from datetime import datetime
 from decimal import Decimal
@@ -21,12 +21,6 @@ class OrderItemDTO(BaseModel):
             raise ValueError("Unit price must be greater than 0")
         return v
 
-    model_config = {
-        "json_encoders": {
-            Decimal: str
-        }
-    }
-
 class CreateOrderDTO(BaseModel):
     """DTO for order creation"""
     customer_name: str = Field(..., min_length=2)
@@ -75,10 +69,7 @@ class OrderResponseDTO(BaseModel):
     created_at: datetime
 
     model_config = {
-        "from_attributes": True,
-        "json_encoders": {
-            Decimal: str
-        }
+        "from_attributes": True
     }
 
     @classmethod
@@ -100,6 +91,39 @@ class OrderResponseDTO(BaseModel):
             created_at=order.created_at
         )
 
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'OrderResponseDTO':
+        """Builds the DTO from a repository projection row, which is already typed, without validation"""
+        return cls.model_construct(
+            id=row['id'],
+            customer_name=row['customer_name'],
+            items=[OrderItemDTO.model_construct(**item) for item in row['items']],
+            total_price=row['total_price'],
+            waiter_id=row['waiter_id'],
+            created_at=row['created_at']
+        )
+
+class OrderPageDTO(BaseModel):
+    """DTO for a page of orders with the cursor for the next page"""
+    items: List[OrderResponseDTO]
+    next_cursor: Optional[str] = None
+
+class CreateOrderBatchDTO(BaseModel):
+    """DTO for bulk order creation; each order is validated individually"""
+    orders: List[Dict[str, Any]] = Field(..., min_length=1, max_length=1000)
+
+class OrderBatchResultDTO(BaseModel):
+    """DTO for the outcome of one order in a batch"""
+    index: int
+    success: bool
+    order: Optional[OrderResponseDTO] = None
+    error: Optional[str] = None
+
+class OrderBatchResponseDTO(BaseModel):
+    """DTO for bulk order creation responses"""
+    created: int
+    failed: int
+    results: List[OrderBatchResultDTO]
 
 class ProductSalesReportDTO(BaseModel):
     """DTO for product sales report response"""
@@ -110,6 +134,39 @@ class ProductSalesReportDTO(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'ProductSalesReportDTO':
+        """Builds the DTO from a report row, which is already typed, without validation"""
+        return cls.model_construct(**row)
+
+class ApproximateProductSalesDTO(ProductSalesReportDTO):
+    """DTO for an approximate report row; the true quantity is between total_quantity and total_quantity + max_error"""
+    max_error: int
+
+class WaiterSalesReportDTO(BaseModel):
+    """DTO for one waiter of the waiter sales report"""
+    waiter_id: int
+    order_count: int
+    items_sold: int
+    total_price: Decimal
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'WaiterSalesReportDTO':
+        """Builds the DTO from a report row, which is already typed, without validation"""
+        return cls.model_construct(**row)
+
+class SalesSeriesPointDTO(BaseModel):
+    """DTO for one bucket of a sales series; product_name is None unless split per product"""
+    bucket_start: datetime
+    product_name: Optional[str] = None
+    total_quantity: int
+    total_price: Decimal
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'SalesSeriesPointDTO':
+        """Builds the DTO from a series row, which is already typed, without validation"""
+        return cls.model_construct(**row)
+
 class DateRangeDTO(BaseModel):
     """DTO for date range filter"""
     start_date: datetime
@@ -0,0 +1,27 @@
+from src.order.domain.service.order_service import OrderService
+from src.order.application.dto.order_dto import OrderResponseDTO
+from src.shared.domain.exceptions import EntityNotFoundException
+
+class GetOrderQuery:
+    """Application service for getting a single order"""
+
+    def __init__(self, order_service: OrderService):
+        self._order_service = order_service
+
+    async def execute(self, id: int) -> OrderResponseDTO:
+        """
+        Gets an order by id
+
+        Args:
+            id: Id of the order
+
+        Returns:
+            The order with its items
+
+        Raises:
+            EntityNotFoundException: If no order has that id
+        """
+        order = await self._order_service.get_order_row(id)
+        if order is None:
+            raise EntityNotFoundException("Order not found")
+        return OrderResponseDTO.from_row(order)
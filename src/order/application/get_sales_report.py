@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 from src.order.domain.service.order_service import OrderService
-from src.order.application.dto.order_dto import ProductSalesReportDTO
+from src.order.application.dto.order_dto import ApproximateProductSalesDTO, ProductSalesReportDTO
+from src.shared.domain.exceptions import ValidationException
 from src.shared.domain.value_objects import DateTimeRange
 
 class GetSalesReportQuery:
@@ -9,19 +10,46 @@ class GetSalesReportQuery:
     def __init__(self, order_service: OrderService):
         self._order_service = order_service
 
-    def execute(self, date_range: DateTimeRange) -> List[ProductSalesReportDTO]:
+    async def execute(
+        self,
+        date_range: DateTimeRange,
+        limit: Optional[int] = None,
+        min_quantity: Optional[int] = None,
+        approximate: bool = False
+    ) -> List[ProductSalesReportDTO]:
         """
         Gets sales report for date range
 
         Args:
             date_range: Start and end dates for report
+            limit: Maximum number of products to return, all if None
+            min_quantity: Minimum total quantity of the returned products
+            approximate: Whether to estimate the top products from the sales
+                sketch, with max_error per product
 
         Returns:
             List of products with sales data, ordered by quantity
+
+        Raises:
+            ValidationException: If approximate is requested without limit
         """
-        report = self._order_service.get_product_sales_report(
+        if not approximate:
+            report = await self._order_service.get_product_sales_report(
+                start_date=date_range.start_date,
+                end_date=date_range.end_date,
+                limit=limit,
+                min_quantity=min_quantity
+            )
+            return [ProductSalesReportDTO.from_row(item) for item in report]
+
+        # The sketch only keeps the heaviest products, so it can answer top-N but not the full list
+        if limit is None:
+            raise ValidationException("The approximate report requires a limit")
+
+        report = await self._order_service.get_approximate_product_sales_report(
             start_date=date_range.start_date,
-            end_date=date_range.end_date
+            end_date=date_range.end_date,
+            limit=limit,
+            min_quantity=min_quantity
         )
-
-        return [ProductSalesReportDTO(**item) for item in report]
+        return [ApproximateProductSalesDTO.from_row(item) for item in report]
@@ -0,0 +1,51 @@
+from typing import List
+from src.order.domain.model.sales_bucket import SalesBucket
+from src.order.domain.service.order_service import OrderService
+from src.order.application.dto.order_dto import SalesSeriesPointDTO
+from src.shared.domain.exceptions import ValidationException
+from src.shared.domain.value_objects import DateTimeRange
+
+# Upper bound of buckets per request, e.g. about 83 days of hourly buckets
+MAX_SERIES_BUCKETS = 2000
+
+class GetSalesSeriesQuery:
+    """Application service for getting sales per time bucket"""
+
+    def __init__(self, order_service: OrderService, max_buckets: int = MAX_SERIES_BUCKETS):
+        self._order_service = order_service
+        self._max_buckets = max_buckets
+
+    async def execute(
+        self,
+        date_range: DateTimeRange,
+        bucket: SalesBucket,
+        by_product: bool = False
+    ) -> List[SalesSeriesPointDTO]:
+        """
+        Gets quantity and revenue per bucket for date range
+
+        Args:
+            date_range: Start and end dates for the series
+            bucket: Width of each bucket
+            by_product: Whether to split each bucket per product
+
+        Returns:
+            Non-empty buckets ordered by start (and product)
+
+        Raises:
+            ValidationException: If the range spans more than max_buckets buckets
+        """
+        buckets = (date_range.end_date - date_range.start_date) // bucket.width + 1
+        if buckets > self._max_buckets:
+            raise ValidationException(
+                f"Date range spans {buckets} {bucket.value} buckets, the maximum is {self._max_buckets}"
+            )
+
+        series = await self._order_service.get_sales_series(
+            start_date=date_range.start_date,
+            end_date=date_range.end_date,
+            bucket=bucket,
+            by_product=by_product
+        )
+
+        return [SalesSeriesPointDTO.from_row(point) for point in series]
@@ -0,0 +1,29 @@
+from typing import List, Optional
+from src.order.domain.service.order_service import OrderService
+from src.order.application.dto.order_dto import WaiterSalesReportDTO
+from src.shared.domain.value_objects import DateTimeRange
+
+class GetWaiterSalesReportQuery:
+    """Application service for getting sales per waiter"""
+
+    def __init__(self, order_service: OrderService):
+        self._order_service = order_service
+
+    async def execute(self, date_range: DateTimeRange, limit: Optional[int] = None) -> List[WaiterSalesReportDTO]:
+        """
+        Gets the waiter leaderboard for date range
+
+        Args:
+            date_range: Start and end dates for report
+            limit: Maximum number of waiters to return, all if None
+
+        Returns:
+            List of waiters with order count, items sold and revenue, ordered by revenue
+        """
+        report = await self._order_service.get_waiter_sales_report(
+            start_date=date_range.start_date,
+            end_date=date_range.end_date,
+            limit=limit
+        )
+
+        return [WaiterSalesReportDTO.from_row(row) for row in report]
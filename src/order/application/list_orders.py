@@ -0,0 +1,72 @@
+import base64
+import json
+from datetime import datetime
+from typing import AsyncIterator, Optional, Tuple
+from src.order.domain.service.order_service import OrderService
+from src.order.application.dto.order_dto import OrderPageDTO, OrderResponseDTO
+from src.shared.domain.exceptions import ValidationException
+from src.shared.domain.value_objects import DateTimeRange
+
+class ListOrdersQuery:
+    """Application service for listing orders within a date range"""
+
+    def __init__(self, order_service: OrderService):
+        self._order_service = order_service
+
+    async def execute(
+        self,
+        date_range: DateTimeRange,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> OrderPageDTO:
+        """
+        Gets one page of orders using keyset pagination
+
+        Args:
+            date_range: Start and end dates for the listing
+            limit: Maximum number of orders in the page
+            cursor: Opaque cursor returned with the previous page
+
+        Returns:
+            Orders sorted by creation date and the cursor for the next page,
+            which is None on the last page
+        """
+        orders = await self._order_service.get_orders_page_rows(
+            start_date=date_range.start_date,
+            end_date=date_range.end_date,
+            limit=limit + 1,
+            after=self.decode_cursor(cursor) if cursor else None
+        )
+
+        next_cursor = None
+        if len(orders) > limit:
+            orders = orders[:limit]
+            next_cursor = self.encode_cursor(orders[-1]['created_at'], orders[-1]['id'])
+
+        return OrderPageDTO.model_construct(
+            items=[OrderResponseDTO.from_row(order) for order in orders],
+            next_cursor=next_cursor
+        )
+
+    async def stream(self, date_range: DateTimeRange) -> AsyncIterator[OrderResponseDTO]:
+        """Streams every order in the date range without materializing the whole range"""
+        async for order in self._order_service.stream_orders(
+            start_date=date_range.start_date,
+            end_date=date_range.end_date
+        ):
+            yield OrderResponseDTO.from_entity(order)
+
+    @staticmethod
+    def encode_cursor(created_at: datetime, id: int) -> str:
+        """Encodes the (created_at, id) key of an order as an opaque cursor"""
+        raw = json.dumps([created_at.isoformat(), id])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """Decodes a cursor produced by encode_cursor"""
+        try:
+            created_at, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(created_at), int(id)
+        except (ValueError, TypeError):
+            raise ValidationException("Invalid cursor")
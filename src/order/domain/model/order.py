@@ -3,7 +3,9 @@ from typing import List, Optional
 from datetime import datetime, timezone
 from src.shared.domain.exceptions import ValidationException
 from src.shared.domain.value_objects import Money
+from src.shared.domain.slots import slotted
 
+@slotted
 @dataclass(frozen=True)
 class OrderItem:
     """Value object representing an item in an order"""
@@ -21,10 +23,27 @@ class OrderItem:
         if self.unit_price.amount <= 0:
             raise ValidationException("Unit price must be greater than 0")
 
+    @classmethod
+    def from_trusted(
+        cls,
+        product_name: str,
+        unit_price: Money,
+        quantity: int,
+        id: Optional[int] = None
+    ) -> 'OrderItem':
+        """Builds an item without validation, for data that is already valid"""
+        item = object.__new__(cls)
+        object.__setattr__(item, "product_name", product_name)
+        object.__setattr__(item, "unit_price", unit_price)
+        object.__setattr__(item, "quantity", quantity)
+        object.__setattr__(item, "id", id)
+        return item
+
     @property
     def total_price(self) -> Money:
         return self.unit_price * self.quantity
 
+@slotted
 @dataclass
 class Order:
     """Order aggregate root entity"""
@@ -55,26 +74,50 @@ class Order:
             List of combined order items
         """
         combined_items = {}
+        extra_quantities = {}
 
         for item in items:
             if item.product_name in combined_items:
-                # If product exists, create new item with summed quantity
-                existing = combined_items[item.product_name]
-                combined_items[item.product_name] = OrderItem(
-                    id=existing.id,
-                    product_name=existing.product_name,
-                    unit_price=existing.unit_price,
-                    quantity=existing.quantity + item.quantity
+                extra_quantities[item.product_name] = (
+                    extra_quantities.get(item.product_name, 0) + item.quantity
                 )
             else:
-                # If new product, add to dictionary
                 combined_items[item.product_name] = item
 
+        # Rebuild each duplicated product once; its items were already validated
+        for product_name, extra_quantity in extra_quantities.items():
+            existing = combined_items[product_name]
+            combined_items[product_name] = OrderItem.from_trusted(
+                id=existing.id,
+                product_name=existing.product_name,
+                unit_price=existing.unit_price,
+                quantity=existing.quantity + extra_quantity
+            )
+
         return list(combined_items.values())
 
+    @classmethod
+    def from_trusted(
+        cls,
+        customer_name: str,
+        items: List[OrderItem],
+        waiter_id: int,
+        created_at: datetime,
+        id: Optional[int] = None
+    ) -> 'Order':
+        """Builds an order without validation or item combining, e.g. when loading from the database"""
+        order = object.__new__(cls)
+        order.customer_name = customer_name
+        order.items = items
+        order.waiter_id = waiter_id
+        order.created_at = created_at
+        order.id = id
+        return order
+
     @property
     def total_price(self) -> Money:
-        return Money(amount=sum(item.total_price.amount for item in self.items))
+        # Items are validated, so their sum is a positive Decimal
+        return Money.from_trusted(sum(item.total_price.amount for item in self.items))
 
     @staticmethod
     def create(customer_name: str, items: List[OrderItem], waiter_id: int) -> 'Order':
@@ -88,6 +131,6 @@ class Order:
 
     @property
     def total_amount(self) -> Money:
-        return Money(
-            amount=sum(item.total_price.amount for item in self.items)
+        return Money.from_trusted(
+            sum(item.total_price.amount for item in self.items)
         )
@@ -0,0 +1,18 @@
+from datetime import timedelta
+from enum import Enum
+
+class SalesBucket(str, Enum):
+    """Width of the time buckets of a sales series; buckets start on UTC boundaries, weeks on Monday"""
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+
+    @property
+    def width(self) -> timedelta:
+        return _WIDTHS[self]
+
+_WIDTHS = {
+    SalesBucket.HOUR: timedelta(hours=1),
+    SalesBucket.DAY: timedelta(days=1),
+    SalesBucket.WEEK: timedelta(weeks=1),
+}
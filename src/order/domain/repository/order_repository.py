@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple, Iterator, AsyncIterator
 from datetime import datetime
 from src.order.domain.model.order import Order
+from src.order.domain.model.sales_bucket import SalesBucket
 
 class OrderRepository(ABC):
     """Repository interface for Order aggregate"""
@@ -11,6 +12,11 @@ class OrderRepository(ABC):
         """Saves an order"""
         pass
 
+    @abstractmethod
+    def save_many(self, orders: List[Order]) -> List[Order]:
+        """Saves several orders in a single transaction"""
+        pass
+
     @abstractmethod
     def find_by_id(self, id: int) -> Optional[Order]:
         """Finds an order by id"""
@@ -21,11 +27,45 @@ class OrderRepository(ABC):
         """Finds orders within a date range"""
         pass
 
+    @abstractmethod
+    def iter_by_date_range(self, start_date: datetime, end_date: datetime) -> Iterator[Order]:
+        """Iterates over orders within a date range without loading them all at once"""
+        pass
+
+    @abstractmethod
+    def find_page(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Order]:
+        """Finds a page of orders within a date range, after the given (created_at, id) key"""
+        pass
+
+    @abstractmethod
+    def find_page_rows(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """Like find_page, but returns read-only dicts instead of entities"""
+        pass
+
+    @abstractmethod
+    def find_row_by_id(self, id: int) -> Optional[Dict[str, Any]]:
+        """Like find_by_id, but returns a read-only dict instead of an entity"""
+        pass
+
     @abstractmethod
     def get_product_sales_report(
         self,
         start_date: datetime,
-        end_date: datetime
+        end_date: datetime,
+        limit: Optional[int] = None,
+        min_quantity: Optional[int] = None
     ) -> List[dict]:
         """
         Gets product sales report within date range, ordered by quantity sold
@@ -33,8 +73,176 @@ class OrderRepository(ABC):
         Args:
             start_date: Start date for report
             end_date: End date for report
+            limit: Maximum number of products to return, all if None
+            min_quantity: Minimum total quantity of the returned products
 
         Returns:
             List of dicts with product sales data, ordered by quantity desc
         """
         pass
+
+    @abstractmethod
+    def get_approximate_product_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        min_quantity: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Gets the top products within date range from a bounded-size summary
+
+        Args:
+            start_date: Start date for report
+            end_date: End date for report
+            limit: Maximum number of products to return
+            min_quantity: Minimum estimated total quantity of the returned products
+
+        Returns:
+            List of dicts with product sales data and max_error, the bound
+            of the difference between total_quantity and the true quantity
+        """
+        pass
+
+    @abstractmethod
+    def get_waiter_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Gets orders, items sold and revenue per waiter within date range
+
+        Args:
+            start_date: Start date for report
+            end_date: End date for report
+            limit: Maximum number of waiters to return, all if None
+
+        Returns:
+            List of dicts with waiter_id, order_count, items_sold and
+            total_price, ordered by total_price desc
+        """
+        pass
+
+    @abstractmethod
+    def get_sales_series(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        bucket: SalesBucket,
+        by_product: bool = False
+    ) -> List[dict]:
+        """
+        Gets quantity and revenue per time bucket within date range
+
+        Args:
+            start_date: Start date for the series
+            end_date: End date for the series
+            bucket: Width of each bucket
+            by_product: Whether to split each bucket per product
+
+        Returns:
+            List of dicts with bucket_start, product_name (None unless
+            by_product), total_quantity and total_price, ordered by bucket
+            and product; buckets without sales are omitted
+        """
+        pass
+
+class AsyncOrderRepository(ABC):
+    """Asyncio repository interface for Order aggregate"""
+
+    @abstractmethod
+    async def save(self, order: Order) -> Order:
+        """Saves an order"""
+        pass
+
+    @abstractmethod
+    async def save_many(self, orders: List[Order]) -> List[Order]:
+        """Saves several orders in a single transaction"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, id: int) -> Optional[Order]:
+        """Finds an order by id"""
+        pass
+
+    @abstractmethod
+    async def find_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Order]:
+        """Finds orders within a date range"""
+        pass
+
+    @abstractmethod
+    def stream_by_date_range(self, start_date: datetime, end_date: datetime) -> AsyncIterator[Order]:
+        """Streams orders within a date range from a server-side cursor"""
+        pass
+
+    @abstractmethod
+    async def find_page(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Order]:
+        """Finds a page of orders within a date range, after the given (created_at, id) key"""
+        pass
+
+    @abstractmethod
+    async def find_page_rows(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """Like find_page, but returns read-only dicts instead of entities"""
+        pass
+
+    @abstractmethod
+    async def find_row_by_id(self, id: int) -> Optional[Dict[str, Any]]:
+        """Like find_by_id, but returns a read-only dict instead of an entity"""
+        pass
+
+    @abstractmethod
+    async def get_product_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None,
+        min_quantity: Optional[int] = None
+    ) -> List[dict]:
+        """Gets product sales report within date range, ordered by quantity sold"""
+        pass
+
+    @abstractmethod
+    async def get_approximate_product_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        min_quantity: Optional[int] = None
+    ) -> List[dict]:
+        """Gets the top products within date range from a bounded-size summary, with max_error per row"""
+        pass
+
+    @abstractmethod
+    async def get_waiter_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        """Gets orders, items sold and revenue per waiter within date range, ordered by revenue"""
+        pass
+
+    @abstractmethod
+    async def get_sales_series(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        bucket: SalesBucket,
+        by_product: bool = False
+    ) -> List[dict]:
+        """Gets quantity and revenue per time bucket within date range, ordered by bucket"""
+        pass
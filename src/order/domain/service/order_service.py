@@ -1,25 +1,105 @@
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple, AsyncIterator
 from datetime import datetime
 from src.order.domain.model.order import Order
-from src.order.domain.repository.order_repository import OrderRepository
+from src.order.domain.model.sales_bucket import SalesBucket
+from src.order.domain.repository.order_repository import AsyncOrderRepository
 
 class OrderService:
     """Domain service for order-related business operations"""
 
-    def __init__(self, order_repository: OrderRepository):
+    def __init__(self, order_repository: AsyncOrderRepository):
         self._order_repository = order_repository
 
-    def create_order(self, order: Order) -> Order:
+    async def create_order(self, order: Order) -> Order:
         """Creates a new order"""
-        return self._order_repository.save(order)
+        return await self._order_repository.save(order)
 
-    def get_product_sales_report(
+    async def create_orders(self, orders: List[Order]) -> List[Order]:
+        """Creates several orders in a single transaction"""
+        return await self._order_repository.save_many(orders)
+
+    async def get_orders_page(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Order]:
+        """Gets a page of orders within a date range, sorted by (created_at, id)"""
+        return await self._order_repository.find_page(start_date, end_date, limit, after)
+
+    async def get_orders_page_rows(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """Like get_orders_page, but returns read-only dicts for responses"""
+        return await self._order_repository.find_page_rows(start_date, end_date, limit, after)
+
+    async def get_order_row(self, id: int) -> Optional[Dict[str, Any]]:
+        """Gets an order as a read-only dict for responses"""
+        return await self._order_repository.find_row_by_id(id)
+
+    def stream_orders(self, start_date: datetime, end_date: datetime) -> AsyncIterator[Order]:
+        """Streams all orders within a date range, sorted by (created_at, id)"""
+        return self._order_repository.stream_by_date_range(start_date, end_date)
+
+    async def get_product_sales_report(
         self, 
         start_date: datetime, 
-        end_date: datetime
+        end_date: datetime,
+        limit: Optional[int] = None,
+        min_quantity: Optional[int] = None
     ) -> List[dict]:
         """Gets product sales report within a date range"""
-        return self._order_repository.get_product_sales_report(
+        return await self._order_repository.get_product_sales_report(
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            min_quantity=min_quantity
+        )
+
+    async def get_approximate_product_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        min_quantity: Optional[int] = None
+    ) -> List[dict]:
+        """Gets the top products within a date range from the sales sketch, with error bounds"""
+        return await self._order_repository.get_approximate_product_sales_report(
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            min_quantity=min_quantity
+        )
+
+    async def get_waiter_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        """Gets orders, items sold and revenue per waiter within a date range"""
+        return await self._order_repository.get_waiter_sales_report(
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit
+        )
+
+    async def get_sales_series(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        bucket: SalesBucket,
+        by_product: bool = False
+    ) -> List[dict]:
+        """Gets quantity and revenue per time bucket within a date range"""
+        return await self._order_repository.get_sales_series(
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            bucket=bucket,
+            by_product=by_product
         )
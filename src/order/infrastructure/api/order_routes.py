@@ -1,54 +1,135 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from datetime import datetime, timedelta, timezone
-from src.shared.infrastructure.persistence.database import get_db
-from src.shared.infrastructure.api.dependencies import get_current_user
+from src.shared.infrastructure.persistence.database import get_async_db, get_async_session_factory
+from src.shared.infrastructure.api.dependencies import get_authenticated_user, get_current_user
+from src.shared.infrastructure.api.responses import dto_response, json_dumps
 from src.shared.domain.exceptions import ValidationException
 from src.shared.domain.value_objects import DateTimeRange
-from src.order.application.dto.order_dto import CreateOrderDTO, OrderResponseDTO, ProductSalesReportDTO
+from src.order.application.dto.order_dto import (
+    CreateOrderDTO,
+    OrderResponseDTO,
+    ProductSalesReportDTO,
+    ApproximateProductSalesDTO,
+    SalesSeriesPointDTO,
+    WaiterSalesReportDTO,
+    CreateOrderBatchDTO,
+    OrderBatchResponseDTO,
+    OrderPageDTO
+)
 from src.order.application.create_order import CreateOrderCommand
+from src.order.application.create_order_batch import CreateOrderBatchCommand
+from src.order.application.get_order import GetOrderQuery
 from src.order.application.get_sales_report import GetSalesReportQuery
+from src.order.application.get_sales_series import GetSalesSeriesQuery
+from src.order.application.get_waiter_sales_report import GetWaiterSalesReportQuery
+from src.order.application.list_orders import ListOrdersQuery
+from src.order.domain.model.sales_bucket import SalesBucket
 from src.order.domain.service.order_service import OrderService
-from src.order.infrastructure.persistence.postgresql_order_repository import PostgresqlOrderRepository
+from src.order.infrastructure.persistence.async_postgresql_order_repository import AsyncPostgresqlOrderRepository
+from src.order.infrastructure.persistence.cached_order_repository import CachedOrderRepository, snap_to_bucket
 from src.user.domain.service.user_service import UserService
-from src.user.infrastructure.persistence.postgresql_user_repository import PostgresqlUserRepository
-from typing import List
+from src.user.infrastructure.persistence.async_postgresql_user_repository import AsyncPostgresqlUserRepository
+from src.user.infrastructure.persistence.cached_user_repository import CachedUserRepository
+from src.auth.application.dto.auth_dto import AuthenticatedUserDTO
+from typing import List, Union
 from src.shared.infrastructure.logging.logger import get_logger
 
 logger = get_logger("OrderRoutes")
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
-def get_order_service(db: Session = Depends(get_db)) -> OrderService:
-    repository = PostgresqlOrderRepository(db)
+def get_order_service(db: AsyncSession = Depends(get_async_db)) -> OrderService:
+    repository = CachedOrderRepository(AsyncPostgresqlOrderRepository(db))
     return OrderService(repository)
 
 def get_order_command(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> CreateOrderCommand:
-    order_repository = PostgresqlOrderRepository(db)
+    order_repository = CachedOrderRepository(AsyncPostgresqlOrderRepository(db))
     order_service = OrderService(order_repository)
-    user_repository = PostgresqlUserRepository(db)
+    user_repository = CachedUserRepository(AsyncPostgresqlUserRepository(db))
     user_service = UserService(user_repository)
     return CreateOrderCommand(order_service, user_service)
 
 @router.post("/", response_model=OrderResponseDTO, status_code=status.HTTP_201_CREATED)
 async def create_order(
     order_data: CreateOrderDTO,
-    current_user: str = Depends(get_current_user),
+    current_user: AuthenticatedUserDTO = Depends(get_authenticated_user),
     command: CreateOrderCommand = Depends(get_order_command)
 ):
     """Creates a new order"""
     try:
-        return command.execute(order_data, current_user)
+        order = await command.execute(order_data, current_user.email, waiter_id=current_user.id)
+        return dto_response(order, status_code=status.HTTP_201_CREATED)
+    except ValidationException as e:
+        logger.warning("Validation error creating order: {}", e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/", response_model=OrderPageDTO)
+async def list_orders(
+    start_date: datetime = Query(
+        default=None,
+        description="Start date for listing (default: 30 days ago)"
+    ),
+    end_date: datetime = Query(
+        default=None,
+        description="End date for listing (default: now)"
+    ),
+    limit: int = Query(default=100, ge=1, le=1000, description="Page size"),
+    cursor: str = Query(default=None, description="Cursor returned as next_cursor by the previous page"),
+    stream: bool = Query(default=False, description="Stream every order in the range as NDJSON"),
+    current_user: str = Depends(get_current_user),
+    session_factory: async_sessionmaker = Depends(get_async_session_factory),
+    order_service: OrderService = Depends(get_order_service)
+):
+    """Lists orders in a date range, paginated by cursor or streamed as NDJSON"""
+
+    if start_date is None:
+        start_date = datetime.now(timezone.utc) - timedelta(days=30)
+    if end_date is None:
+        end_date = datetime.now(timezone.utc)
+
+    date_range = DateTimeRange(
+        start_date=start_date,
+        end_date=end_date
+    )
+
+    if stream:
+        async def ndjson():
+            # The stream runs after the request's dependencies are closed, so it opens its own session
+            async with session_factory() as db:
+                query = ListOrdersQuery(get_order_service(db))
+                async for order in query.stream(date_range):
+                    yield json_dumps(order) + b"\n"
+
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    query = ListOrdersQuery(order_service)
+
+    try:
+        return dto_response(await query.execute(date_range, limit=limit, cursor=cursor))
     except ValidationException as e:
-        logger.error(f"Validation error: {str(e)}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
 
-@router.get("/report", response_model=List[ProductSalesReportDTO])
+@router.post("/batch", response_model=OrderBatchResponseDTO)
+async def create_orders_batch(
+    batch: CreateOrderBatchDTO,
+    current_user: AuthenticatedUserDTO = Depends(get_authenticated_user),
+    order_service: OrderService = Depends(get_order_service)
+):
+    """Creates many orders in a single transaction, reporting success or failure per order"""
+    command = CreateOrderBatchCommand(order_service)
+    return dto_response(await command.execute(batch, waiter_id=current_user.id))
+
+@router.get("/report", response_model=Union[List[ApproximateProductSalesDTO], List[ProductSalesReportDTO]])
 async def get_sales_report(
     start_date: datetime = Query(
         default=None,
@@ -58,14 +139,22 @@ async def get_sales_report(
         default=None,
         description="End date for report (default: now)"
     ),
+    limit: int = Query(default=None, ge=1, le=1000, description="Return only the top products"),
+    min_quantity: int = Query(default=None, ge=1, description="Return only products with at least this quantity"),
+    approximate: bool = Query(
+        default=False,
+        description="Estimate the top products from the monthly sales sketch; requires limit, adds max_error"
+    ),
     order_service: OrderService = Depends(get_order_service)
 ):
-    """Gets product sales report filtered by date range"""
+    """Gets product sales report filtered by date range, optionally only the top products"""
 
+    # Defaults snap to the report cache buckets; no order is newer than now, so the result is the same
+    now = datetime.now(timezone.utc)
     if start_date is None:
-        start_date = datetime.now(timezone.utc) - timedelta(days=30)
+        start_date = snap_to_bucket(now - timedelta(days=30))
     if end_date is None:
-        end_date = datetime.now(timezone.utc)
+        end_date = snap_to_bucket(now, up=True)
 
     date_range = DateTimeRange(
         start_date=start_date,
@@ -73,4 +162,86 @@ async def get_sales_report(
     )
 
     query = GetSalesReportQuery(order_service)
-    return query.execute(date_range)
+    try:
+        return dto_response(await query.execute(date_range, limit, min_quantity, approximate))
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/report/series", response_model=List[SalesSeriesPointDTO])
+async def get_sales_series(
+    start_date: datetime = Query(
+        default=None,
+        description="Start date for the series (default: 7 days ago)"
+    ),
+    end_date: datetime = Query(
+        default=None,
+        description="End date for the series (default: now)"
+    ),
+    bucket: SalesBucket = Query(default=SalesBucket.HOUR, description="Bucket width, in UTC"),
+    by_product: bool = Query(default=False, description="Split each bucket per product"),
+    order_service: OrderService = Depends(get_order_service)
+):
+    """Gets quantity and revenue per hour, day or week, optionally per product"""
+
+    if start_date is None:
+        start_date = datetime.now(timezone.utc) - timedelta(days=7)
+    if end_date is None:
+        end_date = datetime.now(timezone.utc)
+
+    date_range = DateTimeRange(
+        start_date=start_date,
+        end_date=end_date
+    )
+
+    query = GetSalesSeriesQuery(order_service)
+    try:
+        return dto_response(await query.execute(date_range, bucket, by_product))
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/report/waiters", response_model=List[WaiterSalesReportDTO])
+async def get_waiter_sales_report(
+    start_date: datetime = Query(
+        default=None,
+        description="Start date for report (default: start of the current UTC day)"
+    ),
+    end_date: datetime = Query(
+        default=None,
+        description="End date for report (default: now)"
+    ),
+    limit: int = Query(default=None, ge=1, le=1000, description="Return only the top waiters"),
+    order_service: OrderService = Depends(get_order_service)
+):
+    """Gets orders, items sold and revenue per waiter, ordered by revenue"""
+
+    # Defaults snap to the report cache buckets; no order is newer than now, so the result is the same
+    now = datetime.now(timezone.utc)
+    if start_date is None:
+        start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if end_date is None:
+        end_date = snap_to_bucket(now, up=True)
+
+    date_range = DateTimeRange(
+        start_date=start_date,
+        end_date=end_date
+    )
+
+    query = GetWaiterSalesReportQuery(order_service)
+    return dto_response(await query.execute(date_range, limit))
+
+# Declared last so /{order_id} does not shadow the /report routes
+@router.get("/{order_id}", response_model=OrderResponseDTO)
+async def get_order(
+    order_id: int,
+    current_user: str = Depends(get_current_user),
+    order_service: OrderService = Depends(get_order_service)
+):
+    """Gets an order with its items"""
+    query = GetOrderQuery(order_service)
+    return dto_response(await query.execute(order_id))
@@ -0,0 +1,123 @@
+from typing import Any, Dict, Optional, List, Tuple, AsyncIterator
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.order.domain.model.order import Order
+from src.order.domain.model.sales_bucket import SalesBucket
+from src.order.domain.repository.order_repository import AsyncOrderRepository
+from src.order.infrastructure.persistence.postgresql_order_repository import PostgresqlOrderRepository
+from src.shared.infrastructure.config.settings import get_settings
+
+settings = get_settings()
+
+class AsyncPostgresqlOrderRepository(AsyncOrderRepository):
+    """
+    Asyncio implementation of OrderRepository
+
+    Runs the queries of PostgresqlOrderRepository through AsyncSession.run_sync,
+    so the I/O goes through the asyncio driver without duplicating the queries.
+    """
+
+    def __init__(self, session: AsyncSession, batch_size: Optional[int] = None):
+        self._session = session
+        self._batch_size = batch_size or settings.ORDER_FETCH_BATCH_SIZE
+
+    async def save(self, order: Order) -> Order:
+        return await self._session.run_sync(
+            lambda session: PostgresqlOrderRepository(session).save(order)
+        )
+
+    async def save_many(self, orders: List[Order]) -> List[Order]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlOrderRepository(session).save_many(orders)
+        )
+
+    async def find_by_id(self, id: int) -> Optional[Order]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlOrderRepository(session).find_by_id(id)
+        )
+
+    async def find_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Order]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlOrderRepository(session, self._batch_size).find_by_date_range(start_date, end_date)
+        )
+
+    async def stream_by_date_range(self, start_date: datetime, end_date: datetime) -> AsyncIterator[Order]:
+        result = await self._session.stream_scalars(
+            PostgresqlOrderRepository.date_range_query(start_date, end_date, self._batch_size)
+        )
+        async for order_model in result:
+            yield PostgresqlOrderRepository.order_model_to_entity(order_model)
+
+    async def find_page(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Order]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlOrderRepository(session).find_page(start_date, end_date, limit, after)
+        )
+
+    async def find_page_rows(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlOrderRepository(session).find_page_rows(start_date, end_date, limit, after)
+        )
+
+    async def find_row_by_id(self, id: int) -> Optional[Dict[str, Any]]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlOrderRepository(session).find_row_by_id(id)
+        )
+
+    async def get_product_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None,
+        min_quantity: Optional[int] = None
+    ) -> List[dict]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlOrderRepository(session).get_product_sales_report(
+                start_date, end_date, limit, min_quantity
+            )
+        )
+
+    async def get_approximate_product_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        min_quantity: Optional[int] = None
+    ) -> List[dict]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlOrderRepository(session).get_approximate_product_sales_report(
+                start_date, end_date, limit, min_quantity
+            )
+        )
+
+    async def get_waiter_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlOrderRepository(session).get_waiter_sales_report(start_date, end_date, limit)
+        )
+
+    async def get_sales_series(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        bucket: SalesBucket,
+        by_product: bool = False
+    ) -> List[dict]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlOrderRepository(session).get_sales_series(start_date, end_date, bucket, by_product)
+        )
@@ -0,0 +1,177 @@
+from typing import Any, Dict, Optional, List, Tuple, AsyncIterator
+from datetime import datetime, timezone
+from src.order.domain.model.order import Order
+from src.order.domain.model.sales_bucket import SalesBucket
+from src.order.domain.repository.order_repository import AsyncOrderRepository
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
+from src.shared.infrastructure.config.settings import get_settings
+
+settings = get_settings()
+
+# Process-wide cache of sales reports; keys start with the normalized (start, end) window
+report_cache = TTLCache(
+    maxsize=settings.REPORT_CACHE_MAX_SIZE,
+    ttl=settings.REPORT_CACHE_TTL_SECONDS
+)
+
+def snap_to_bucket(value: datetime, up: bool = False, bucket_seconds: Optional[int] = None) -> datetime:
+    """
+    Rounds value down (or up) to a REPORT_CACHE_BUCKET_SECONDS boundary, in aware UTC
+
+    The report routes snap their default windows with it, so clients polling
+    "the last 30 days" share cache entries; explicit ranges are kept as sent.
+    """
+    bucket_seconds = bucket_seconds or settings.REPORT_CACHE_BUCKET_SECONDS
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    timestamp = value.timestamp()
+    timestamp += -timestamp % bucket_seconds if up else -(timestamp % bucket_seconds)
+    return datetime.fromtimestamp(timestamp, timezone.utc)
+
+class CachedOrderRepository(AsyncOrderRepository):
+    """
+    Caching decorator for AsyncOrderRepository sales reports
+
+    Only windows whose bounds fall on REPORT_CACHE_BUCKET_SECONDS boundaries
+    are cached (the routes snap their default windows to them); any other
+    range goes to the repository uncached with its exact bounds, so caching
+    never changes a result. Saving an order evicts every cached window
+    containing its created_at. Invalidation is per process; other workers
+    serve their entry until its TTL expires.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncOrderRepository,
+        cache: TTLCache = report_cache,
+        bucket_seconds: Optional[int] = None
+    ):
+        self._repository = repository
+        self._cache = cache
+        self._bucket_seconds = bucket_seconds or settings.REPORT_CACHE_BUCKET_SECONDS
+
+    async def save(self, order: Order) -> Order:
+        saved_order = await self._repository.save(order)
+        self._invalidate([saved_order])
+        return saved_order
+
+    async def save_many(self, orders: List[Order]) -> List[Order]:
+        saved_orders = await self._repository.save_many(orders)
+        self._invalidate(saved_orders)
+        return saved_orders
+
+    async def find_by_id(self, id: int) -> Optional[Order]:
+        return await self._repository.find_by_id(id)
+
+    async def find_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Order]:
+        return await self._repository.find_by_date_range(start_date, end_date)
+
+    def stream_by_date_range(self, start_date: datetime, end_date: datetime) -> AsyncIterator[Order]:
+        return self._repository.stream_by_date_range(start_date, end_date)
+
+    async def find_page(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Order]:
+        return await self._repository.find_page(start_date, end_date, limit, after)
+
+    async def find_page_rows(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        return await self._repository.find_page_rows(start_date, end_date, limit, after)
+
+    async def find_row_by_id(self, id: int) -> Optional[Dict[str, Any]]:
+        return await self._repository.find_row_by_id(id)
+
+    async def get_product_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None,
+        min_quantity: Optional[int] = None
+    ) -> List[dict]:
+        window = self._cache_window(start_date, end_date)
+        if window is None:
+            return await self._repository.get_product_sales_report(start_date, end_date, limit, min_quantity)
+        start, end = window
+        key = (start, end, limit, min_quantity)
+        report = self._cache.get(key)
+        if report is None:
+            report = await self._repository.get_product_sales_report(start, end, limit, min_quantity)
+            self._cache.set(key, report)
+        return [dict(row) for row in report]
+
+    async def get_approximate_product_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        min_quantity: Optional[int] = None
+    ) -> List[dict]:
+        # Not cached: it reads a bounded number of sketch rows whatever the range
+        return await self._repository.get_approximate_product_sales_report(
+            start_date, end_date, limit, min_quantity
+        )
+
+    async def get_waiter_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        window = self._cache_window(start_date, end_date)
+        if window is None:
+            return await self._repository.get_waiter_sales_report(start_date, end_date, limit)
+        start, end = window
+        key = (start, end, "waiters", limit)
+        report = self._cache.get(key)
+        if report is None:
+            report = await self._repository.get_waiter_sales_report(start, end, limit)
+            self._cache.set(key, report)
+        return [dict(row) for row in report]
+
+    async def get_sales_series(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        bucket: SalesBucket,
+        by_product: bool = False
+    ) -> List[dict]:
+        # Not cached: series are requested with arbitrary bounds and bucket widths
+        return await self._repository.get_sales_series(start_date, end_date, bucket, by_product)
+
+    def _cache_window(self, start_date: datetime, end_date: datetime) -> Optional[Tuple[datetime, datetime]]:
+        """The window in naive UTC if both bounds are on bucket boundaries, otherwise None (not cached)"""
+        start = self._to_timestamp(start_date)
+        end = self._to_timestamp(end_date)
+        if start % self._bucket_seconds or end % self._bucket_seconds:
+            return None
+        return (
+            datetime.fromtimestamp(start, timezone.utc).replace(tzinfo=None),
+            datetime.fromtimestamp(end, timezone.utc).replace(tzinfo=None)
+        )
+
+    def _invalidate(self, orders: List[Order]) -> None:
+        """Evicts cached windows that contain any of the orders"""
+        created = [
+            datetime.fromtimestamp(self._to_timestamp(o.created_at), timezone.utc).replace(tzinfo=None)
+            for o in orders
+        ]
+        for key in self._cache.keys():
+            start, end = key[:2]
+            if any(start <= c <= end for c in created):
+                self._cache.delete(key)
+
+    @staticmethod
+    def _to_timestamp(value: datetime) -> float:
+        """Seconds since epoch; naive datetimes are UTC, as stored in the orders table"""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
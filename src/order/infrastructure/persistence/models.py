@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Numeric, Index
 from sqlalchemy.orm import relationship
 from src.shared.infrastructure.persistence.database import Base
 
@@ -13,14 +13,82 @@ class OrderModel(Base):
 
     items = relationship("OrderItemModel", back_populates="order", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_orders_created_at_id", "created_at", "id"),
+    )
+
+class ProductModel(Base):
+    """SQLAlchemy model for the products dimension; order items and rollups reference its id"""
+    __tablename__ = "products"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
+
 class OrderItemModel(Base):
     """SQLAlchemy model for OrderItem value object"""
     __tablename__ = "order_items"
 
     id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, ForeignKey("orders.id"), nullable=False)
-    product_name = Column(String, nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
     unit_price = Column(Numeric(10, 2), nullable=False)
     quantity = Column(Integer, nullable=False)
+    # Copy of orders.created_at: date filters on items need no join and prune partitioned tables
+    created_at = Column(DateTime, nullable=False)
 
     order = relationship("OrderModel", back_populates="items")
+    # Joined into every items query, so loading items never costs an extra query for names
+    product = relationship("ProductModel", lazy="joined", innerjoin=True)
+
+    __table_args__ = (
+        # Covering index for the report join; migrations 004 and 008 use a composite fallback on SQLite
+        Index(
+            "ix_order_items_order_id_covering",
+            "order_id",
+            postgresql_include=["product_id", "quantity", "unit_price"]
+        ),
+        # Covering index for the date-filtered report over items; composite on SQLite (migration 009)
+        Index(
+            "ix_order_items_created_at",
+            "created_at",
+            postgresql_include=["product_id", "quantity", "unit_price"]
+        ),
+    )
+
+class ProductSalesDailyModel(Base):
+    """SQLAlchemy model for the daily product sales rollup"""
+    __tablename__ = "product_sales_daily"
+
+    product_id = Column(Integer, ForeignKey("products.id"), primary_key=True)
+    day = Column(Date, primary_key=True, index=True)
+    total_quantity = Column(Integer, nullable=False, default=0)
+    total_price = Column(Numeric(14, 2), nullable=False, default=0)
+
+class ProductSalesSketchModel(Base):
+    """SQLAlchemy model for one counter of the monthly top products sketch"""
+    __tablename__ = "product_sales_sketch"
+
+    month = Column(Date, primary_key=True)
+    product_id = Column(Integer, ForeignKey("products.id"), primary_key=True)
+    total_quantity = Column(Integer, nullable=False)
+    total_price = Column(Numeric(14, 2), nullable=False)
+
+class ProductSalesSketchMonthModel(Base):
+    """SQLAlchemy model for the per-month state of the top products sketch"""
+    __tablename__ = "product_sales_sketch_months"
+
+    month = Column(Date, primary_key=True)
+    # Upper bound of the quantity of any product without a counter this month
+    floor_quantity = Column(Integer, nullable=False, default=0)
+    # Last rebuild from the daily rollup; the month is only read from the sketch once rebuilt after it ended
+    refreshed_at = Column(DateTime, nullable=True)
+
+class WaiterSalesDailyModel(Base):
+    """SQLAlchemy model for the daily per-waiter sales rollup"""
+    __tablename__ = "waiter_sales_daily"
+
+    waiter_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    day = Column(Date, primary_key=True, index=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    items_sold = Column(Integer, nullable=False, default=0)
+    total_price = Column(Numeric(14, 2), nullable=False, default=0)
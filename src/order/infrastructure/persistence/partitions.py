@@ -0,0 +1,86 @@
+from datetime import date, datetime
+from typing import Dict, List, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# Tables range-partitioned by month on created_at (migration 009, ORDERS_PARTITIONING)
+PARTITIONED_TABLES = ("orders", "order_items")
+
+# Advisory lock serializing partition creation between concurrent deploys or cron runs
+_PARTITIONS_LOCK_KEY = 90_090
+
+def month_start(value: datetime) -> date:
+    return date(value.year, value.month, 1)
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(table: str, month: date) -> str:
+    """Name of the partition of table holding the rows of month, e.g. orders_y2026m10"""
+    return f"{table}_y{month.year}m{month.month:02d}"
+
+def default_partition_name(table: str) -> str:
+    """Partition catching rows of months without their own partition"""
+    return f"{table}_default"
+
+def month_partitions(table: str, first_month: date, last_month: date) -> List[Tuple[str, date, date]]:
+    """(name, from, to) of the monthly partitions of table from first_month to last_month, both included"""
+    partitions = []
+    month = month_start(first_month)
+    while month <= last_month:
+        next_month = add_months(month, 1)
+        partitions.append((partition_name(table, month), month, next_month))
+        month = next_month
+    return partitions
+
+def is_partitioned(connection: Connection, table: str) -> bool:
+    """Whether table is a partitioned table; always False outside PostgreSQL"""
+    if connection.dialect.name != "postgresql":
+        return False
+    return connection.scalar(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = :table AND pg_table_is_visible(c.oid))"
+        ),
+        {"table": table}
+    )
+
+def ensure_monthly_partitions(connection: Connection, first_month: date, last_month: date) -> List[str]:
+    """
+    Creates the missing monthly partitions of orders and order_items between two months
+
+    Does nothing unless the tables are partitioned. Returns the names of
+    the created partitions. A month whose rows already landed in the
+    default partition cannot get its own partition until they are moved.
+    """
+    if not all(is_partitioned(connection, table) for table in PARTITIONED_TABLES):
+        return []
+
+    connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _PARTITIONS_LOCK_KEY})
+    existing = set(connection.scalars(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname IN ('orders', 'order_items')"
+    )))
+
+    created = []
+    for table in PARTITIONED_TABLES:
+        for name, start, end in month_partitions(table, first_month, last_month):
+            if name in existing:
+                continue
+            connection.execute(text(
+                f"CREATE TABLE {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+            created.append(name)
+    return created
+
+def default_partition_rows(connection: Connection) -> Dict[str, int]:
+    """Rows stored in the default partition of each partitioned table"""
+    return {
+        table: connection.scalar(text(f"SELECT COUNT(*) FROM {default_partition_name(table)}"))
+        for table in PARTITIONED_TABLES
+        if is_partitioned(connection, table)
+    }
@@ -1,101 +1,1005 @@
-from typing import Optional, List
-from datetime import datetime
-from sqlalchemy import func, desc
-from sqlalchemy.orm import Session
+from typing import Any, Callable, Optional, List, Dict, Set, Tuple, Iterator
+from datetime import datetime, date, time, timedelta, timezone
+from decimal import Decimal
+from sqlalchemy import Integer, cast, func, desc, delete, insert, literal_column, select, union_all, and_, or_
+from sqlalchemy.sql import Select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, joinedload, selectinload
 from src.order.domain.model.order import Order, OrderItem
+from src.order.domain.model.sales_bucket import SalesBucket
 from src.order.domain.repository.order_repository import OrderRepository
-from src.order.infrastructure.persistence.models import OrderModel, OrderItemModel
+from src.order.infrastructure.persistence.models import (
+    OrderModel,
+    OrderItemModel,
+    ProductModel,
+    ProductSalesDailyModel,
+    ProductSalesSketchModel,
+    ProductSalesSketchMonthModel,
+    WaiterSalesDailyModel
+)
 from src.shared.domain.value_objects import Money
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
+from src.shared.infrastructure.config.settings import get_settings
+
+settings = get_settings()
+
+# Process-wide map of product name to id; ids never change, entries are added once committed
+product_cache = TTLCache(
+    maxsize=settings.PRODUCT_CACHE_MAX_SIZE,
+    ttl=settings.PRODUCT_CACHE_TTL_SECONDS
+)
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT upserts
+_UPSERT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
 
 class PostgresqlOrderRepository(OrderRepository):
     """PostgreSQL implementation of OrderRepository"""
 
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        batch_size: Optional[int] = None,
+        sketch_capacity: Optional[int] = None,
+        product_cache: TTLCache = product_cache
+    ):
         self._session = session
+        self._product_cache = product_cache
+        # Rows fetched per round trip when loading order ranges; items are
+        # eager loaded once per batch, so a range costs 1 + rows/batch_size queries
+        self._batch_size = batch_size or settings.ORDER_FETCH_BATCH_SIZE
+        # Counters kept per month by the top products sketch
+        self._sketch_capacity = sketch_capacity or settings.SALES_SKETCH_CAPACITY
 
     def save(self, order: Order) -> Order:
-        order_model = OrderModel(
-            customer_name=order.customer_name,
-            waiter_id=order.waiter_id,
-            created_at=order.created_at,
-            items=[
-                OrderItemModel(
-                    product_name=item.product_name,
-                    unit_price=item.unit_price.amount,
-                    quantity=item.quantity
-                )
+        """
+        Saves an order
+
+        Generated ids come back through INSERT ... RETURNING and the saved
+        order is built from the in-memory data, so there is no refresh or
+        lazy load of the items after the commit.
+        """
+        return self.save_many([order])[0]
+
+    def save_many(self, orders: List[Order]) -> List[Order]:
+        """
+        Saves several orders in a single transaction
+
+        Orders and items are written with one multi-row INSERT ... RETURNING
+        each, instead of one add/commit/refresh cycle per order. SQLite cannot
+        batch the ordered RETURNING for orders and falls back to one INSERT
+        per order, still inside the same transaction. created_at is bound as
+        naive UTC, since the columns are TIMESTAMP WITHOUT TIME ZONE and
+        asyncpg rejects aware datetimes for them.
+        """
+        if not orders:
+            return []
+
+        product_ids, new_product_ids = self._product_ids(
+            {item.product_name for order in orders for item in order.items}
+        )
+
+        order_ids = self._session.scalars(
+            insert(OrderModel).returning(OrderModel.id, sort_by_parameter_order=True),
+            [
+                {
+                    'customer_name': order.customer_name,
+                    'waiter_id': order.waiter_id,
+                    'created_at': self._to_utc_naive(order.created_at)
+                }
+                for order in orders
+            ]
+        ).all()
+
+        # Items are unique per (order, product) once combined, so their ids can be
+        # matched without asking the database to keep the parameter order
+        item_rows = self._session.execute(
+            insert(OrderItemModel).returning(
+                OrderItemModel.id,
+                OrderItemModel.order_id,
+                OrderItemModel.product_id
+            ),
+            [
+                {
+                    'order_id': order_id,
+                    'product_id': product_ids[item.product_name],
+                    'unit_price': item.unit_price.amount,
+                    'quantity': item.quantity,
+                    'created_at': self._to_utc_naive(order.created_at)
+                }
+                for order_id, order in zip(order_ids, orders)
                 for item in order.items
             ]
-        )
+        ).all()
+        item_ids = {(r.order_id, r.product_id): r.id for r in item_rows}
 
-        self._session.add(order_model)
+        self._update_daily_sales(orders, product_ids)
+        self._update_waiter_sales(orders)
         self._session.commit()
-        self._session.refresh(order_model)
 
-        return self._order_model_to_entity(order_model)
+        for name, product_id in new_product_ids.items():
+            self._product_cache.set(name, product_id)
+
+        return [
+            Order.from_trusted(
+                id=order_id,
+                customer_name=order.customer_name,
+                waiter_id=order.waiter_id,
+                created_at=order.created_at,
+                items=[
+                    OrderItem.from_trusted(
+                        id=item_ids[(order_id, product_ids[item.product_name])],
+                        product_name=item.product_name,
+                        unit_price=item.unit_price,
+                        quantity=item.quantity
+                    )
+                    for item in order.items
+                ]
+            )
+            for order_id, order in zip(order_ids, orders)
+        ]
 
     def find_by_id(self, id: int) -> Optional[Order]:
-        order_model = self._session.query(OrderModel).filter(
-            OrderModel.id == id
-        ).first()
-        return self._order_model_to_entity(order_model) if order_model else None
+        order_model = self._session.execute(
+            select(OrderModel)
+            .options(joinedload(OrderModel.items))
+            .where(OrderModel.id == id)
+        ).unique().scalar_one_or_none()
+        return self.order_model_to_entity(order_model) if order_model else None
 
     def find_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Order]:
-        order_models = self._session.query(OrderModel).filter(
-            OrderModel.created_at.between(start_date, end_date)
+        return list(self.iter_by_date_range(start_date, end_date))
+
+    def iter_by_date_range(self, start_date: datetime, end_date: datetime) -> Iterator[Order]:
+        """Yields orders within a date range, fetching batch_size rows at a time"""
+        order_models = self._session.scalars(
+            self.date_range_query(start_date, end_date, self._batch_size)
+        )
+        for order_model in order_models:
+            yield self.order_model_to_entity(order_model)
+
+    def find_page(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Order]:
+        """
+        Finds a page of orders within a date range using keyset pagination
+
+        Args:
+            start_date: Start date for filtering orders
+            end_date: End date for filtering orders
+            limit: Maximum number of orders to return
+            after: (created_at, id) of the last order of the previous page
+
+        Returns:
+            Orders sorted by (created_at, id)
+        """
+        query = self._page_query(
+            select(OrderModel).options(self._items_in_range(start_date, end_date)),
+            start_date, end_date, limit, after
+        )
+        return [self.order_model_to_entity(om) for om in self._session.scalars(query)]
+
+    def find_page_rows(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Projection of find_page for read-only callers
+
+        Selects plain columns with two Core queries (orders, then their
+        items) and returns dicts shaped like OrderResponseDTO, skipping ORM
+        instrumentation, the identity map and domain entities.
+        """
+        query = self._page_query(
+            select(*self._order_columns()), start_date, end_date, limit, after
+        )
+        return self._order_rows_to_dicts(self._session.execute(query).all())
+
+    def find_row_by_id(self, id: int) -> Optional[Dict[str, Any]]:
+        """Projection of find_by_id, see find_page_rows; a single order needs only one join"""
+        joined_rows = self._session.execute(
+            select(*self._order_columns(), *self._item_columns())
+            .outerjoin(OrderItemModel, OrderItemModel.order_id == OrderModel.id)
+            .outerjoin(ProductModel, ProductModel.id == OrderItemModel.product_id)
+            .where(OrderModel.id == id)
+            .order_by(OrderItemModel.id)
         ).all()
-        return [self._order_model_to_entity(om) for om in order_models]
+        if not joined_rows:
+            return None
+        items = [self._item_row_to_dict(r) for r in joined_rows if r.product_name is not None]
+        return self._order_row_to_dict(joined_rows[0], items)
+
+    def _page_query(
+        self,
+        query: Select,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]]
+    ) -> Select:
+        """Adds the date range, keyset condition, ordering and limit of a page to query"""
+        start_date = self._to_utc_naive(start_date)
+        end_date = self._to_utc_naive(end_date)
+        query = query.where(OrderModel.created_at.between(start_date, end_date))
+        if after is not None:
+            after_created_at, after_id = after
+            after_created_at = self._to_utc_naive(after_created_at)
+            query = query.where(
+                or_(
+                    OrderModel.created_at > after_created_at,
+                    and_(OrderModel.created_at == after_created_at, OrderModel.id > after_id)
+                )
+            )
+        return query.order_by(OrderModel.created_at, OrderModel.id).limit(limit)
+
+    @staticmethod
+    def _order_columns() -> tuple:
+        return (
+            OrderModel.id,
+            OrderModel.customer_name,
+            OrderModel.waiter_id,
+            OrderModel.created_at
+        )
 
-    def get_product_sales_report(self, start_date: datetime, end_date: datetime) -> List[dict]:
+    @staticmethod
+    def _item_columns() -> tuple:
+        return (
+            ProductModel.name.label('product_name'),
+            OrderItemModel.unit_price,
+            OrderItemModel.quantity
+        )
+
+    def _order_rows_to_dicts(self, order_rows) -> List[Dict[str, Any]]:
+        """Loads the items of the given order rows in one query and builds the response dicts"""
+        if not order_rows:
+            return []
+
+        items_by_order: Dict[int, List[dict]] = {}
+        item_rows = self._session.execute(
+            select(OrderItemModel.order_id, *self._item_columns())
+            .join(OrderItemModel.product)
+            .where(
+                OrderItemModel.order_id.in_([r.id for r in order_rows]),
+                # Redundant for the result; limits partitioned order_items to the page's months
+                OrderItemModel.created_at.between(
+                    min(r.created_at for r in order_rows),
+                    max(r.created_at for r in order_rows)
+                )
+            )
+            .order_by(OrderItemModel.order_id, OrderItemModel.id)
+        )
+        for r in item_rows:
+            items_by_order.setdefault(r.order_id, []).append(self._item_row_to_dict(r))
+
+        return [self._order_row_to_dict(r, items_by_order.get(r.id, [])) for r in order_rows]
+
+    @staticmethod
+    def _item_row_to_dict(row) -> Dict[str, Any]:
+        return {
+            'product_name': row.product_name,
+            'unit_price': row.unit_price,
+            'quantity': row.quantity
+        }
+
+    @staticmethod
+    def _order_row_to_dict(row, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            'id': row.id,
+            'customer_name': row.customer_name,
+            'items': items,
+            'total_price': sum((i['unit_price'] * i['quantity'] for i in items), Decimal(0)),
+            'waiter_id': row.waiter_id,
+            'created_at': row.created_at
+        }
+
+    @staticmethod
+    def date_range_query(start_date: datetime, end_date: datetime, batch_size: int) -> Select:
+        """Builds the streaming query for orders within a date range, with items eager loaded per batch"""
+        start_date = PostgresqlOrderRepository._to_utc_naive(start_date)
+        end_date = PostgresqlOrderRepository._to_utc_naive(end_date)
+        return (
+            select(OrderModel)
+            .options(PostgresqlOrderRepository._items_in_range(start_date, end_date))
+            .where(OrderModel.created_at.between(start_date, end_date))
+            .order_by(OrderModel.created_at, OrderModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+    @staticmethod
+    def _items_in_range(start_date: datetime, end_date: datetime):
+        """
+        Eager load of the items of orders filtered to a date range
+
+        Items share their order's created_at, so the extra criteria drops
+        nothing but lets partitioned order_items skip the other months.
+        """
+        return selectinload(
+            OrderModel.items.and_(
+                OrderItemModel.created_at.between(
+                    PostgresqlOrderRepository._to_utc_naive(start_date),
+                    PostgresqlOrderRepository._to_utc_naive(end_date)
+                )
+            )
+        )
+
+    def get_product_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None,
+        min_quantity: Optional[int] = None
+    ) -> List[dict]:
         """
         Gets product sales report from database ordered by total quantity sold
 
+        Whole days inside the range are read from the product_sales_daily
+        rollup; only the partial days at the edges are aggregated from
+        order_items, so the cost grows with products x days instead of
+        with the number of items sold. The parts are combined, filtered,
+        ranked and cut in one statement, so only the returned rows leave
+        the database. Rows are grouped on product ids and names are joined
+        at the end.
+
         Args:
             start_date: Start date for filtering orders
             end_date: End date for filtering orders
+            limit: Maximum number of products to return
+            min_quantity: Minimum total quantity of the returned products
 
         Returns:
             List of dictionaries containing sales data per product
         """
-        results = (
-            self._session.query(
-                OrderItemModel.product_name,
+        sales = self._sales_subquery(
+            self._sales_parts(self._to_utc_naive(start_date), self._to_utc_naive(end_date))
+        )
+        total_quantity = func.sum(sales.c.total_quantity)
+        totals = (
+            select(
+                sales.c.product_id,
+                total_quantity.label('total_quantity'),
+                func.sum(sales.c.total_price).label('total_price')
+            )
+            .group_by(sales.c.product_id)
+        )
+        if min_quantity is not None:
+            totals = totals.having(total_quantity >= min_quantity)
+        totals = totals.subquery()
+
+        # Names are joined once per product, after grouping on the integer key
+        query = (
+            select(
+                ProductModel.name.label('product_name'),
+                totals.c.total_quantity,
+                totals.c.total_price
+            )
+            .join_from(totals, ProductModel, ProductModel.id == totals.c.product_id)
+            .order_by(totals.c.total_quantity.desc(), ProductModel.name)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [self._sales_row_to_dict(r) for r in self._session.execute(query)]
+
+    def get_approximate_product_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        min_quantity: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Gets the top products of a date range from the monthly sketch
+
+        Whole months inside the range are read from product_sales_sketch,
+        which keeps at most sketch_capacity counters per month, so their
+        cost does not grow with the catalog or the number of orders; the
+        partial months at the edges, and whole months the sketch job has
+        not rebuilt since they ended, are aggregated exactly. Counters hold
+        exact monthly totals, so each row's max_error, a bound of the
+        difference between total_quantity and the true quantity sold, is the
+        sum of the floors of the sketched months in which the product holds
+        no counter; it is 0 for products kept in all of them. total_price
+        misses the revenue of those months, so it is a lower bound.
+
+        Args:
+            start_date: Start date for filtering orders
+            end_date: End date for filtering orders
+            limit: Maximum number of products to return
+            min_quantity: Minimum estimated total quantity of the returned products
+
+        Returns:
+            List of dictionaries with sales data and max_error per product,
+            ordered by estimated quantity
+        """
+        start_date = self._to_utc_naive(start_date)
+        end_date = self._to_utc_naive(end_date)
+
+        first_full_month = self._month_start(start_date)
+        if datetime.combine(first_full_month, time.min) < start_date:
+            first_full_month = self._next_month(first_full_month)
+        last_full_month_end = self._month_start(end_date)
+
+        if first_full_month >= last_full_month_end:
+            return self.get_product_sales_report(start_date, end_date, limit, min_quantity)
+
+        # Only months rebuilt after they ended are final; the others are aggregated exactly
+        floors = {
+            r.month: r.floor_quantity
+            for r in self._session.execute(
+                select(
+                    ProductSalesSketchMonthModel.month,
+                    ProductSalesSketchMonthModel.floor_quantity,
+                    ProductSalesSketchMonthModel.refreshed_at
+                )
+                .where(
+                    ProductSalesSketchMonthModel.month >= first_full_month,
+                    ProductSalesSketchMonthModel.month < last_full_month_end
+                )
+            )
+            if r.refreshed_at is not None
+            and r.refreshed_at >= datetime.combine(self._next_month(r.month), time.min)
+        }
+        floor_total = sum(floors.values())
+
+        # Sums per product of the counters and the floors of the months they cover
+        sketch = ProductSalesSketchModel
+        months = ProductSalesSketchMonthModel
+        totals: Dict[int, dict] = {}
+        sketch_rows = self._session.execute(
+            select(
+                sketch.product_id,
+                ProductModel.name.label('product_name'),
+                func.sum(sketch.total_quantity).label('total_quantity'),
+                func.sum(sketch.total_price).label('total_price'),
+                func.sum(months.floor_quantity).label('covered_floor')
+            )
+            .join(months, months.month == sketch.month)
+            .join(ProductModel, ProductModel.id == sketch.product_id)
+            .where(sketch.month.in_(list(floors)))
+            .group_by(sketch.product_id, ProductModel.name)
+        )
+        for r in sketch_rows:
+            totals[r.product_id] = {
+                'product_name': r.product_name,
+                'total_quantity': int(r.total_quantity),
+                'total_price': Decimal(r.total_price),
+                'max_error': floor_total - int(r.covered_floor)
+            }
+
+        exact_parts = []
+        if start_date < datetime.combine(first_full_month, time.min):
+            exact_parts += self._sales_parts(
+                start_date, datetime.combine(first_full_month, time.min), include_end=False
+            )
+        month = first_full_month
+        while month < last_full_month_end:
+            if month not in floors:
+                exact_parts += self._sales_parts(
+                    datetime.combine(month, time.min),
+                    datetime.combine(self._next_month(month), time.min),
+                    include_end=False
+                )
+            month = self._next_month(month)
+        exact_parts += self._sales_parts(datetime.combine(last_full_month_end, time.min), end_date)
+        exact_sales = self._sales_subquery(exact_parts)
+        edge_rows = self._session.execute(
+            select(
+                exact_sales.c.product_id,
+                ProductModel.name.label('product_name'),
+                func.sum(exact_sales.c.total_quantity).label('total_quantity'),
+                func.sum(exact_sales.c.total_price).label('total_price')
+            )
+            .join_from(exact_sales, ProductModel, ProductModel.id == exact_sales.c.product_id)
+            .group_by(exact_sales.c.product_id, ProductModel.name)
+        )
+        for r in edge_rows:
+            entry = totals.get(r.product_id)
+            if entry is None:
+                totals[r.product_id] = {**self._sales_row_to_dict(r), 'max_error': floor_total}
+            else:
+                entry['total_quantity'] += int(r.total_quantity)
+                entry['total_price'] += Decimal(r.total_price)
+
+        report = sorted(totals.values(), key=lambda r: (-r['total_quantity'], r['product_name']))
+        if min_quantity is not None:
+            report = [r for r in report if r['total_quantity'] >= min_quantity]
+        return report[:limit]
+
+    def get_waiter_sales_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Gets orders, items sold and revenue per waiter, ordered by revenue
+
+        Like get_product_sales_report, whole days are read from the
+        waiter_sales_daily rollup and only the partial days at the edges
+        are aggregated from orders and order_items, in one statement.
+
+        Args:
+            start_date: Start date for filtering orders
+            end_date: End date for filtering orders
+            limit: Maximum number of waiters to return
+
+        Returns:
+            List of dictionaries containing sales data per waiter
+        """
+        sales = self._sales_subquery(self._range_parts(
+            self._to_utc_naive(start_date),
+            self._to_utc_naive(end_date),
+            True,
+            self.live_waiter_sales_query,
+            self.daily_waiter_sales_query
+        ))
+        query = (
+            select(
+                sales.c.waiter_id,
+                func.sum(sales.c.order_count).label('order_count'),
+                func.sum(sales.c.items_sold).label('items_sold'),
+                func.sum(sales.c.total_price).label('total_price')
+            )
+            .group_by(sales.c.waiter_id)
+            .order_by(desc('total_price'), sales.c.waiter_id)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [
+            {
+                'waiter_id': r.waiter_id,
+                'order_count': int(r.order_count),
+                'items_sold': int(r.items_sold),
+                'total_price': Decimal(r.total_price)
+            }
+            for r in self._session.execute(query)
+        ]
+
+    def get_sales_series(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        bucket: SalesBucket,
+        by_product: bool = False
+    ) -> List[dict]:
+        """
+        Gets quantity and revenue per time bucket with a single GROUP BY over order_items
+
+        Buckets are computed in the database with date_trunc, or strftime on
+        SQLite, so any number of buckets costs one scan of the range instead
+        of one report query per bucket.
+        """
+        query = self.sales_series_query(
+            self._session.get_bind().dialect.name,
+            self._to_utc_naive(start_date),
+            self._to_utc_naive(end_date),
+            bucket,
+            by_product
+        )
+        return [
+            {
+                'bucket_start': self._to_datetime(r.bucket_start),
+                'product_name': r.product_name if by_product else None,
+                'total_quantity': int(r.total_quantity),
+                'total_price': Decimal(r.total_price)
+            }
+            for r in self._session.execute(query)
+        ]
+
+    @staticmethod
+    def sales_series_query(
+        dialect_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        bucket: SalesBucket,
+        by_product: bool = False
+    ) -> Select:
+        """
+        Builds the per-bucket (and optionally per-product) aggregation over order_items in a date range
+
+        Filters and buckets on the items' own created_at, so orders is not
+        joined and partitioned tables are pruned to the months of the range.
+        """
+        bucket_start = PostgresqlOrderRepository._bucket_start(dialect_name, bucket).label('bucket_start')
+        group_by = [bucket_start]
+        columns = [bucket_start]
+        order_by = [bucket_start]
+        if by_product:
+            group_by += [OrderItemModel.product_id, ProductModel.name]
+            columns.append(ProductModel.name.label('product_name'))
+            order_by.append(ProductModel.name)
+        query = (
+            select(
+                *columns,
                 func.sum(OrderItemModel.quantity).label('total_quantity'),
                 func.sum(
                     OrderItemModel.quantity * OrderItemModel.unit_price
                 ).label('total_price')
             )
-            .join(OrderModel)
-            .filter(
-                OrderModel.created_at >= start_date,
-                OrderModel.created_at <= end_date
-            )
-            .group_by(OrderItemModel.product_name)
-            .order_by(desc('total_quantity'))
-            .all()
+            .select_from(OrderItemModel)
+        )
+        if by_product:
+            query = query.join(OrderItemModel.product)
+        return (
+            query
+            .where(OrderItemModel.created_at.between(start_date, end_date))
+            .group_by(*group_by)
+            .order_by(*order_by)
         )
 
-        return [
+    @staticmethod
+    def _bucket_start(dialect_name: str, bucket: SalesBucket):
+        """SQL expression truncating order_items.created_at to the start of its bucket"""
+        created_at = OrderItemModel.created_at
+        if dialect_name != "sqlite":
+            # Inlined so SELECT and GROUP BY render the same expression with server-side binds
+            return func.date_trunc(literal_column(f"'{bucket.value}'"), created_at)
+        if bucket is SalesBucket.HOUR:
+            return func.strftime('%Y-%m-%d %H:00:00', created_at)
+        if bucket is SalesBucket.DAY:
+            return func.strftime('%Y-%m-%d 00:00:00', created_at)
+        # Back to Monday, like date_trunc('week'); %w counts days from Sunday
+        days_since_monday = (cast(func.strftime('%w', created_at), Integer) + 6) % 7
+        return func.strftime('%Y-%m-%d 00:00:00', created_at, func.printf('-%d days', days_since_monday))
+
+    @staticmethod
+    def _to_datetime(value) -> datetime:
+        """SQLite returns bucket starts as text"""
+        return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+    def _product_ids(self, names: Set[str]) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Maps product names to ids, creating missing products in the current transaction
+
+        Known names are answered by the process-wide cache; the rest are
+        upserted in one statement that returns the ids of new and existing
+        rows alike. Returns every id and, separately, those read from the
+        database, which the caller caches once committed, so a rolled back
+        insert never leaves a dangling id in the cache.
+        """
+        product_ids: Dict[str, int] = {}
+        missing = []
+        for name in names:
+            product_id = self._product_cache.get(name)
+            if product_id is None:
+                missing.append(name)
+            else:
+                product_ids[name] = product_id
+        if not missing:
+            return product_ids, {}
+
+        upsert_insert = _UPSERT_INSERTS[self._session.get_bind().dialect.name]
+        table = ProductModel.__table__
+        # Sorted so concurrent writers lock existing names in the same order
+        statement = upsert_insert(table).values([{'name': name} for name in sorted(missing)])
+        # DO UPDATE rather than DO NOTHING, which would not return the rows that already exist
+        rows = self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[table.c.name],
+                set_={'name': statement.excluded.name}
+            ).returning(table.c.id, table.c.name)
+        )
+        new_product_ids = {r.name: r.id for r in rows}
+        product_ids.update(new_product_ids)
+        return product_ids, new_product_ids
+
+    def _update_daily_sales(self, orders: List[Order], product_ids: Dict[str, int]) -> None:
+        """Adds the orders' items to the daily product sales rollup in the current transaction"""
+        # A single upsert cannot touch the same row twice, so aggregate per (product, day) first
+        totals: Dict[Tuple[int, date], list] = {}
+        for order in orders:
+            day = self._to_utc_naive(order.created_at).date()
+            for item in order.items:
+                entry = totals.setdefault((product_ids[item.product_name], day), [0, Decimal(0)])
+                entry[0] += item.quantity
+                entry[1] += item.total_price.amount
+
+        upsert_insert = _UPSERT_INSERTS[self._session.get_bind().dialect.name]
+        table = ProductSalesDailyModel.__table__
+
+        statement = upsert_insert(table).values([
             {
-                'product_name': r.product_name,
-                'total_quantity': r.total_quantity,
-                'total_price': r.total_price
+                'product_id': product_id,
+                'day': day,
+                'total_quantity': quantity,
+                'total_price': price
             }
-            for r in results
-        ]
+            # Sorted, so concurrent writers lock the rollup rows in the same order and cannot deadlock
+            for (product_id, day), (quantity, price) in sorted(totals.items())
+        ])
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.product_id, table.c.day],
+            set_={
+                'total_quantity': table.c.total_quantity + statement.excluded.total_quantity,
+                'total_price': table.c.total_price + statement.excluded.total_price
+            }
+        )
+        self._session.execute(statement)
+
+    def _update_waiter_sales(self, orders: List[Order]) -> None:
+        """Adds the orders to the daily per-waiter sales rollup in the current transaction"""
+        totals: Dict[Tuple[int, date], list] = {}
+        for order in orders:
+            day = self._to_utc_naive(order.created_at).date()
+            entry = totals.setdefault((order.waiter_id, day), [0, 0, Decimal(0)])
+            entry[0] += 1
+            entry[1] += sum(item.quantity for item in order.items)
+            entry[2] += order.total_price.amount
+
+        upsert_insert = _UPSERT_INSERTS[self._session.get_bind().dialect.name]
+        table = WaiterSalesDailyModel.__table__
+
+        statement = upsert_insert(table).values([
+            {
+                'waiter_id': waiter_id,
+                'day': day,
+                'order_count': order_count,
+                'items_sold': items_sold,
+                'total_price': price
+            }
+            # Sorted, so concurrent writers lock the rollup rows in the same order and cannot deadlock
+            for (waiter_id, day), (order_count, items_sold, price) in sorted(totals.items())
+        ])
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.waiter_id, table.c.day],
+            set_={
+                'order_count': table.c.order_count + statement.excluded.order_count,
+                'items_sold': table.c.items_sold + statement.excluded.items_sold,
+                'total_price': table.c.total_price + statement.excluded.total_price
+            }
+        )
+        self._session.execute(statement)
+
+    def refresh_sales_sketch(self, now: Optional[datetime] = None) -> List[date]:
+        """
+        Rebuilds the monthly top products sketch of the ended months from product_sales_daily
+
+        Runs as a periodic job (scripts/db.py refresh-sales-sketch) instead
+        of on every save, so order writes never contend on the sketch. Each
+        month not rebuilt since it ended keeps the exact totals of its
+        sketch_capacity best sellers and, as floor, the quantity of the
+        first product left out. Months are committed one at a time.
+
+        Returns:
+            The months rebuilt
+        """
+        now = self._to_utc_naive(now or datetime.now(timezone.utc))
+        current_month = self._month_start(now)
+        daily = ProductSalesDailyModel
+        months = ProductSalesSketchMonthModel.__table__
+
+        first_day = self._session.scalar(select(func.min(daily.day)).where(daily.day < current_month))
+        if first_day is None:
+            return []
+        refreshed = dict(self._session.execute(select(months.c.month, months.c.refreshed_at)).all())
+
+        rebuilt = []
+        month = self._month_start(first_day)
+        while month < current_month:
+            next_month = self._next_month(month)
+            refreshed_at = refreshed.get(month)
+            if refreshed_at is None or refreshed_at < datetime.combine(next_month, time.min):
+                self._rebuild_sales_sketch_month(month, next_month, now)
+                self._session.commit()
+                rebuilt.append(month)
+            month = next_month
+        return rebuilt
+
+    def _rebuild_sales_sketch_month(self, month: date, next_month: date, now: datetime) -> None:
+        """Replaces the sketch counters and floor of month with the top products of its rollup rows"""
+        daily = ProductSalesDailyModel
+        months = ProductSalesSketchMonthModel.__table__
+        counters = ProductSalesSketchModel.__table__
+
+        total_quantity = func.sum(daily.total_quantity)
+        rows = self._session.execute(
+            select(daily.product_id, total_quantity.label('total_quantity'),
+                   func.sum(daily.total_price).label('total_price'))
+            .where(daily.day >= month, daily.day < next_month)
+            .group_by(daily.product_id)
+            .order_by(desc(total_quantity), daily.product_id)
+            .limit(self._sketch_capacity + 1)
+        ).all()
+        kept = rows[:self._sketch_capacity]
+        floor = int(rows[self._sketch_capacity].total_quantity) if len(rows) > self._sketch_capacity else 0
+
+        self._session.execute(delete(counters).where(counters.c.month == month))
+        self._session.execute(delete(months).where(months.c.month == month))
+        self._session.execute(
+            insert(months).values(month=month, floor_quantity=floor, refreshed_at=now)
+        )
+        if kept:
+            self._session.execute(insert(counters), [
+                {
+                    'month': month,
+                    'product_id': r.product_id,
+                    'total_quantity': int(r.total_quantity),
+                    'total_price': r.total_price
+                }
+                for r in kept
+            ])
+
+    def _sales_parts(self, start_date: datetime, end_date: datetime, include_end: bool = True) -> List[Select]:
+        """Per-product aggregations covering [start_date, end_date] or [start_date, end_date)"""
+        return self._range_parts(
+            start_date, end_date, include_end, self.live_sales_query, self.daily_sales_query
+        )
+
+    @staticmethod
+    def _range_parts(
+        start_date: datetime,
+        end_date: datetime,
+        include_end: bool,
+        live_query: Callable[[datetime, datetime, bool], Select],
+        daily_query: Callable[[date, date], Select]
+    ) -> List[Select]:
+        """
+        Aggregations covering [start_date, end_date] or [start_date, end_date)
+
+        Whole days come from daily_query over a rollup and partial days
+        from live_query over the orders.
+        """
+        first_full_day = datetime.combine(start_date.date(), time.min)
+        if first_full_day < start_date:
+            first_full_day += timedelta(days=1)
+        last_full_day_end = datetime.combine(end_date.date(), time.min)
+
+        if first_full_day >= last_full_day_end:
+            return [live_query(start_date, end_date, include_end)]
+
+        parts = []
+        if start_date < first_full_day:
+            parts.append(live_query(start_date, first_full_day, False))
+        parts.append(daily_query(first_full_day.date(), last_full_day_end.date()))
+        if include_end or last_full_day_end < end_date:
+            parts.append(live_query(last_full_day_end, end_date, include_end))
+        return parts
+
+    @staticmethod
+    def _sales_subquery(parts: List[Select]):
+        """Combines per-product aggregations into one subquery, to be aggregated again"""
+        return (union_all(*parts) if len(parts) > 1 else parts[0]).subquery()
+
+    @staticmethod
+    def daily_sales_query(start_day: date, end_day: date) -> Select:
+        """Builds the per-product aggregation of the rollup rows for the days in [start_day, end_day)"""
+        return (
+            select(
+                ProductSalesDailyModel.product_id,
+                func.sum(ProductSalesDailyModel.total_quantity).label('total_quantity'),
+                func.sum(ProductSalesDailyModel.total_price).label('total_price')
+            )
+            .where(
+                ProductSalesDailyModel.day >= start_day,
+                ProductSalesDailyModel.day < end_day
+            )
+            .group_by(ProductSalesDailyModel.product_id)
+        )
+
+    @staticmethod
+    def live_sales_query(start_date: datetime, end_date: datetime, include_end: bool = True) -> Select:
+        """Builds the per-product aggregation over the order_items of a date range, without joining orders"""
+        end_filter = (
+            OrderItemModel.created_at <= end_date
+            if include_end
+            else OrderItemModel.created_at < end_date
+        )
+        return (
+            select(
+                OrderItemModel.product_id,
+                func.sum(OrderItemModel.quantity).label('total_quantity'),
+                func.sum(
+                    OrderItemModel.quantity * OrderItemModel.unit_price
+                ).label('total_price')
+            )
+            .where(
+                OrderItemModel.created_at >= start_date,
+                end_filter
+            )
+            .group_by(OrderItemModel.product_id)
+        )
+
+    @staticmethod
+    def daily_waiter_sales_query(start_day: date, end_day: date) -> Select:
+        """Builds the per-waiter aggregation of the rollup rows for the days in [start_day, end_day)"""
+        return (
+            select(
+                WaiterSalesDailyModel.waiter_id,
+                func.sum(WaiterSalesDailyModel.order_count).label('order_count'),
+                func.sum(WaiterSalesDailyModel.items_sold).label('items_sold'),
+                func.sum(WaiterSalesDailyModel.total_price).label('total_price')
+            )
+            .where(
+                WaiterSalesDailyModel.day >= start_day,
+                WaiterSalesDailyModel.day < end_day
+            )
+            .group_by(WaiterSalesDailyModel.waiter_id)
+        )
+
+    @staticmethod
+    def live_waiter_sales_query(start_date: datetime, end_date: datetime, include_end: bool = True) -> Select:
+        """
+        Builds the per-waiter aggregation over orders joined to order_items in a date range
+
+        The range is applied to both tables (and the join matches created_at)
+        so each side is pruned to the months of the range when partitioned.
+        """
+        end_filters = (
+            [OrderModel.created_at <= end_date, OrderItemModel.created_at <= end_date]
+            if include_end
+            else [OrderModel.created_at < end_date, OrderItemModel.created_at < end_date]
+        )
+        return (
+            select(
+                OrderModel.waiter_id,
+                func.count(OrderModel.id.distinct()).label('order_count'),
+                func.sum(OrderItemModel.quantity).label('items_sold'),
+                func.sum(
+                    OrderItemModel.quantity * OrderItemModel.unit_price
+                ).label('total_price')
+            )
+            .join(
+                OrderItemModel,
+                and_(
+                    OrderItemModel.order_id == OrderModel.id,
+                    OrderItemModel.created_at == OrderModel.created_at
+                )
+            )
+            .where(
+                OrderModel.created_at >= start_date,
+                OrderItemModel.created_at >= start_date,
+                *end_filters
+            )
+            .group_by(OrderModel.waiter_id)
+        )
+
+    @staticmethod
+    def _sales_row_to_dict(row) -> Dict[str, Any]:
+        return {
+            'product_name': row.product_name,
+            'total_quantity': int(row.total_quantity),
+            'total_price': Decimal(row.total_price)
+        }
+
+    @staticmethod
+    def _month_start(value: datetime) -> date:
+        return date(value.year, value.month, 1)
+
+    @staticmethod
+    def _next_month(month: date) -> date:
+        return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+    @staticmethod
+    def _to_utc_naive(value: datetime) -> datetime:
+        """Normalizes datetimes to naive UTC, as stored in the orders table"""
+        if value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
 
-    def _order_model_to_entity(self, order_model: OrderModel) -> Order:
+    @staticmethod
+    def order_model_to_entity(order_model: OrderModel) -> Order:
         """Converts OrderModel to Order domain entity"""
-        return Order(
+        return Order.from_trusted(
             id=order_model.id,
             customer_name=order_model.customer_name,
             waiter_id=order_model.waiter_id,
             created_at=order_model.created_at,
             items=[
-                OrderItem(
+                OrderItem.from_trusted(
                     id=item.id,
-                    product_name=item.product_name,
-                    unit_price=Money(amount=item.unit_price),
+                    product_name=item.product.name,
+                    unit_price=Money.from_trusted(item.unit_price),
                     quantity=item.quantity
                 )
                 for item in order_model.items
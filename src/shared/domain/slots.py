@@ -0,0 +1,17 @@
+from dataclasses import fields
+
+def slotted(cls):
+    """
+    Rebuilds a dataclass with __slots__, like dataclass(slots=True) on Python 3.10+
+
+    Must be applied on top of @dataclass. Field defaults keep working because
+    the generated __init__ already holds them.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel
 from datetime import datetime
 from dataclasses import dataclass
 from src.shared.domain.exceptions import ValidationException
@@ -33,25 +33,67 @@ class Email:
     def __json__(self):
         return str(self)
 
-class Money(BaseModel):
-    amount: Decimal = Field(..., gt=0)
-    currency: str = "MXN"
+class Money:
+    """
+    Immutable, slotted monetary amount backed by Decimal
 
-    @field_validator('amount', mode='before')
-    def validate_amount(cls, v):
+    Amounts are converted like the API input (str, int and float via str)
+    and must be finite and greater than 0. Arithmetic between valid values
+    skips re-validation, and from_trusted builds instances from values that
+    are already Decimal and positive, such as rows read from the database.
+    """
+    __slots__ = ("amount", "currency")
+
+    amount: Decimal
+    currency: str
+
+    def __init__(self, amount, currency: str = "MXN"):
+        if type(amount) is not Decimal:
+            amount = self._to_decimal(amount)
+        if not amount.is_finite() or amount <= 0:
+            raise ValueError("Amount must be greater than 0")
+        object.__setattr__(self, "amount", amount)
+        object.__setattr__(self, "currency", currency)
+
+    @classmethod
+    def from_trusted(cls, amount: Decimal, currency: str = "MXN") -> 'Money':
+        """Builds a Money without validation; amount must be a positive Decimal"""
+        money = object.__new__(cls)
+        object.__setattr__(money, "amount", amount)
+        object.__setattr__(money, "currency", currency)
+        return money
+
+    @staticmethod
+    def _to_decimal(v) -> Decimal:
         try:
-            if isinstance(v, str):
-                v = Decimal(v)
-            elif isinstance(v, float):
-                v = Decimal(str(v))
-            elif isinstance(v, int):
-                v = Decimal(str(v))
-            elif not isinstance(v, Decimal):
-                v = Decimal(str(v))
-            return v
-        except Exception as e:
+            if isinstance(v, (float, int)) and not isinstance(v, bool):
+                return Decimal(str(v))
+            if isinstance(v, (str, Decimal)):
+                return Decimal(v)
+            return Decimal(str(v))
+        except Exception:
             raise ValueError(f"Invalid amount format: {v} ({type(v)})")
 
+    def __setattr__(self, name, value):
+        raise AttributeError("Money is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Money is immutable")
+
+    def __reduce__(self):
+        return (Money, (self.amount, self.currency))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.amount == other.amount and self.currency == other.currency
+
+    def __hash__(self) -> int:
+        return hash((self.amount, self.currency))
+
+    def __repr__(self) -> str:
+        return f"Money(amount={self.amount!r}, currency={self.currency!r})"
+
     def __str__(self) -> str:
         return f"{self.amount:.2f}"
 
@@ -60,13 +102,9 @@ class Money(BaseModel):
             raise TypeError("Can only add Money to Money")
         if self.currency != other.currency:
             raise ValueError("Cannot add different currencies")
-        return Money(amount=self.amount + other.amount, currency=self.currency)
+        return Money.from_trusted(self.amount + other.amount, self.currency)
 
     def __mul__(self, quantity: int) -> 'Money':
+        if type(quantity) is int and quantity > 0:
+            return Money.from_trusted(self.amount * quantity, self.currency)
         return Money(amount=self.amount * quantity, currency=self.currency)
-
-    model_config = {
-        "json_encoders": {
-            Decimal: str
-        }
-    }
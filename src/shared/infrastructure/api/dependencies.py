@@ -1,10 +1,16 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from src.shared.infrastructure.persistence.database import get_db
-from src.user.infrastructure.persistence.postgresql_user_repository import PostgresqlUserRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.shared.infrastructure.persistence.database import get_async_db
+from src.user.infrastructure.persistence.async_postgresql_user_repository import AsyncPostgresqlUserRepository
+from src.user.infrastructure.persistence.cached_user_repository import CachedUserRepository
 from src.user.domain.service.user_service import UserService
+from src.auth.application.dto.auth_dto import AuthenticatedUserDTO
 from src.auth.infrastructure.jwt_service import JWTService
+from src.auth.infrastructure.revocation_list import revocation_list
+from src.shared.infrastructure.config.settings import get_settings
+
+settings = get_settings()
 
 # Configure HTTPBearer to return 401 instead of 403
 security = HTTPBearer(
@@ -12,48 +18,60 @@ security = HTTPBearer(
     description="JWT token required"
 )
 
-def get_user_service(db: Session = Depends(get_db)) -> UserService:
+def get_user_service(db: AsyncSession = Depends(get_async_db)) -> UserService:
     """Gets UserService instance"""
-    repository = PostgresqlUserRepository(db)
+    repository = CachedUserRepository(AsyncPostgresqlUserRepository(db))
     return UserService(repository)
 
-async def get_current_user(
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+async def get_authenticated_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     user_service: UserService = Depends(get_user_service)
-) -> str:
-    """Gets the current authenticated user"""
+) -> AuthenticatedUserDTO:
+    """
+    Gets the authenticated user, resolved once per request
+
+    By default the user is looked up to confirm it exists and the token was
+    not revoked. With AUTH_STATELESS the verified claims are trusted for the
+    token lifetime and revocation is checked against the in-memory
+    revocation list, so no query is made except its periodic refresh.
+    """
     if not credentials:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _unauthorized("Not authenticated")
 
     try:
         payload = JWTService.verify_token(credentials.credentials)
-        email = payload.get("sub")
-        user_id = payload.get("user_id")
-        
-        if not email or not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        user = user_service.get_user_by_email(email)
-
-        if not user or user.id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        return email
     except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _unauthorized("Could not validate credentials")
+
+    email = payload.get("sub")
+    user_id = payload.get("user_id")
+    token_version = payload.get("ver", 0)
+    if not email or not user_id:
+        raise _unauthorized("Could not validate credentials")
+
+    if settings.AUTH_STATELESS:
+        await revocation_list.refresh_if_stale(user_service.get_token_versions)
+        if revocation_list.is_revoked(user_id, token_version):
+            raise _unauthorized("Token has been revoked")
+        return AuthenticatedUserDTO(id=user_id, email=email)
+
+    user = await user_service.get_user_by_email(email)
+    if not user or user.id != user_id:
+        raise _unauthorized("User not found")
+    if token_version < user.token_version:
+        raise _unauthorized("Token has been revoked")
+
+    return AuthenticatedUserDTO(id=user.id, email=user.email)
+
+async def get_current_user(
+    user: AuthenticatedUserDTO = Depends(get_authenticated_user)
+) -> str:
+    """Gets the current authenticated user"""
+    return user.email
@@ -0,0 +1,56 @@
+import time
+from typing import Callable, Dict
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.shared.infrastructure.metrics.instrumentation import end_request, record_request, start_request
+
+# Route label of requests that matched no route, so unknown paths don't create new series
+UNMATCHED_ROUTE = "unmatched"
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status code and database work per route
+
+    Requests are labelled with the route template rather than the raw path,
+    so path parameters don't create new series. SQL statements, DB time and pool waits run in
+    the request's context are collected through instrument_engine and the
+    instrumented pools.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._routes: Dict[Callable, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats, token = start_request()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            end_request(token)
+            record_request(scope["method"], self._route(scope), status_code, elapsed, stats)
+
+    def _route(self, scope: Scope) -> str:
+        # The router stores the matched endpoint in the scope
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        route = self._routes.get(endpoint)
+        if route is None:
+            for candidate in scope["app"].routes:
+                if getattr(candidate, "endpoint", None) is not None:
+                    self._routes.setdefault(candidate.endpoint, candidate.path)
+            route = self._routes.get(endpoint, UNMATCHED_ROUTE)
+        return route
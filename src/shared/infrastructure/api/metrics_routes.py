@@ -0,0 +1,9 @@
+from fastapi import APIRouter, Response
+from src.shared.infrastructure.metrics.registry import registry
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Metrics in the Prometheus text format"""
+    return Response(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,48 @@
+from decimal import Decimal
+from typing import Any, List, Union
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+def _default(value: Any) -> Any:
+    """Serializes the types orjson does not handle natively"""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def json_dumps(content: Any) -> bytes:
+    """
+    Serializes content to JSON bytes with orjson
+
+    Decimals become strings and UTC datetimes end in "Z", matching the
+    output of Pydantic's JSON mode.
+    """
+    return orjson.dumps(
+        content,
+        default=_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    )
+
+class FastJSONResponse(ORJSONResponse):
+    """App-wide JSON response rendered with orjson, with Decimal support"""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+def dto_response(
+    content: Union[BaseModel, List[BaseModel]],
+    status_code: int = 200
+) -> FastJSONResponse:
+    """
+    Returns already validated DTOs as a response
+
+    FastAPI does not re-validate a returned Response against the route's
+    response_model, which stays in place for the OpenAPI schema.
+    """
+    if isinstance(content, list):
+        payload = [dto.model_dump() for dto in content]
+    else:
+        payload = content.model_dump()
+    return FastJSONResponse(content=payload, status_code=status_code)
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 class Settings(BaseSettings):
     APP_NAME: str = "Backend Home Challenge API"
@@ -9,12 +10,57 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = "your-secret-key-for-testing"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    JWT_CACHE_MAX_SIZE: int = 4096      # Tokens verificados en caché (hasta su expiración)
+
+    # Autenticación sin estado: confía en los claims del token sin consultar la tabla users
+    AUTH_STATELESS: bool = False
+    AUTH_REVOCATION_REFRESH_SECONDS: int = 30   # Cada cuánto se recarga la lista de revocación
 
     # Configuración del pool de conexiones
     DB_POOL_SIZE: int = 5        # Tamaño del pool (conexiones iniciales)
     DB_MAX_OVERFLOW: int = 10           # Conexiones adicionales permitidas cuando el pool está lleno
     DB_POOL_TIMEOUT: int = 30           # Tiempo máximo de espera para obtener una conexión (en segundos)
     DB_POOL_RECYCLE: int = 1800         # Tiempo para reciclar conexiones (en segundos, 30 minutos)
+    DB_POOL_PRE_PING: bool = True       # Valida cada conexión con un ping al sacarla del pool (un round trip extra)
+    DB_POOL_USE_LIFO: bool = False      # Reutiliza la última conexión devuelta; las ociosas expiran con DB_POOL_RECYCLE
+    DB_POOL_WAIT_WARNING_SECONDS: float = 0.1   # Espera por una conexión a partir de la cual se registra un warning
+    # Conexiones disponibles para toda la aplicación (max_connections de PostgreSQL menos reservas).
+    # Si se define, el pool de cada worker se reduce para que WEB_CONCURRENCY workers no lo superen
+    DB_MAX_CONNECTIONS: Optional[int] = None
+    WEB_CONCURRENCY: int = 1            # Procesos worker de uvicorn
+
+    # Métricas Prometheus en /metrics (latencia por ruta, SQL por request, pool y cachés)
+    METRICS_ENABLED: bool = True
+
+    # Logs en archivos: JSON escrito en lotes por un hilo en segundo plano
+    LOG_QUEUE_SIZE: int = 10000             # Registros en espera antes de aplicar LOG_OVERFLOW_POLICY
+    LOG_BATCH_SIZE: int = 256               # Registros escritos por lote
+    LOG_FLUSH_INTERVAL_SECONDS: float = 0.5 # Espera máxima antes de escribir un lote incompleto
+    LOG_OVERFLOW_POLICY: str = "drop"       # "drop" descarta con la cola llena, "block" espera hasta 1 s
+    LOG_DIAGNOSE: Optional[bool] = None     # Valores de variables en tracebacks; por defecto igual a DEBUG
+
+    # Órdenes leídas por lote al consultar rangos de fechas
+    ORDER_FETCH_BATCH_SIZE: int = 500
+
+    # Caché en memoria de usuarios autenticados
+    USER_CACHE_MAX_SIZE: int = 1024     # Número máximo de entradas (por email y por id)
+    USER_CACHE_TTL_SECONDS: int = 60    # Tiempo de vida de cada entrada (en segundos)
+
+    # Caché en memoria del reporte de ventas
+    REPORT_CACHE_MAX_SIZE: int = 128        # Número máximo de rangos en caché
+    REPORT_CACHE_TTL_SECONDS: int = 30      # Tiempo de vida de cada resultado (en segundos)
+    REPORT_CACHE_BUCKET_SECONDS: int = 60   # Solo se cachean rangos alineados a esta granularidad
+
+    # Caché en memoria de ids de productos por nombre (los ids no cambian)
+    PRODUCT_CACHE_MAX_SIZE: int = 10000     # Número máximo de productos en caché
+    PRODUCT_CACHE_TTL_SECONDS: int = 3600   # Tiempo de vida de cada entrada (en segundos)
+
+    # Productos con contador por mes en el sketch del reporte aproximado (approximate=true)
+    SALES_SKETCH_CAPACITY: int = 200
+
+    # Particiones mensuales de orders y order_items (solo PostgreSQL, las crea la migración 009)
+    ORDERS_PARTITIONING: bool = False
+    ORDER_PARTITIONS_AHEAD_MONTHS: int = 3  # Meses futuros con partición creada de antemano
 
     class Config:
         env_file = ".env"
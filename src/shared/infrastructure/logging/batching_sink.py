@@ -0,0 +1,156 @@
+import json
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+# Marks the end of the queue when the sink stops
+_STOP = object()
+
+class BatchingSink:
+    """
+    File-like loguru sink that writes JSON lines from a background thread
+
+    write() only puts a few fields of the record on a bounded queue, so the
+    request path never serializes records or touches the disk. A worker
+    thread, started on first use, drains the queue in batches of up to
+    batch_size or every flush_interval seconds. When the queue is full the
+    record is dropped (overflow="drop") or the caller waits up to
+    block_timeout seconds for room before dropping it (overflow="block").
+    The file is rotated when it reaches max_bytes, keeping backup_count files.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_queue_size: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        overflow: str = "drop",
+        block_timeout: float = 1.0,
+        max_bytes: int = 500 * 1024 * 1024,
+        backup_count: int = 10
+    ):
+        if overflow not in ("drop", "block"):
+            raise ValueError("overflow must be 'drop' or 'block'")
+        self._path = Path(path)
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._overflow = overflow
+        self._block_timeout = block_timeout
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        self._written = 0
+        self._dropped = 0
+
+    def write(self, message) -> None:
+        """Called by loguru for each record; message is the formatted exception, if any"""
+        record = message.record
+        entry = (
+            record["time"],
+            record["level"].name,
+            record["extra"].get("name", record["name"]),
+            record["function"],
+            record["line"],
+            record["message"],
+            str(message).rstrip("\n") or None
+        )
+        self._ensure_worker()
+        try:
+            if self._overflow == "block":
+                self._queue.put(entry, timeout=self._block_timeout)
+            else:
+                self._queue.put_nowait(entry)
+        except queue.Full:
+            self._dropped += 1
+
+    def flush(self) -> None:
+        """Called by loguru after every write; the worker flushes per batch instead"""
+
+    def stop(self) -> None:
+        """Writes the queued records and stops the worker"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    @property
+    def name(self) -> str:
+        return self._path.name
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self._written,
+            "dropped": self._dropped
+        }
+
+    def _ensure_worker(self) -> None:
+        # Started lazily and again after a fork, where threads are not inherited
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, daemon=True, name=f"log-writer-{self._path.name}")
+                self._thread.start()
+
+    def _run(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        stream = open(self._path, "a", encoding="utf8")
+        try:
+            stopping = False
+            while not stopping:
+                try:
+                    batch = [self._queue.get(timeout=self._flush_interval)]
+                except queue.Empty:
+                    continue
+                while len(batch) < self._batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if batch[-1] is _STOP:
+                    batch.pop()
+                    stopping = True
+
+                stream.write("".join(self._serialize(entry) for entry in batch))
+                stream.flush()
+                self._written += len(batch)
+                if stream.tell() >= self._max_bytes:
+                    stream.close()
+                    self._rotate()
+                    stream = open(self._path, "a", encoding="utf8")
+        finally:
+            stream.close()
+
+    @staticmethod
+    def _serialize(entry: tuple) -> str:
+        time, level, logger, function, line, message, exception = entry
+        data = {
+            "time": time.isoformat(),
+            "level": level,
+            "logger": logger,
+            "function": function,
+            "line": line,
+            "message": message
+        }
+        if exception:
+            data["exception"] = exception
+        return json.dumps(data, default=str) + "\n"
+
+    def _rotate(self) -> None:
+        """Renames app.log to app.log.1, app.log.1 to app.log.2, ... dropping the oldest"""
+        for i in range(self._backup_count - 1, 0, -1):
+            source = self._path.with_name(f"{self._path.name}.{i}")
+            if source.exists():
+                os.replace(source, self._path.with_name(f"{self._path.name}.{i + 1}"))
+        if self._backup_count > 0:
+            os.replace(self._path, self._path.with_name(f"{self._path.name}.1"))
+        else:
+            self._path.unlink()
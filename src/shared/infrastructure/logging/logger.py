@@ -1,15 +1,13 @@
 from loguru import logger
 import sys
 from pathlib import Path
+from typing import List
 from src.shared.infrastructure.config.settings import get_settings
+from src.shared.infrastructure.logging.batching_sink import BatchingSink
 
 settings = get_settings()
 
-# Create logs directory if it doesn't exist
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-
-# Configure log format
+# Configure console log format
 log_format = (
     "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
     "<level>{level: <8}</level> | "
@@ -17,43 +15,73 @@ log_format = (
     "<level>{message}</level>"
 )
 
-# Remove default configuration
-logger.remove()
+# File sinks created by configure_logging, exposed for their stats
+file_sinks: List[BatchingSink] = []
+
+def _exception_only(record) -> str:
+    # The batching sinks build their JSON from the record; only the exception needs formatting
+    return "{exception}"
+
+def _file_sink(path: Path, max_bytes: int, backup_count: int) -> BatchingSink:
+    sink = BatchingSink(
+        str(path),
+        max_queue_size=settings.LOG_QUEUE_SIZE,
+        batch_size=settings.LOG_BATCH_SIZE,
+        flush_interval=settings.LOG_FLUSH_INTERVAL_SECONDS,
+        overflow=settings.LOG_OVERFLOW_POLICY,
+        max_bytes=max_bytes,
+        backup_count=backup_count
+    )
+    file_sinks.append(sink)
+    return sink
+
+def configure_logging(log_dir: str = "logs") -> None:
+    """
+    Replaces the loguru handlers with the application ones
+
+    Files get structured JSON lines through batching sinks, so requests only
+    enqueue records. Diagnose mode (variable values in tracebacks) follows
+    LOG_DIAGNOSE, which defaults to DEBUG.
+    """
+    diagnose = settings.DEBUG if settings.LOG_DIAGNOSE is None else settings.LOG_DIAGNOSE
 
-# Add console handler in development
-if settings.DEBUG:
+    # Remove default configuration
+    logger.remove()
+    file_sinks.clear()
+
+    # Add console handler in development
+    if settings.DEBUG:
+        logger.add(
+            sys.stderr,
+            format=log_format,
+            level="DEBUG",
+            backtrace=diagnose,
+            diagnose=diagnose
+        )
+
+    # Add file handler
     logger.add(
-        sys.stderr,
-        format=log_format,
-        level="DEBUG",
-        backtrace=True,
-        diagnose=True
+        _file_sink(Path(log_dir) / "app.log", max_bytes=500 * 1024 * 1024, backup_count=10),
+        format=_exception_only,
+        level="INFO",
+        backtrace=diagnose,
+        diagnose=diagnose
     )
 
-# Add file handler
-logger.add(
-    "logs/app.log",
-    rotation="500 MB",    # Rotate when reaching 500MB
-    retention="10 days",  # Keep logs for 10 days
-    compression="zip",    # Compress rotated logs
-    format=log_format,
-    level="INFO",
-    backtrace=True,
-    diagnose=True
-)
+    # Add specific handler for errors
+    logger.add(
+        _file_sink(Path(log_dir) / "error.log", max_bytes=100 * 1024 * 1024, backup_count=30),
+        format=_exception_only,
+        level="ERROR",
+        backtrace=diagnose,
+        diagnose=diagnose,
+        filter=lambda record: record["level"].name == "ERROR"
+    )
 
-# Add specific handler for errors
-logger.add(
-    "logs/error.log",
-    rotation="100 MB",
-    retention="30 days",
-    compression="zip",
-    format=log_format,
-    level="ERROR",
-    backtrace=True,
-    diagnose=True,
-    filter=lambda record: record["level"].name == "ERROR"
-)
+def shutdown_logging() -> None:
+    """Removes every handler, writing what the file sinks still have queued"""
+    logger.remove()
+    file_sinks.clear()
 
 def get_logger(name: str):
     """Get a logger instance with the given name"""
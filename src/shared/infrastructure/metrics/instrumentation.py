@@ -0,0 +1,236 @@
+import time
+import weakref
+from contextvars import ContextVar, Token
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from src.shared.infrastructure.config.settings import get_settings
+from src.shared.infrastructure.logging.logger import get_logger
+from src.shared.infrastructure.metrics.registry import MetricFamily, Sample, registry
+
+settings = get_settings()
+logger = get_logger("Instrumentation")
+
+# Minimum seconds between two pool wait warnings, so a saturated pool doesn't flood the logs
+POOL_WARNING_INTERVAL_SECONDS = 10
+
+# Buckets for the number of SQL statements of a request
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+http_requests = registry.counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code",
+    ("method", "route", "status")
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP requests, including streamed bodies",
+    ("method", "route")
+)
+http_request_db_statements = registry.histogram(
+    "http_request_db_statements",
+    "SQL statements executed per HTTP request",
+    ("method", "route"),
+    buckets=STATEMENT_BUCKETS
+)
+http_request_db_duration = registry.histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in SQL statements per HTTP request",
+    ("method", "route")
+)
+http_request_pool_wait = registry.histogram(
+    "http_request_db_pool_wait_seconds",
+    "Time spent waiting for pooled database connections per HTTP request",
+    ("method", "route")
+)
+db_statement_duration = registry.histogram(
+    "db_statement_duration_seconds",
+    "Time spent executing each SQL statement",
+    ("engine",)
+)
+db_pool_wait = registry.histogram(
+    "db_pool_wait_seconds",
+    "Time waiting for a pooled connection, including opening new connections",
+    ("engine",)
+)
+db_pool_checkout_duration = registry.histogram(
+    "db_pool_checkout_duration_seconds",
+    "Time to check a connection out of the pool, including the pre-ping",
+    ("engine",)
+)
+db_pool_invalidations = registry.counter(
+    "db_pool_invalidations_total",
+    "Pooled connections discarded, by reason (pre_ping: failed pre-ping, error: disconnect while in use)",
+    ("engine", "reason")
+)
+
+class RequestStats:
+    """Database work attributed to the current request"""
+    __slots__ = ("statements", "db_seconds", "pool_wait_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+
+# Stats of the request being handled; copied into worker threads and SQLAlchemy greenlets
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+def start_request() -> Tuple[RequestStats, Token]:
+    """Starts attributing database work in this context to a new RequestStats"""
+    stats = RequestStats()
+    return stats, _request_stats.set(stats)
+
+def end_request(token: Token) -> None:
+    _request_stats.reset(token)
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+def record_request(method: str, route: str, status_code: int, seconds: float, stats: RequestStats) -> None:
+    http_requests.inc(method, route, str(status_code))
+    http_request_duration.observe(seconds, method, route)
+    http_request_db_statements.observe(stats.statements, method, route)
+    http_request_db_duration.observe(stats.db_seconds, method, route)
+    http_request_pool_wait.observe(stats.pool_wait_seconds, method, route)
+
+# Engines whose statements are already timed
+_instrumented: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+def instrument_engine(engine, name: str) -> None:
+    """
+    Times every SQL statement of engine (sync or async) through cursor events
+
+    Statements run while a request is handled are also added to its
+    RequestStats. Instrumenting the same engine twice has no effect.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+    if engine in _instrumented:
+        return
+    _instrumented.add(engine)
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_started = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._metrics_started
+        db_statement_duration.observe(elapsed, name)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_seconds += elapsed
+
+    def invalidate(dbapi_connection, connection_record, exception):
+        # A failed pre-ping raises InvalidatePoolError before the connection is handed out
+        reason = "pre_ping" if isinstance(exception, exc.InvalidatePoolError) else "error"
+        db_pool_invalidations.inc(name, reason)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "invalidate", invalidate)
+
+class _TimedCheckout:
+    """
+    Pool mixin that records how long each checkout takes
+
+    _do_get is the wait for a free (or new) connection; connect adds the
+    pre-ping. Waits over DB_POOL_WAIT_WARNING_SECONDS mean requests are
+    queueing for connections and are logged, at most once every
+    POOL_WARNING_INTERVAL_SECONDS.
+    """
+    metrics_name = "sync"
+    _last_warning = 0.0
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            db_pool_checkout_duration.observe(time.perf_counter() - started, self.metrics_name)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - started
+            db_pool_wait.observe(elapsed, self.metrics_name)
+            stats = _request_stats.get()
+            if stats is not None:
+                stats.pool_wait_seconds += elapsed
+            if elapsed > settings.DB_POOL_WAIT_WARNING_SECONDS:
+                self._warn_wait(elapsed)
+
+    def _warn_wait(self, elapsed: float) -> None:
+        now = time.monotonic()
+        if now - _TimedCheckout._last_warning < POOL_WARNING_INTERVAL_SECONDS:
+            return
+        _TimedCheckout._last_warning = now
+        logger.warning(
+            "Waited {:.3f}s for a {} database connection; requests are queueing ({})",
+            elapsed,
+            self.metrics_name,
+            self.status()
+        )
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    metrics_name = "sync"
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    metrics_name = "async"
+
+def pool_collector(engines: Dict[str, object]):
+    """Collector reporting the connection counts of each engine's pool on scrape"""
+    def collect() -> Iterable[MetricFamily]:
+        gauges: Dict[str, List[Sample]] = {"checked_out": [], "checked_in": [], "size": [], "overflow": []}
+        for name, engine in engines.items():
+            pool = getattr(engine, "sync_engine", engine).pool
+            if not isinstance(pool, QueuePool):
+                continue
+            labels = {"engine": name}
+            gauges["checked_out"].append(Sample("db_pool_checked_out", labels, pool.checkedout()))
+            gauges["checked_in"].append(Sample("db_pool_checked_in", labels, pool.checkedin()))
+            gauges["size"].append(Sample("db_pool_size", labels, pool.size()))
+            gauges["overflow"].append(Sample("db_pool_overflow", labels, pool.overflow()))
+        return [
+            MetricFamily("db_pool_checked_out", "gauge", "Connections in use", gauges["checked_out"]),
+            MetricFamily("db_pool_checked_in", "gauge", "Idle connections in the pool", gauges["checked_in"]),
+            MetricFamily("db_pool_size", "gauge", "Configured pool size", gauges["size"]),
+            MetricFamily("db_pool_overflow", "gauge", "Connections opened beyond the pool size", gauges["overflow"])
+        ]
+    return collect
+
+def cache_collector(caches: Dict[str, object]):
+    """Collector reporting the stats() of each TTLCache on scrape"""
+    def collect() -> Iterable[MetricFamily]:
+        stats = {name: cache.stats() for name, cache in caches.items()}
+        families = []
+        for key, metric, kind, documentation in (
+            ("hits", "cache_hits_total", "counter", "Cache lookups that found a live entry"),
+            ("misses", "cache_misses_total", "counter", "Cache lookups that found nothing or an expired entry"),
+            ("evictions", "cache_evictions_total", "counter", "Entries evicted to stay under the size limit"),
+            ("size", "cache_entries", "gauge", "Entries currently cached")
+        ):
+            families.append(MetricFamily(metric, kind, documentation, [
+                Sample(metric, {"cache": name}, values[key]) for name, values in stats.items()
+            ]))
+        return families
+    return collect
+
+def log_sink_collector(sinks: List[object]):
+    """Collector reporting the stats() of each BatchingSink on scrape"""
+    def collect() -> Iterable[MetricFamily]:
+        stats = [(sink.name, sink.stats()) for sink in sinks]
+        return [
+            MetricFamily("log_records_written_total", "counter", "Log records written to disk", [
+                Sample("log_records_written_total", {"sink": name}, values["written"]) for name, values in stats
+            ]),
+            MetricFamily("log_records_dropped_total", "counter", "Log records dropped because the queue was full", [
+                Sample("log_records_dropped_total", {"sink": name}, values["dropped"]) for name, values in stats
+            ]),
+            MetricFamily("log_queue_depth", "gauge", "Log records waiting to be written", [
+                Sample("log_queue_depth", {"sink": name}, values["queued"]) for name, values in stats
+            ])
+        ]
+    return collect
@@ -0,0 +1,170 @@
+import math
+from bisect import bisect_left
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+# Latency buckets in seconds, from 1 ms to 10 s
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Sample(NamedTuple):
+    name: str
+    labels: Dict[str, str]
+    value: float
+
+class MetricFamily(NamedTuple):
+    """A metric as rendered in the Prometheus text format: one HELP/TYPE header and its samples"""
+    name: str
+    type: str
+    documentation: str
+    samples: List[Sample]
+
+class Counter:
+    """Monotonic counter with one value per combination of label values"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self._labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            values = list(self._values.items())
+        return MetricFamily(self.name, "counter", self.documentation, [
+            Sample(self.name, dict(zip(self._labelnames, key)), value) for key, value in values
+        ])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+class Histogram:
+    """
+    Histogram with fixed upper bounds, one series per combination of label values
+
+    observe() only increments the matching bucket; counts are made
+    cumulative when the histogram is collected.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self._labelnames = tuple(labelnames)
+        self._buckets = tuple(sorted(buckets))
+        # label values -> [count per bucket..., count above the last bucket, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0] * (len(self._buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            series = [(key, list(values)) for key, values in self._series.items()]
+        samples = []
+        for key, values in series:
+            labels = dict(zip(self._labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self._buckets + (math.inf,), values):
+                cumulative += count
+                samples.append(Sample(f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            samples.append(Sample(f"{self.name}_sum", labels, values[-1]))
+            samples.append(Sample(f"{self.name}_count", labels, cumulative))
+        return MetricFamily(self.name, "histogram", self.documentation, samples)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+class MetricsRegistry:
+    """
+    Metrics exposed by the /metrics endpoint
+
+    Counters and histograms are updated as the app runs; collectors are
+    called on each scrape for values read from elsewhere, like pool or
+    cache sizes.
+    """
+
+    def __init__(self):
+        self._metrics: List = []
+        self._collectors: List[Collector] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def collect(self) -> List[MetricFamily]:
+        families = [metric.collect() for metric in self._metrics]
+        for collector in self._collectors:
+            families.extend(collector())
+        return families
+
+    def render(self) -> str:
+        """Renders every metric in the Prometheus text exposition format (version 0.0.4)"""
+        lines = []
+        for family in self.collect():
+            lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.type}")
+            for sample in family.samples:
+                lines.append(f"{sample.name}{_format_labels(sample.labels)} {_format_value(sample.value)}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Resets the counters and histograms; collectors stay registered"""
+        for metric in self._metrics:
+            metric.clear()
+
+    def _register(self, metric):
+        if any(existing.name == metric.name for existing in self._metrics):
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self._metrics.append(metric)
+        return metric
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+# Registry of the application
+registry = MetricsRegistry()
@@ -1,22 +1,99 @@
+from typing import Optional, Tuple
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
 from src.shared.infrastructure.config.settings import get_settings
+from src.shared.infrastructure.metrics.instrumentation import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    instrument_engine
+)
 
 settings = get_settings()
 
+# asyncio drivers used for each database backend
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def get_async_database_url(url: str) -> str:
+    """Converts a sync database URL into the equivalent asyncio driver URL"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver configured for database backend '{backend}'")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+# Connections per worker left to the sync engine when DB_MAX_CONNECTIONS is set; requests use the async engine
+SYNC_POOL_CONNECTIONS = 1
+
+def pool_limits(
+    pool_size: int,
+    max_overflow: int,
+    max_connections: Optional[int] = None,
+    workers: int = 1,
+    reserved: int = 0
+) -> Tuple[int, int]:
+    """
+    Returns the pool size and overflow of one engine in one worker
+
+    Without max_connections the configured values are used as is. Otherwise
+    each worker gets an equal share of max_connections, minus `reserved`
+    connections kept for its other engines, and the pool size and overflow
+    are capped so all workers together never open more than max_connections.
+    """
+    if max_connections is None:
+        return pool_size, max_overflow
+    share = max_connections // max(workers, 1) - reserved
+    if share < 1:
+        raise ValueError(f"DB_MAX_CONNECTIONS={max_connections} leaves no connections for each of {workers} workers")
+    size = min(pool_size, share)
+    overflow = share - size if max_overflow < 0 else min(max_overflow, share - size)
+    return size, overflow
+
+async_pool_size, async_max_overflow = pool_limits(
+    settings.DB_POOL_SIZE,
+    settings.DB_MAX_OVERFLOW,
+    settings.DB_MAX_CONNECTIONS,
+    settings.WEB_CONCURRENCY,
+    reserved=SYNC_POOL_CONNECTIONS
+)
+if settings.DB_MAX_CONNECTIONS is None:
+    sync_pool_size, sync_max_overflow = settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+else:
+    sync_pool_size, sync_max_overflow = SYNC_POOL_CONNECTIONS, 0
+
 engine = create_engine(
     settings.DB_URL,
-    pool_size=settings.DB_POOL_SIZE,               # Initial size of the pool
-    max_overflow=settings.DB_MAX_OVERFLOW,         # Additional connections allowed
+    pool_size=sync_pool_size,                      # Initial size of the pool
+    max_overflow=sync_max_overflow,                # Additional connections allowed
     pool_timeout=settings.DB_POOL_TIMEOUT,         # Wait time to establish a connection
     pool_recycle=settings.DB_POOL_RECYCLE,         # Time to recycle connections
-    pool_pre_ping=True,                            # Validate connections before use
-    poolclass=QueuePool                            # Pool Class to use
+    pool_pre_ping=settings.DB_POOL_PRE_PING,       # Validate connections before use
+    pool_use_lifo=settings.DB_POOL_USE_LIFO,       # Reuse the most recently returned connection
+    poolclass=InstrumentedQueuePool                # QueuePool that times checkouts
+)
+
+# Engine used by the API request path, so DB round trips don't block the event loop
+async_engine = create_async_engine(
+    get_async_database_url(settings.DB_URL),
+    pool_size=async_pool_size,
+    max_overflow=async_max_overflow,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    poolclass=InstrumentedAsyncAdaptedQueuePool
 )
 
+instrument_engine(engine, "sync")
+instrument_engine(async_engine, "async")
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False)
 Base = declarative_base()
 
 def get_db():
@@ -25,3 +102,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Session factory for work that outlives the request, such as streamed responses"""
+    return AsyncSessionLocal
@@ -7,13 +7,13 @@ class CreateUserCommand:
     def __init__(self, user_service: UserService):
         self._user_service = user_service
 
-    def execute(self, data: dict) -> UserResponseDTO:
+    async def execute(self, data: dict) -> UserResponseDTO:
         """Execute the create user command"""
         # Validate input data using CreateUserDTO
         user_dto = CreateUserDTO(**data)
 
         # Delegate to domain service
-        return self._user_service.create_user(
+        return await self._user_service.create_user(
             email=user_dto.email,
             name=user_dto.name
         )
@@ -28,6 +28,8 @@ class UserResponseDTO(BaseModel):
     email: str
     name: str
     created_at: datetime
+    # Used to issue and check tokens; never part of the response body
+    token_version: int = Field(default=0, exclude=True)
 
     class Config:
         from_attributes = True
@@ -38,5 +40,6 @@ class UserResponseDTO(BaseModel):
             id=user.id,
             email=str(user.email),
             name=user.name,
-            created_at=user.created_at
+            created_at=user.created_at,
+            token_version=user.token_version
         )
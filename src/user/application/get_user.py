@@ -8,7 +8,7 @@ class GetUserQuery:
     def __init__(self, user_service: UserService):
         self._user_service = user_service
 
-    def execute(self, email: str) -> Optional[UserResponseDTO]:
+    async def execute(self, email: str) -> Optional[UserResponseDTO]:
         """Executes the get user query"""
-        user = self._user_service.get_user_by_email(email)
+        user = await self._user_service.get_user_by_email(email)
         return UserResponseDTO.from_orm(user) if user else None
@@ -14,6 +14,8 @@ class User:
     name: str
     created_at: datetime
     id: Optional[int] = None
+    # Tokens issued with an older version are revoked
+    token_version: int = 0
 
     def __post_init__(self):
         self._validate()
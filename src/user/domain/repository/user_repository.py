@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional
 from src.user.domain.model.user import User
 
 class UserRepository(ABC):
@@ -14,3 +14,46 @@ class UserRepository(ABC):
     def find_by_email(self, email: str) -> Optional[User]:
         """Finds a user by email - needed for duplicate validation"""
         pass
+
+    @abstractmethod
+    def find_by_id(self, id: int) -> Optional[User]:
+        """Finds a user by id"""
+        pass
+
+    @abstractmethod
+    def revoke_tokens(self, id: int) -> Optional[int]:
+        """Revokes every token issued to the user and returns the new token version, or None if the user does not exist"""
+        pass
+
+    @abstractmethod
+    def find_token_versions(self) -> Dict[int, int]:
+        """Finds the token version of every user that has revoked tokens"""
+        pass
+
+class AsyncUserRepository(ABC):
+    """Asyncio repository interface for User aggregate"""
+
+    @abstractmethod
+    async def save(self, user: User) -> User:
+        """Saves a user and returns the saved entity"""
+        pass
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[User]:
+        """Finds a user by email - needed for duplicate validation"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, id: int) -> Optional[User]:
+        """Finds a user by id"""
+        pass
+
+    @abstractmethod
+    async def revoke_tokens(self, id: int) -> Optional[int]:
+        """Revokes every token issued to the user and returns the new token version, or None if the user does not exist"""
+        pass
+
+    @abstractmethod
+    async def find_token_versions(self) -> Dict[int, int]:
+        """Finds the token version of every user that has revoked tokens"""
+        pass
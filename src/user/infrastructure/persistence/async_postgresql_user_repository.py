@@ -0,0 +1,42 @@
+from typing import Dict, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.user.domain.model.user import User
+from src.user.domain.repository.user_repository import AsyncUserRepository
+from src.user.infrastructure.persistence.postgresql_user_repository import PostgresqlUserRepository
+
+class AsyncPostgresqlUserRepository(AsyncUserRepository):
+    """
+    Asyncio implementation of UserRepository
+
+    Runs the queries of PostgresqlUserRepository through AsyncSession.run_sync,
+    so the I/O goes through the asyncio driver without duplicating the queries.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def save(self, user: User) -> User:
+        return await self._session.run_sync(
+            lambda session: PostgresqlUserRepository(session).save(user)
+        )
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlUserRepository(session).find_by_email(email)
+        )
+
+    async def find_by_id(self, id: int) -> Optional[User]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlUserRepository(session).find_by_id(id)
+        )
+
+    async def revoke_tokens(self, id: int) -> Optional[int]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlUserRepository(session).revoke_tokens(id)
+        )
+
+    async def find_token_versions(self) -> Dict[int, int]:
+        return await self._session.run_sync(
+            lambda session: PostgresqlUserRepository(session).find_token_versions()
+        )
@@ -0,0 +1,65 @@
+from typing import Dict, Optional
+
+from src.user.domain.model.user import User
+from src.user.domain.repository.user_repository import AsyncUserRepository
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
+from src.shared.infrastructure.config.settings import get_settings
+
+settings = get_settings()
+
+# Process-wide cache shared by every request; User entities are immutable
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+class CachedUserRepository(AsyncUserRepository):
+    """
+    Caching decorator for AsyncUserRepository
+
+    Found users are cached by email and by id; missing users are not cached,
+    so a newly created user is visible immediately.
+    """
+
+    def __init__(self, repository: AsyncUserRepository, cache: TTLCache = user_cache):
+        self._repository = repository
+        self._cache = cache
+
+    async def save(self, user: User) -> User:
+        self._cache.delete(("email", str(user.email)))
+        saved_user = await self._repository.save(user)
+        self._store(saved_user)
+        return saved_user
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        user = self._cache.get(("email", email))
+        if user is None:
+            user = await self._repository.find_by_email(email)
+            if user:
+                self._store(user)
+        return user
+
+    async def find_by_id(self, id: int) -> Optional[User]:
+        user = self._cache.get(("id", id))
+        if user is None:
+            user = await self._repository.find_by_id(id)
+            if user:
+                self._store(user)
+        return user
+
+    async def revoke_tokens(self, id: int) -> Optional[int]:
+        token_version = await self._repository.revoke_tokens(id)
+        # Cached users carry the old token version
+        user = self._cache.get(("id", id))
+        if user is not None:
+            self._cache.delete(("email", str(user.email)))
+            self._cache.delete(("id", id))
+        return token_version
+
+    async def find_token_versions(self) -> Dict[int, int]:
+        return await self._repository.find_token_versions()
+
+    def _store(self, user: User) -> None:
+        """Caches the user under both of its keys"""
+        self._cache.set(("email", str(user.email)), user)
+        self._cache.set(("id", user.id), user)
@@ -9,3 +9,4 @@ class UserModel(Base):
     email = Column(String, unique=True, index=True, nullable=False)
     name = Column(String, nullable=False)
     created_at = Column(DateTime, nullable=False)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
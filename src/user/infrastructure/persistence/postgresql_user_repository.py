@@ -1,4 +1,5 @@
-from typing import Optional
+from typing import Dict, Optional
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from src.user.domain.model.user import User
@@ -16,7 +17,8 @@ class PostgresqlUserRepository(UserRepository):
         user_model = UserModel(
             email=str(user.email),
             name=user.name,
-            created_at=user.created_at
+            created_at=user.created_at,
+            token_version=user.token_version
         )
         self._session.add(user_model)
         self._session.commit()
@@ -29,11 +31,32 @@ class PostgresqlUserRepository(UserRepository):
         ).first()
         return self._user_model_to_entity(user_model) if user_model else None
 
+    def find_by_id(self, id: int) -> Optional[User]:
+        user_model = self._session.get(UserModel, id)
+        return self._user_model_to_entity(user_model) if user_model else None
+
+    def revoke_tokens(self, id: int) -> Optional[int]:
+        token_version = self._session.execute(
+            update(UserModel)
+            .where(UserModel.id == id)
+            .values(token_version=UserModel.token_version + 1)
+            .returning(UserModel.token_version)
+        ).scalar_one_or_none()
+        self._session.commit()
+        return token_version
+
+    def find_token_versions(self) -> Dict[int, int]:
+        rows = self._session.execute(
+            select(UserModel.id, UserModel.token_version).where(UserModel.token_version > 0)
+        )
+        return {row.id: row.token_version for row in rows}
+
     def _user_model_to_entity(self, user_model: UserModel) -> User:
         """Converts UserModel to User domain entity"""
         return User(
             id=user_model.id,
             email=Email(value=user_model.email),
             name=user_model.name,
-            created_at=user_model.created_at
+            created_at=user_model.created_at,
+            token_version=user_model.token_version
         )
@@ -1,19 +1,30 @@
 import pytest
 from datetime import datetime, timezone
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-from src.shared.infrastructure.persistence.database import Base, get_db
+from sqlalchemy.pool import StaticPool, NullPool
+from src.shared.infrastructure.persistence.database import (
+    Base,
+    get_db,
+    get_async_db,
+    get_async_session_factory
+)
 from src.user.domain.model.user import User
 from src.shared.domain.value_objects import Email, Money
 from fastapi.testclient import TestClient
 from src.main import app
 from decimal import Decimal
 from src.order.domain.model.order import Order, OrderItem
-from src.auth.infrastructure.jwt_service import JWTService
+from src.auth.infrastructure.jwt_service import JWTService, token_cache
 from src.user.infrastructure.persistence.postgresql_user_repository import PostgresqlUserRepository
+from src.user.infrastructure.persistence.cached_user_repository import user_cache
+from src.order.infrastructure.persistence.cached_order_repository import report_cache
+from src.order.infrastructure.persistence.postgresql_order_repository import product_cache
+from src.auth.infrastructure.revocation_list import revocation_list
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+SQLALCHEMY_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 @pytest.fixture(scope="session")
 def test_engine():
@@ -24,6 +35,41 @@ def test_engine():
     )
     return engine
 
+class StatementCounter:
+    """Records the SQL statements sent to the database"""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+@pytest.fixture
+def statement_counter(test_engine):
+    """Counts statements executed on the test engine while the test runs"""
+    counter = StatementCounter()
+    event.listen(test_engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(test_engine, "before_cursor_execute", counter)
+
+@pytest.fixture(scope="session")
+def test_async_engine():
+    # NullPool: TestClient may run each request on a different event loop
+    return create_async_engine(SQLALCHEMY_ASYNC_DATABASE_URL, poolclass=NullPool)
+
+@pytest.fixture(scope="function")
+def TestingAsyncSessionLocal(test_async_engine):
+    return async_sessionmaker(autoflush=False, bind=test_async_engine)
+
 @pytest.fixture(scope="function")
 def TestingSessionLocal(test_engine):
     return sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
@@ -31,6 +77,8 @@ def TestingSessionLocal(test_engine):
 @pytest.fixture(scope="function")
 def test_session(test_engine, TestingSessionLocal):
     Base.metadata.create_all(bind=test_engine)
+    # Product ids are reused once the tables are recreated
+    product_cache.clear()
     session = TestingSessionLocal()
     try:
         yield session
@@ -40,9 +88,14 @@ def test_session(test_engine, TestingSessionLocal):
         Base.metadata.drop_all(bind=test_engine)
 
 @pytest.fixture(scope="function")
-def test_db(test_engine, TestingSessionLocal):
+def test_db(test_engine, TestingSessionLocal, TestingAsyncSessionLocal):
     Base.metadata.drop_all(bind=test_engine)
     Base.metadata.create_all(bind=test_engine)
+    user_cache.clear()
+    report_cache.clear()
+    product_cache.clear()
+    revocation_list.clear()
+    token_cache.clear()
 
     def override_get_db():
         try:
@@ -51,7 +104,13 @@ def test_db(test_engine, TestingSessionLocal):
         finally:
             db.close()
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_session_factory] = lambda: TestingAsyncSessionLocal
     db = TestingSessionLocal()
 
     try:
@@ -61,6 +120,10 @@ def test_db(test_engine, TestingSessionLocal):
         Base.metadata.drop_all(bind=test_engine)
         if get_db in app.dependency_overrides:
             del app.dependency_overrides[get_db]
+        if get_async_db in app.dependency_overrides:
+            del app.dependency_overrides[get_async_db]
+        if get_async_session_factory in app.dependency_overrides:
+            del app.dependency_overrides[get_async_session_factory]
 
 @pytest.fixture
 def client(test_db):
@@ -0,0 +1,33 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from src.main import app
+from src.shared.infrastructure.logging.logger import file_sinks
+from src.shared.infrastructure.persistence.database import async_engine, engine
+
+class TestAppLifespan:
+    def test_startup_configures_logging_without_connecting_to_the_database(self):
+        # Given
+        connections = []
+
+        def on_connect(dbapi_connection, connection_record):
+            connections.append(dbapi_connection)
+
+        event.listen(engine, "connect", on_connect)
+        event.listen(async_engine.sync_engine, "connect", on_connect)
+
+        # When
+        try:
+            with TestClient(app) as client:
+                response = client.get("/health")
+                sinks = [sink.name for sink in file_sinks]
+        finally:
+            event.remove(engine, "connect", on_connect)
+            event.remove(async_engine.sync_engine, "connect", on_connect)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"status": "ok"}
+        assert sinks == ["app.log", "error.log"]
+        assert connections == []
+        assert file_sinks == []
@@ -1,6 +1,8 @@
 from fastapi import status
 from jose import jwt
 from src.auth.infrastructure.jwt_service import JWTService
+from src.shared.infrastructure.api import dependencies
+from src.user.infrastructure.persistence.models import UserModel
 from src.user.infrastructure.persistence.postgresql_user_repository import PostgresqlUserRepository
 
 class TestAuthEndpoints:
@@ -60,3 +62,49 @@ class TestAuthEndpoints:
         # Then
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert "Could not validate credentials" in response.json()["detail"]
+
+    def test_logout_revokes_token(self, client, auth_headers):
+        # When
+        response = client.post("/api/v1/logout", headers=auth_headers)
+        after_logout = client.get("/api/v1/orders", headers=auth_headers)
+
+        # Then
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert after_logout.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "Token has been revoked" in after_logout.json()["detail"]
+
+    def test_login_after_logout_issues_valid_token(self, client, test_user, auth_headers):
+        # Given
+        client.post("/api/v1/logout", headers=auth_headers)
+
+        # When
+        token = client.post("/api/v1/login", json={"email": str(test_user.email)}).json()["access_token"]
+        response = client.get("/api/v1/orders", headers={"Authorization": f"Bearer {token}"})
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_stateless_mode_trusts_token_claims(self, client, test_db, test_user, auth_headers, monkeypatch):
+        # Given
+        monkeypatch.setattr(dependencies.settings, "AUTH_STATELESS", True)
+        test_db.query(UserModel).delete()
+        test_db.commit()
+
+        # When
+        response = client.get("/api/v1/orders", headers=auth_headers)
+
+        # Then
+        # The deleted user is not looked up; the token is trusted until it expires
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_stateless_mode_rejects_revoked_token(self, client, auth_headers, monkeypatch):
+        # Given
+        monkeypatch.setattr(dependencies.settings, "AUTH_STATELESS", True)
+        client.post("/api/v1/logout", headers=auth_headers)
+
+        # When
+        response = client.get("/api/v1/orders", headers=auth_headers)
+
+        # Then
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "Token has been revoked" in response.json()["detail"]
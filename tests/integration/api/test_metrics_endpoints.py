@@ -0,0 +1,65 @@
+import re
+import pytest
+from fastapi import status
+from src.shared.infrastructure.metrics.instrumentation import instrument_engine
+from src.shared.infrastructure.metrics.registry import registry
+
+def sample_value(body: str, name: str, **labels) -> float:
+    """Value of the sample with exactly these labels, in label order"""
+    rendered = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(rf"^{re.escape(name)}{{{re.escape(rendered)}}} (\S+)$", body, re.MULTILINE)
+    assert match, f"{name} {labels} not found"
+    return float(match.group(1))
+
+class TestMetricsEndpoints:
+    @pytest.fixture
+    def metrics_client(self, client, test_engine, test_async_engine):
+        instrument_engine(test_engine, "sync")
+        instrument_engine(test_async_engine, "async")
+        registry.clear()
+        return client
+
+    def test_metrics_reports_latency_and_db_work_per_route(self, metrics_client):
+        # Given
+        response = metrics_client.post("/api/v1/users/", json={"email": "test@example.com", "name": "Test User"})
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # When
+        response = metrics_client.get("/metrics")
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        route = {"method": "POST", "route": "/api/v1/users/"}
+        assert sample_value(body, "http_requests_total", **route, status="201") == 1
+        assert sample_value(body, "http_request_duration_seconds_count", **route) == 1
+        assert sample_value(body, "http_request_db_statements_sum", **route) >= 2
+        assert sample_value(body, "http_request_db_duration_seconds_sum", **route) > 0
+        assert sample_value(body, "cache_misses_total", cache="user") >= 0
+
+    def test_metrics_labels_unknown_paths_as_unmatched(self, metrics_client):
+        # Given
+        metrics_client.get("/api/v1/unknown/123")
+        metrics_client.get("/api/v1/unknown/456")
+
+        # When
+        body = metrics_client.get("/metrics").text
+
+        # Then
+        assert sample_value(body, "http_requests_total", method="GET", route="unmatched", status="404") == 2
+        assert "/unknown/123" not in body
+
+    def test_metrics_separates_routes_and_status_codes(self, metrics_client, auth_headers):
+        # Given
+        metrics_client.get("/api/v1/orders/", headers=auth_headers)
+        metrics_client.get("/api/v1/orders/")
+
+        # When
+        body = metrics_client.get("/metrics").text
+
+        # Then
+        route = {"method": "GET", "route": "/api/v1/orders/"}
+        assert sample_value(body, "http_requests_total", **route, status="200") == 1
+        assert sample_value(body, "http_requests_total", **route, status="401") == 1
+        assert sample_value(body, "http_request_duration_seconds_count", **route) == 2
@@ -1,4 +1,6 @@
+import json
 import pytest
+from datetime import datetime
 from decimal import Decimal
 from fastapi import status
 from src.order.domain.model.order import Order, OrderItem
@@ -118,3 +120,232 @@ class TestOrderEndpoints:
         assert data[0]["product_name"] == "Test Product 1"
         assert data[0]["total_quantity"] == 2
         assert data[0]["total_price"] == "20.00"
+
+    def test_get_sales_report_top_products(self, client, test_user, test_db):
+        # Given
+        repository = PostgresqlOrderRepository(test_db)
+        repository.save(Order(
+            customer_name="Test Customer",
+            items=[
+                OrderItem(product_name=name, unit_price=Money(amount=Decimal("10.00")), quantity=quantity)
+                for name, quantity in (("Coffee", 5), ("Tea", 3), ("Juice", 1))
+            ],
+            waiter_id=test_user.id,
+            created_at=datetime(2024, 1, 15, 12, 0)
+        ))
+        params = {"start_date": "2024-01-01T00:00:00", "end_date": "2024-03-01T00:00:00", "limit": 2}
+
+        # When
+        exact = client.get("/api/v1/orders/report", params=params)
+        approximate = client.get("/api/v1/orders/report", params={**params, "approximate": True})
+
+        # Then
+        assert exact.status_code == status.HTTP_200_OK
+        assert [(r["product_name"], r["total_quantity"]) for r in exact.json()] == [("Coffee", 5), ("Tea", 3)]
+        assert approximate.status_code == status.HTTP_200_OK
+        assert approximate.json() == [
+            {"product_name": "Coffee", "total_quantity": 5, "total_price": "50.00", "max_error": 0},
+            {"product_name": "Tea", "total_quantity": 3, "total_price": "30.00", "max_error": 0}
+        ]
+
+    @pytest.mark.parametrize("params", [
+        {"approximate": True},
+        {"limit": 0}
+    ])
+    def test_get_sales_report_rejects_invalid_top_params(self, client, params):
+        # When
+        response = client.get("/api/v1/orders/report", params=params)
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_waiter_sales_report_success(self, client, test_user, test_db):
+        # Given
+        repository = PostgresqlOrderRepository(test_db)
+        for quantity in (1, 3):
+            repository.save(Order(
+                customer_name="Test Customer",
+                items=[OrderItem(product_name="Test Product", unit_price=Money(amount=Decimal("10.00")), quantity=quantity)],
+                waiter_id=test_user.id,
+                created_at=datetime(2024, 1, 1, 12, 0)
+            ))
+
+        # When
+        response = client.get(
+            "/api/v1/orders/report/waiters",
+            params={"start_date": "2024-01-01T00:00:00", "end_date": "2024-01-02T00:00:00"}
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"waiter_id": test_user.id, "order_count": 2, "items_sold": 4, "total_price": "40.00"}
+        ]
+
+    @pytest.mark.parametrize("path", ["/api/v1/orders/report", "/api/v1/orders/report/waiters"])
+    @pytest.mark.parametrize("params", [
+        {},
+        {"start_date": "2020-01-01T00:00:00Z"},
+        {"end_date": "2099-01-01T00:00:00Z"}
+    ])
+    def test_get_reports_with_default_and_utc_bounds(self, client, test_user, test_db, path, params):
+        # Given
+        repository = PostgresqlOrderRepository(test_db)
+        repository.save(Order.create(
+            customer_name="Test Customer",
+            items=[OrderItem(product_name="Test Product", unit_price=Money(amount=Decimal("10.00")), quantity=2)],
+            waiter_id=test_user.id
+        ))
+
+        # When
+        response = client.get(path, params=params)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["total_price"] for row in response.json()] == ["20.00"]
+
+    def test_get_sales_series_success(self, client, test_user, test_db, auth_headers):
+        # Given
+        repository = PostgresqlOrderRepository(test_db)
+        for hour, quantity in ((9, 1), (9, 2), (11, 4)):
+            repository.save(Order(
+                customer_name="Test Customer",
+                items=[OrderItem(product_name="Test Product", unit_price=Money(amount=Decimal("10.00")), quantity=quantity)],
+                waiter_id=test_user.id,
+                created_at=datetime(2024, 1, 1, hour, 30)
+            ))
+
+        # When
+        response = client.get(
+            "/api/v1/orders/report/series",
+            params={"start_date": "2024-01-01T00:00:00", "end_date": "2024-01-02T00:00:00", "bucket": "hour"},
+            headers=auth_headers
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"bucket_start": "2024-01-01T09:00:00", "product_name": None, "total_quantity": 3, "total_price": "30.00"},
+            {"bucket_start": "2024-01-01T11:00:00", "product_name": None, "total_quantity": 4, "total_price": "40.00"}
+        ]
+
+    @pytest.mark.parametrize("params", [
+        {"bucket": "minute"},
+        {"start_date": "2020-01-01T00:00:00", "end_date": "2024-01-01T00:00:00", "bucket": "hour"}
+    ])
+    def test_get_sales_series_rejects_invalid_buckets(self, client, params):
+        # When
+        response = client.get("/api/v1/orders/report/series", params=params)
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_create_orders_batch_reports_per_order_results(self, client, sample_order_data, test_user, auth_headers):
+        # When
+        response = client.post(
+            "/api/v1/orders/batch",
+            json={
+                "orders": [
+                    sample_order_data,
+                    {"customer_name": "Test", "items": []},
+                    sample_order_data
+                ]
+            },
+            headers=auth_headers
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["created"] == 2
+        assert data["failed"] == 1
+        assert [r["index"] for r in data["results"]] == [0, 1, 2]
+        assert data["results"][0]["success"] is True
+        assert data["results"][0]["order"]["total_price"] == "35.00"
+        assert data["results"][0]["order"]["waiter_id"] == test_user.id
+        assert data["results"][1]["success"] is False
+        assert "at least one item" in data["results"][1]["error"]
+        assert data["results"][2]["order"]["id"] != data["results"][0]["order"]["id"]
+
+    def test_create_orders_batch_without_token(self, client, sample_order_data):
+        # When
+        response = client.post("/api/v1/orders/batch", json={"orders": [sample_order_data]})
+
+        # Then
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_list_orders_paginates_with_cursor(self, client, sample_order_data, test_user, auth_headers):
+        # Given
+        for _ in range(3):
+            client.post("/api/v1/orders/", json=sample_order_data, headers=auth_headers)
+
+        # When
+        first_page = client.get("/api/v1/orders/", params={"limit": 2}, headers=auth_headers).json()
+        second_page = client.get(
+            "/api/v1/orders/",
+            params={"limit": 2, "cursor": first_page["next_cursor"]},
+            headers=auth_headers
+        ).json()
+
+        # Then
+        assert len(first_page["items"]) == 2
+        assert first_page["next_cursor"] is not None
+        assert len(second_page["items"]) == 1
+        assert second_page["next_cursor"] is None
+        ids = [o["id"] for o in first_page["items"] + second_page["items"]]
+        assert len(set(ids)) == 3
+        assert second_page["items"][0]["total_price"] == "35.00"
+
+    def test_list_orders_invalid_cursor(self, client, test_user, auth_headers):
+        # When
+        response = client.get("/api/v1/orders/", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Invalid cursor"
+
+    def test_list_orders_stream_ndjson(self, client, sample_order_data, test_user, auth_headers):
+        # Given
+        for _ in range(3):
+            client.post("/api/v1/orders/", json=sample_order_data, headers=auth_headers)
+
+        # When
+        response = client.get("/api/v1/orders/", params={"stream": True}, headers=auth_headers)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        orders = [json.loads(line) for line in response.text.splitlines()]
+        assert len(orders) == 3
+        assert orders[0]["customer_name"] == sample_order_data["customer_name"]
+        assert len(orders[0]["items"]) == 2
+
+    def test_get_order_success(self, client, sample_order_data, test_user, auth_headers):
+        # Given
+        created = client.post("/api/v1/orders/", json=sample_order_data, headers=auth_headers).json()
+
+        # When
+        response = client.get(f"/api/v1/orders/{created['id']}", headers=auth_headers)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        order = response.json()
+        assert order["id"] == created["id"]
+        assert order["customer_name"] == sample_order_data["customer_name"]
+        assert order["items"] == created["items"]
+        assert order["total_price"] == created["total_price"]
+
+    def test_get_order_not_found(self, client, test_user, auth_headers):
+        # When
+        response = client.get("/api/v1/orders/999", headers=auth_headers)
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["detail"] == "Order not found"
+
+    def test_list_orders_without_token(self, client):
+        # When
+        response = client.get("/api/v1/orders/")
+
+        # Then
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,59 @@
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from src.order.domain.model.order import Order, OrderItem
+from src.order.infrastructure.persistence.async_postgresql_order_repository import AsyncPostgresqlOrderRepository
+from src.shared.domain.value_objects import Money
+
+class TestAsyncPostgresqlOrderRepository:
+    @pytest.fixture
+    def sample_order(self, mock_user):
+        return Order.create(
+            customer_name="Test Customer",
+            items=[
+                OrderItem(
+                    product_name="Test Product 1",
+                    unit_price=Money(amount=Decimal("10.00")),
+                    quantity=2
+                ),
+                OrderItem(
+                    product_name="Test Product 2",
+                    unit_price=Money(amount=Decimal("15.00")),
+                    quantity=1
+                )
+            ],
+            waiter_id=mock_user.id
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_and_find_by_id_success(self, test_session, TestingAsyncSessionLocal, sample_order):
+        async with TestingAsyncSessionLocal() as session:
+            # Given
+            repository = AsyncPostgresqlOrderRepository(session)
+            saved_order = await repository.save(sample_order)
+
+            # When
+            found_order = await repository.find_by_id(saved_order.id)
+
+            # Then
+            assert found_order is not None
+            assert found_order.id == saved_order.id
+            assert len(found_order.items) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_product_sales_report_success(self, test_session, TestingAsyncSessionLocal, sample_order):
+        async with TestingAsyncSessionLocal() as session:
+            # Given
+            repository = AsyncPostgresqlOrderRepository(session)
+            await repository.save(sample_order)
+            start_date = datetime.now() - timedelta(days=1)
+            end_date = datetime.now() + timedelta(days=1)
+
+            # When
+            report = await repository.get_product_sales_report(start_date, end_date)
+
+            # Then
+            assert len(report) == 2
+            assert report[0]["product_name"] == "Test Product 1"
+            assert report[0]["total_quantity"] == 2
+            assert report[0]["total_price"] == Decimal("20.00")
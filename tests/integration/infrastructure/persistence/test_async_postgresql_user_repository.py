@@ -0,0 +1,27 @@
+import pytest
+from src.user.infrastructure.persistence.async_postgresql_user_repository import AsyncPostgresqlUserRepository
+
+class TestAsyncPostgresqlUserRepository:
+    @pytest.mark.asyncio
+    async def test_save_and_find_by_email_success(self, test_session, TestingAsyncSessionLocal, sample_user):
+        async with TestingAsyncSessionLocal() as session:
+            # Given
+            repository = AsyncPostgresqlUserRepository(session)
+            saved_user = await repository.save(sample_user)
+
+            # When
+            found_user = await repository.find_by_email(str(sample_user.email))
+
+            # Then
+            assert found_user is not None
+            assert found_user.id == saved_user.id
+            assert found_user.name == sample_user.name
+
+    @pytest.mark.asyncio
+    async def test_find_by_email_not_found(self, test_session, TestingAsyncSessionLocal):
+        async with TestingAsyncSessionLocal() as session:
+            # When
+            found_user = await AsyncPostgresqlUserRepository(session).find_by_email("nonexistent@example.com")
+
+            # Then
+            assert found_user is None
@@ -0,0 +1,79 @@
+import threading
+import time
+import pytest
+from loguru import logger
+from sqlalchemy import create_engine, text
+from src.shared.infrastructure.metrics import instrumentation
+from src.shared.infrastructure.metrics.instrumentation import (
+    InstrumentedQueuePool,
+    db_pool_invalidations,
+    db_pool_wait,
+    instrument_engine
+)
+
+def sample_value(metric, name: str, **labels) -> float:
+    for sample in metric.collect().samples:
+        if sample.name == name and sample.labels == labels:
+            return sample.value
+    return 0
+
+class TestPoolInstrumentation:
+    @pytest.fixture
+    def pool_engine(self, tmp_path):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=5,
+            pool_pre_ping=True,
+            poolclass=InstrumentedQueuePool
+        )
+        instrument_engine(engine, "sync")
+        yield engine
+        engine.dispose()
+
+    def test_records_pre_ping_failures(self, pool_engine, monkeypatch):
+        # Given a pooled connection that fails its next ping, as after a database restart
+        before = sample_value(db_pool_invalidations, "db_pool_invalidations_total", engine="sync", reason="pre_ping")
+        with pool_engine.connect():
+            pass
+        monkeypatch.setattr(pool_engine.dialect, "do_ping", lambda dbapi_connection: False)
+
+        # When
+        with pool_engine.connect() as connection:
+            result = connection.execute(text("SELECT 1")).scalar()
+
+        # Then
+        assert result == 1
+        after = sample_value(db_pool_invalidations, "db_pool_invalidations_total", engine="sync", reason="pre_ping")
+        assert after == before + 1
+
+    def test_warns_when_checkouts_wait_for_a_connection(self, pool_engine, monkeypatch):
+        # Given the only connection held by another thread for a while
+        monkeypatch.setattr(instrumentation.settings, "DB_POOL_WAIT_WARNING_SECONDS", 0.05)
+        monkeypatch.setattr(InstrumentedQueuePool, "_last_warning", 0.0)
+        messages = []
+        handler_id = logger.add(messages.append, level="WARNING", format="{message}")
+        waits_before = sample_value(db_pool_wait, "db_pool_wait_seconds_count", engine="sync")
+        held = threading.Event()
+
+        def hold_connection():
+            with pool_engine.connect():
+                held.set()
+                time.sleep(0.2)
+
+        holder = threading.Thread(target=hold_connection)
+        holder.start()
+        held.wait()
+
+        # When
+        try:
+            with pool_engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        finally:
+            holder.join()
+            logger.remove(handler_id)
+
+        # Then
+        assert sample_value(db_pool_wait, "db_pool_wait_seconds_count", engine="sync") == waits_before + 2
+        assert any("requests are queueing" in message for message in messages)
@@ -1,7 +1,19 @@
 import pytest
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from sqlalchemy import event
+from src.order.application.dto.order_dto import OrderResponseDTO
 from src.order.domain.model.order import Order, OrderItem
+from src.order.domain.model.sales_bucket import SalesBucket
+from src.order.infrastructure.persistence.models import (
+    OrderItemModel,
+    ProductModel,
+    ProductSalesDailyModel,
+    ProductSalesSketchModel,
+    ProductSalesSketchMonthModel,
+    WaiterSalesDailyModel
+)
 from src.order.infrastructure.persistence.postgresql_order_repository import PostgresqlOrderRepository
 from src.shared.domain.value_objects import Money
 
@@ -55,6 +67,22 @@ class TestPostgresqlOrderRepository:
         assert saved_order.items[0].unit_price.amount == order.items[0].unit_price.amount
         assert saved_order.items[0].quantity == order.items[0].quantity
 
+    def test_save_order_statement_count(self, order_repository, sample_order, statement_counter):
+        # Given
+        # The first save upserts the unknown product names and caches their ids
+        order_repository.save(sample_order)
+        assert statement_counter.count == 5
+        statement_counter.reset()
+
+        # When
+        order_repository.save(sample_order)
+
+        # Then
+        # INSERT orders ... RETURNING, INSERT order_items ... RETURNING, product and waiter rollup upserts;
+        # the top products sketch is rebuilt by a periodic job, never on the write path
+        assert statement_counter.count == 4
+        assert not any("product_sales_sketch" in s for s in statement_counter.statements)
+
     def test_find_by_id_success(self, order_repository, sample_order):
         # Given
         saved_order = order_repository.save(sample_order)
@@ -88,6 +116,51 @@ class TestPostgresqlOrderRepository:
         assert len(orders) == 1
         assert orders[0].id == saved_order.id
 
+    def test_find_by_id_statement_count(self, order_repository, sample_order, statement_counter):
+        # Given
+        saved_order = order_repository.save(sample_order)
+        statement_counter.reset()
+
+        # When
+        found_order = order_repository.find_by_id(saved_order.id)
+
+        # Then
+        assert len(found_order.items) == 2
+        assert statement_counter.count == 1
+
+    def test_find_by_date_range_has_no_n_plus_one(self, order_repository, sample_order, statement_counter):
+        # Given
+        order_repository.save_many([sample_order] * 5)
+        start_date = datetime.now() - timedelta(days=1)
+        end_date = datetime.now() + timedelta(days=1)
+        statement_counter.reset()
+
+        # When
+        orders = order_repository.find_by_date_range(start_date, end_date)
+
+        # Then
+        assert len(orders) == 5
+        assert all(len(order.items) == 2 for order in orders)
+        # One query for the orders plus one for all their items
+        assert statement_counter.count == 2
+
+    def test_find_by_date_range_loads_items_per_batch(self, test_session, sample_order, statement_counter):
+        # Given
+        order_repository = PostgresqlOrderRepository(test_session, batch_size=2)
+        saved_orders = order_repository.save_many([sample_order] * 5)
+        start_date = datetime.now() - timedelta(days=1)
+        end_date = datetime.now() + timedelta(days=1)
+        statement_counter.reset()
+
+        # When
+        orders = order_repository.find_by_date_range(start_date, end_date)
+
+        # Then
+        assert [o.id for o in orders] == [o.id for o in saved_orders]
+        assert all(len(order.items) == 2 for order in orders)
+        # One query for the orders plus one items query per batch of 2
+        assert statement_counter.count == 4
+
     def test_get_product_sales_report_success(self, order_repository, sample_order):
         # Given
         order_repository.save(sample_order)
@@ -107,3 +180,484 @@ class TestPostgresqlOrderRepository:
         assert report[1]["product_name"] == "Test Product 2"
         assert report[1]["total_quantity"] == 1
         assert report[1]["total_price"] == Decimal("15.00")
+
+    def test_save_updates_daily_sales_rollup(self, order_repository, test_session, sample_order):
+        # Given
+        order_repository.save(sample_order)
+
+        # When
+        order_repository.save(sample_order)
+
+        # Then
+        rows = {
+            name: r
+            for r, name in test_session.query(ProductSalesDailyModel, ProductModel.name).join(ProductModel)
+        }
+        assert len(rows) == 2
+        assert rows["Test Product 1"].day == sample_order.created_at.date()
+        assert rows["Test Product 1"].total_quantity == 4
+        assert rows["Test Product 1"].total_price == Decimal("40.00")
+        assert rows["Test Product 2"].total_quantity == 2
+        assert rows["Test Product 2"].total_price == Decimal("30.00")
+
+    def test_save_interns_product_names(self, order_repository, test_session, sample_order):
+        # Given
+        order_repository.save(sample_order)
+
+        # When
+        order_repository.save(self._order_at(datetime(2024, 1, 1), ("Test Product 1", 1), ("Coffee", 1)))
+
+        # Then
+        products = dict(test_session.query(ProductModel.name, ProductModel.id))
+        assert set(products) == {"Test Product 1", "Test Product 2", "Coffee"}
+        item_product_ids = {r.product_id for r in test_session.query(OrderItemModel)}
+        assert item_product_ids == set(products.values())
+
+    def test_save_binds_created_at_as_naive_utc(self, order_repository, test_engine):
+        # Given
+        bound = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith(("INSERT INTO ORDERS", "INSERT INTO ORDER_ITEMS")):
+                bound.extend(p['created_at'] for p in context.compiled_parameters)
+
+        created_at = datetime(2024, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=-3)))
+        event.listen(test_engine, "before_cursor_execute", record)
+
+        # When
+        try:
+            order_repository.save(self._order_at(created_at, ("Test Product", 1), ("Coffee", 2)))
+        finally:
+            event.remove(test_engine, "before_cursor_execute", record)
+
+        # Then
+        assert len(bound) == 3
+        assert all(value == datetime(2024, 1, 1, 15, 0) and value.tzinfo is None for value in bound)
+
+    def test_save_upserts_rollup_rows_in_key_order(self, order_repository, test_engine):
+        # Given
+        upserts = {}
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            for table in ("product_sales_daily", "waiter_sales_daily"):
+                if statement.lstrip().upper().startswith(f"INSERT INTO {table.upper()}"):
+                    upserts[table] = parameters
+
+        order_repository.save(self._order_at(datetime(2024, 1, 1), ("Coffee", 1), ("Tea", 1)))
+        orders = [
+            replace(self._order_at(datetime(2024, 1, 2), ("Tea", 1), ("Coffee", 1)), waiter_id=waiter_id)
+            for waiter_id in (2, 1)
+        ]
+        event.listen(test_engine, "before_cursor_execute", record)
+
+        # When
+        try:
+            order_repository.save_many(orders)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", record)
+
+        # Then
+        product_ids = list(upserts["product_sales_daily"][0::4])
+        waiter_ids = list(upserts["waiter_sales_daily"][0::5])
+        assert product_ids == sorted(product_ids) and len(product_ids) == 2
+        assert waiter_ids == [1, 2]
+
+    def test_save_copies_order_created_at_to_items(self, order_repository, test_session):
+        # Given
+        created_at = datetime(2024, 3, 31, 23, 59)
+
+        # When
+        order_repository.save(self._order_at(created_at, ("Test Product", 1), ("Coffee", 2)))
+
+        # Then
+        assert {r.created_at for r in test_session.query(OrderItemModel)} == {created_at}
+
+    def test_find_by_date_range_loads_items_of_orders_at_range_edges(self, order_repository):
+        # Given
+        order_repository.save(self._order_at(datetime(2024, 1, 1, 0, 0), ("Test Product", 1)))
+        order_repository.save(self._order_at(datetime(2024, 1, 31, 23, 59), ("Test Product", 2), ("Coffee", 1)))
+
+        # When
+        orders = order_repository.find_by_date_range(datetime(2024, 1, 1, 0, 0), datetime(2024, 1, 31, 23, 59))
+
+        # Then
+        assert [len(order.items) for order in orders] == [1, 2]
+
+    def test_get_product_sales_report_combines_rollup_and_partial_days(self, order_repository):
+        # Given
+        def order_at(created_at, quantity):
+            return Order(
+                customer_name="Test Customer",
+                items=[
+                    OrderItem(
+                        product_name="Test Product",
+                        unit_price=Money(amount=Decimal("10.00")),
+                        quantity=quantity
+                    )
+                ],
+                waiter_id=1,
+                created_at=created_at
+            )
+
+        order_repository.save(order_at(datetime(2024, 1, 1, 8, 0), 1))    # before range
+        order_repository.save(order_at(datetime(2024, 1, 1, 18, 0), 2))   # partial first day
+        order_repository.save(order_at(datetime(2024, 1, 2, 12, 0), 4))   # full day
+        order_repository.save(order_at(datetime(2024, 1, 3, 9, 0), 8))    # partial last day
+        order_repository.save(order_at(datetime(2024, 1, 3, 20, 0), 16))  # after range
+
+        # When
+        report = order_repository.get_product_sales_report(
+            datetime(2024, 1, 1, 12, 0),
+            datetime(2024, 1, 3, 12, 0)
+        )
+
+        # Then
+        assert len(report) == 1
+        assert report[0]["product_name"] == "Test Product"
+        assert report[0]["total_quantity"] == 14
+        assert report[0]["total_price"] == Decimal("140.00")
+
+    @staticmethod
+    def _order_at(created_at, *items):
+        return Order(
+            customer_name="Test Customer",
+            items=[
+                OrderItem(product_name=name, unit_price=Money(amount=Decimal("10.00")), quantity=quantity)
+                for name, quantity in items
+            ],
+            waiter_id=1,
+            created_at=created_at
+        )
+
+    def test_get_product_sales_report_applies_limit_and_min_quantity(self, order_repository, statement_counter):
+        # Given
+        order_repository.save(self._order_at(datetime(2024, 1, 1, 18, 0), ("Coffee", 3), ("Tea", 2), ("Juice", 1)))
+        order_repository.save(self._order_at(datetime(2024, 1, 2, 12, 0), ("Tea", 1), ("Water", 3)))
+        statement_counter.reset()
+
+        # When
+        report = order_repository.get_product_sales_report(
+            datetime(2024, 1, 1, 12, 0),
+            datetime(2024, 1, 3, 12, 0),
+            limit=2,
+            min_quantity=2
+        )
+
+        # Then
+        # Ties are broken by product name
+        assert [(r["product_name"], r["total_quantity"]) for r in report] == [("Coffee", 3), ("Tea", 3)]
+        assert report[1]["total_price"] == Decimal("30.00")
+        # Rollup and partial days are combined, filtered and cut by the database
+        assert statement_counter.count == 1
+
+    def test_refresh_sales_sketch_keeps_top_products_of_ended_months(self, test_session):
+        # Given
+        order_repository = PostgresqlOrderRepository(test_session, sketch_capacity=2)
+        order_repository.save(self._order_at(datetime(2024, 1, 5), ("Coffee", 10), ("Tea", 5)))
+        order_repository.save(self._order_at(datetime(2024, 1, 6), ("Juice", 1), ("Water", 1)))
+        order_repository.save(self._order_at(datetime(2024, 3, 5), ("Juice", 7)))  # current month
+
+        # When
+        refreshed = order_repository.refresh_sales_sketch(now=datetime(2024, 3, 10))
+
+        # Then
+        assert refreshed == [date(2024, 1, 1), date(2024, 2, 1)]
+        counters = {
+            (r.month, name): (r.total_quantity, r.total_price)
+            for r, name in test_session.query(ProductSalesSketchModel, ProductModel.name).join(ProductModel)
+        }
+        assert counters == {
+            (date(2024, 1, 1), "Coffee"): (10, Decimal("100.00")),
+            (date(2024, 1, 1), "Tea"): (5, Decimal("50.00"))
+        }
+        month = test_session.get(ProductSalesSketchMonthModel, date(2024, 1, 1))
+        assert month.floor_quantity == 1
+        assert month.refreshed_at == datetime(2024, 3, 10)
+        # Months rebuilt after they ended are final
+        assert order_repository.refresh_sales_sketch(now=datetime(2024, 3, 20)) == []
+
+    def test_get_approximate_product_sales_report_bounds_error(self, test_session):
+        # Given
+        order_repository = PostgresqlOrderRepository(test_session, sketch_capacity=2)
+        order_repository.save(self._order_at(datetime(2024, 1, 5), ("Coffee", 10), ("Tea", 5)))
+        order_repository.save(self._order_at(datetime(2024, 1, 6), ("Juice", 1)))  # below the top 2
+        order_repository.save(self._order_at(datetime(2024, 2, 5), ("Coffee", 3), ("Tea", 4)))
+        order_repository.save(self._order_at(datetime(2024, 3, 1, 10, 0), ("Tea", 2), ("Juice", 1)))  # partial last month
+        order_repository.save(self._order_at(datetime(2024, 3, 1, 18, 0), ("Juice", 50)))  # after range
+        order_repository.refresh_sales_sketch(now=datetime(2024, 3, 2))
+        true_totals = {"Coffee": 13, "Tea": 11, "Juice": 2}
+
+        # When
+        report = order_repository.get_approximate_product_sales_report(
+            datetime(2024, 1, 1),
+            datetime(2024, 3, 1, 12, 0),
+            limit=3
+        )
+
+        # Then
+        assert [(r["product_name"], r["total_quantity"], r["max_error"]) for r in report] == [
+            ("Coffee", 13, 0),
+            ("Tea", 11, 0),
+            ("Juice", 1, 1)
+        ]
+        for r in report:
+            assert abs(true_totals[r["product_name"]] - r["total_quantity"]) <= r["max_error"]
+
+    def test_get_approximate_product_sales_report_aggregates_months_not_rebuilt(self, test_session):
+        # Given
+        order_repository = PostgresqlOrderRepository(test_session, sketch_capacity=1)
+        order_repository.save(self._order_at(datetime(2024, 1, 5), ("Coffee", 2), ("Tea", 1)))
+        order_repository.save(self._order_at(datetime(2024, 1, 25), ("Tea", 5)))
+        # A sketch rebuilt while January was still running is not final
+        coffee_id = test_session.query(ProductModel.id).filter_by(name="Coffee").scalar()
+        test_session.add(ProductSalesSketchMonthModel(
+            month=date(2024, 1, 1), floor_quantity=1, refreshed_at=datetime(2024, 1, 20)
+        ))
+        test_session.add(ProductSalesSketchModel(
+            month=date(2024, 1, 1), product_id=coffee_id, total_quantity=2, total_price=Decimal("20.00")
+        ))
+        test_session.commit()
+
+        # When
+        report = order_repository.get_approximate_product_sales_report(
+            datetime(2024, 1, 1),
+            datetime(2024, 2, 1),
+            limit=2
+        )
+
+        # Then
+        assert [(r["product_name"], r["total_quantity"], r["max_error"]) for r in report] == [
+            ("Tea", 6, 0),
+            ("Coffee", 2, 0)
+        ]
+
+    def test_get_approximate_product_sales_report_within_a_month_is_exact(self, order_repository):
+        # Given
+        order_repository.save(self._order_at(datetime(2024, 1, 5), ("Coffee", 2), ("Tea", 1)))
+
+        # When
+        report = order_repository.get_approximate_product_sales_report(
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+            limit=1
+        )
+
+        # Then
+        assert report == [
+            {"product_name": "Coffee", "total_quantity": 2, "total_price": Decimal("20.00")}
+        ]
+
+    def test_save_updates_waiter_sales_rollup(self, order_repository, test_session, sample_order):
+        # Given
+        order_repository.save(sample_order)
+
+        # When
+        order_repository.save_many([sample_order, sample_order])
+
+        # Then
+        row = test_session.query(WaiterSalesDailyModel).one()
+        assert row.waiter_id == sample_order.waiter_id
+        assert row.day == sample_order.created_at.date()
+        assert row.order_count == 3
+        assert row.items_sold == 9
+        assert row.total_price == Decimal("105.00")
+
+    def test_get_waiter_sales_report_combines_rollup_and_partial_days(self, order_repository, statement_counter):
+        # Given
+        def order_at(created_at, waiter_id, quantity):
+            order = self._order_at(created_at, ("Coffee", quantity))
+            return replace(order, waiter_id=waiter_id)
+
+        order_repository.save(order_at(datetime(2024, 1, 1, 8, 0), 1, 1))    # before range
+        order_repository.save(order_at(datetime(2024, 1, 1, 18, 0), 1, 2))   # partial first day
+        order_repository.save(order_at(datetime(2024, 1, 2, 12, 0), 2, 4))   # full day
+        order_repository.save(order_at(datetime(2024, 1, 2, 13, 0), 1, 1))   # full day
+        order_repository.save(order_at(datetime(2024, 1, 3, 9, 0), 1, 3))    # partial last day
+        order_repository.save(order_at(datetime(2024, 1, 3, 20, 0), 2, 16))  # after range
+        statement_counter.reset()
+
+        # When
+        report = order_repository.get_waiter_sales_report(
+            datetime(2024, 1, 1, 12, 0),
+            datetime(2024, 1, 3, 12, 0)
+        )
+
+        # Then
+        assert report == [
+            {"waiter_id": 1, "order_count": 3, "items_sold": 6, "total_price": Decimal("60.00")},
+            {"waiter_id": 2, "order_count": 1, "items_sold": 4, "total_price": Decimal("40.00")}
+        ]
+        assert statement_counter.count == 1
+
+    @pytest.fixture
+    def series_orders(self, order_repository):
+        def order_at(created_at, *items):
+            return Order(
+                customer_name="Test Customer",
+                items=[
+                    OrderItem(product_name=name, unit_price=Money(amount=Decimal("10.00")), quantity=quantity)
+                    for name, quantity in items
+                ],
+                waiter_id=1,
+                created_at=created_at
+            )
+
+        # 2024-01-01 is a Monday
+        order_repository.save(order_at(datetime(2024, 1, 1, 8, 15), ("Coffee", 1), ("Tea", 2)))
+        order_repository.save(order_at(datetime(2024, 1, 1, 8, 45), ("Coffee", 3)))
+        order_repository.save(order_at(datetime(2024, 1, 2, 9, 0), ("Coffee", 4)))
+        order_repository.save(order_at(datetime(2024, 1, 8, 0, 0), ("Tea", 8)))
+        order_repository.save(order_at(datetime(2024, 1, 9, 0, 0), ("Tea", 16)))  # after range
+
+    @pytest.mark.parametrize("bucket,expected", [
+        (SalesBucket.HOUR, [
+            (datetime(2024, 1, 1, 8), 6),
+            (datetime(2024, 1, 2, 9), 4),
+            (datetime(2024, 1, 8, 0), 8)
+        ]),
+        (SalesBucket.DAY, [
+            (datetime(2024, 1, 1), 6),
+            (datetime(2024, 1, 2), 4),
+            (datetime(2024, 1, 8), 8)
+        ]),
+        (SalesBucket.WEEK, [
+            (datetime(2024, 1, 1), 10),
+            (datetime(2024, 1, 8), 8)
+        ])
+    ])
+    def test_get_sales_series_groups_by_bucket(self, order_repository, series_orders, bucket, expected):
+        # When
+        series = order_repository.get_sales_series(datetime(2024, 1, 1), datetime(2024, 1, 8, 12), bucket)
+
+        # Then
+        assert [(p["bucket_start"], p["total_quantity"]) for p in series] == expected
+        assert all(p["product_name"] is None for p in series)
+        assert series[-1]["total_price"] == Decimal("80.00")
+
+    def test_get_sales_series_by_product(self, order_repository, series_orders, statement_counter):
+        # When
+        series = order_repository.get_sales_series(
+            datetime(2024, 1, 1), datetime(2024, 1, 8, 12), SalesBucket.WEEK, by_product=True
+        )
+
+        # Then
+        assert [(p["bucket_start"], p["product_name"], p["total_quantity"]) for p in series] == [
+            (datetime(2024, 1, 1), "Coffee", 8),
+            (datetime(2024, 1, 1), "Tea", 2),
+            (datetime(2024, 1, 8), "Tea", 8)
+        ]
+        assert statement_counter.count == 1
+
+    def test_save_many_success(self, order_repository, test_session, sample_order):
+        # Given
+        other_order = Order.create(
+            customer_name="Other Customer",
+            items=[
+                OrderItem(
+                    product_name="Test Product 1",
+                    unit_price=Money(amount=Decimal("10.00")),
+                    quantity=3
+                )
+            ],
+            waiter_id=1
+        )
+
+        # When
+        saved_orders = order_repository.save_many([sample_order, other_order])
+
+        # Then
+        assert len(saved_orders) == 2
+        assert saved_orders[0].id is not None
+        assert saved_orders[1].id is not None
+        assert saved_orders[0].id != saved_orders[1].id
+        assert saved_orders[1].customer_name == "Other Customer"
+        assert all(item.id is not None for order in saved_orders for item in order.items)
+
+        found_order = order_repository.find_by_id(saved_orders[0].id)
+        assert len(found_order.items) == 2
+
+        rollup = test_session.query(ProductSalesDailyModel).join(ProductModel).filter(
+            ProductModel.name == "Test Product 1"
+        ).one()
+        assert rollup.total_quantity == 5
+        assert rollup.total_price == Decimal("50.00")
+
+    def test_save_many_empty(self, order_repository):
+        # When/Then
+        assert order_repository.save_many([]) == []
+
+    def test_find_page_uses_keyset(self, order_repository, sample_order):
+        # Given
+        saved_orders = order_repository.save_many([sample_order] * 5)
+        start_date = datetime.now() - timedelta(days=1)
+        end_date = datetime.now() + timedelta(days=1)
+
+        # When
+        first_page = order_repository.find_page(start_date, end_date, limit=2)
+        last = first_page[-1]
+        second_page = order_repository.find_page(
+            start_date, end_date, limit=2, after=(last.created_at, last.id)
+        )
+
+        # Then
+        assert [o.id for o in first_page] == [o.id for o in saved_orders[:2]]
+        assert [o.id for o in second_page] == [o.id for o in saved_orders[2:4]]
+        assert len(second_page[0].items) == 2
+
+    def test_find_page_normalizes_aware_cursor_to_utc(self, order_repository, sample_order):
+        # Given
+        saved_orders = order_repository.save_many([
+            replace(sample_order, created_at=datetime(2024, 1, 1, hour))
+            for hour in (10, 11, 12)
+        ])
+        after = (datetime(2024, 1, 1, 8, 0, tzinfo=timezone(timedelta(hours=-3))), saved_orders[1].id)
+
+        # When
+        page = order_repository.find_page(datetime(2024, 1, 1), datetime(2024, 1, 2), limit=10, after=after)
+
+        # Then
+        assert [o.id for o in page] == [saved_orders[2].id]
+
+    def test_find_page_rows_matches_entity_path(self, order_repository, sample_order, statement_counter):
+        # Given
+        order_repository.save_many([sample_order] * 3)
+        start_date = datetime.now() - timedelta(days=1)
+        end_date = datetime.now() + timedelta(days=1)
+        statement_counter.reset()
+
+        # When
+        rows = order_repository.find_page_rows(start_date, end_date, limit=2)
+
+        # Then
+        # One query for the orders plus one for their items
+        assert statement_counter.count == 2
+        entities = order_repository.find_page(start_date, end_date, limit=2)
+        assert [OrderResponseDTO.from_row(r).model_dump() for r in rows] == [
+            OrderResponseDTO.from_entity(o).model_dump() for o in entities
+        ]
+
+    def test_find_row_by_id(self, order_repository, sample_order):
+        # Given
+        saved_order = order_repository.save(sample_order)
+
+        # When
+        row = order_repository.find_row_by_id(saved_order.id)
+
+        # Then
+        assert row["id"] == saved_order.id
+        assert row["total_price"] == saved_order.total_price.amount
+        assert len(row["items"]) == 2
+        assert order_repository.find_row_by_id(999) is None
+
+    def test_iter_by_date_range_yields_orders(self, order_repository, sample_order):
+        # Given
+        order_repository.save_many([sample_order] * 3)
+        start_date = datetime.now() - timedelta(days=1)
+        end_date = datetime.now() + timedelta(days=1)
+
+        # When
+        orders = order_repository.iter_by_date_range(start_date, end_date)
+
+        # Then
+        assert next(orders).customer_name == "Test Customer"
+        assert len(list(orders)) == 2
@@ -36,3 +36,14 @@ class TestPostgresqlUserRepository:
 
         # Then
         assert found_user is None
+
+    def test_find_by_id_success(self, user_repository, sample_user):
+        # Given
+        saved_user = user_repository.save(sample_user)
+
+        # When
+        found_user = user_repository.find_by_id(saved_user.id)
+
+        # Then
+        assert found_user is not None
+        assert str(found_user.email) == str(saved_user.email)
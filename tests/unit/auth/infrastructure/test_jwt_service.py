@@ -1,9 +1,16 @@
 import pytest
 from datetime import datetime, timedelta
 from jose import jwt
-from src.auth.infrastructure.jwt_service import JWTService
+from src.auth.infrastructure import jwt_service
+from src.auth.infrastructure.jwt_service import JWTService, token_cache
 
 class TestJWTService:
+    @pytest.fixture(autouse=True)
+    def clear_token_cache(self):
+        token_cache.clear()
+        yield
+        token_cache.clear()
+
     def test_create_access_token_success(self):
         # Given
         data = {"sub": "test@example.com", "user_id": 1}
@@ -69,4 +76,44 @@ class TestJWTService:
     def test_create_token_without_required_fields_fails(self):
         # When/Then
         with pytest.raises(ValueError, match="Token must include 'sub' and 'user_id'"):
-            JWTService.create_access_token({"foo": "bar"}) 
\ No newline at end of file
+            JWTService.create_access_token({"foo": "bar"}) 
+
+    def test_verify_token_is_cached_until_exp(self, mocker):
+        # Given
+        token = JWTService.create_access_token({"sub": "test@example.com", "user_id": 1})
+        decode = mocker.spy(jwt_service.jwt, "decode")
+        cache_set = mocker.spy(token_cache, "set")
+
+        # When
+        first = JWTService.verify_token(token)
+        second = JWTService.verify_token(token)
+
+        # Then
+        assert first == second
+        assert decode.call_count == 1
+        ttl = cache_set.call_args.kwargs["ttl"]
+        assert abs(first["exp"] - jwt_service.time.time() - ttl) < 1
+        assert token_cache.stats()["hits"] == 1
+
+    def test_verify_token_returns_copy_of_cached_payload(self):
+        # Given
+        token = JWTService.create_access_token({"sub": "test@example.com", "user_id": 1})
+        JWTService.verify_token(token)["sub"] = "tampered@example.com"
+
+        # When
+        payload = JWTService.verify_token(token)
+
+        # Then
+        assert payload["sub"] == "test@example.com"
+
+    def test_invalid_token_is_not_cached(self):
+        # Given
+        token = jwt.encode({"sub": "test@example.com"}, "wrong_secret", algorithm=JWTService.ALGORITHM)
+
+        # When
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                JWTService.verify_token(token)
+
+        # Then
+        assert len(token_cache) == 0
@@ -0,0 +1,54 @@
+import pytest
+from src.auth.infrastructure.revocation_list import RevocationList
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestRevocationList:
+    @pytest.fixture
+    def timer(self):
+        return FakeTimer()
+
+    def test_tokens_older_than_user_version_are_revoked(self, timer):
+        # Given
+        revocations = RevocationList(refresh_seconds=30, timer=timer)
+        revocations.replace({1: 2})
+
+        # When/Then
+        assert revocations.is_revoked(1, 1)
+        assert not revocations.is_revoked(1, 2)
+        assert not revocations.is_revoked(2, 0)
+
+    @pytest.mark.asyncio
+    async def test_refresh_only_when_stale(self, timer, mocker):
+        # Given
+        revocations = RevocationList(refresh_seconds=30, timer=timer)
+        loader = mocker.AsyncMock(return_value={1: 1})
+
+        # When
+        await revocations.refresh_if_stale(loader)
+        timer.now = 29
+        await revocations.refresh_if_stale(loader)
+        timer.now = 30
+        await revocations.refresh_if_stale(loader)
+
+        # Then
+        assert loader.await_count == 2
+        assert revocations.is_revoked(1, 0)
+
+    def test_local_revocation_survives_older_refresh(self, timer):
+        # Given
+        revocations = RevocationList(refresh_seconds=30, timer=timer)
+        revocations.revoke(1, 3)
+
+        # When
+        revocations.replace({1: 2, 2: 1})
+
+        # Then
+        assert revocations.is_revoked(1, 2)
+        assert revocations.is_revoked(2, 0)
+        assert len(revocations) == 2
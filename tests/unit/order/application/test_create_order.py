@@ -9,7 +9,7 @@ from src.shared.domain.value_objects import Money
 class TestCreateOrderCommand:
     @pytest.fixture
     def order_service(self, mocker):
-        service = mocker.Mock()
+        service = mocker.AsyncMock()
         service.create_order.return_value = Order(
             id=1,
             customer_name="Test Customer",
@@ -28,11 +28,12 @@ class TestCreateOrderCommand:
 
     @pytest.fixture
     def user_service(self, mocker):
-        service = mocker.Mock()
+        service = mocker.AsyncMock()
         service.get_user_id_by_email.return_value = 1
         return service
 
-    def test_execute_success(self, order_service, user_service):
+    @pytest.mark.asyncio
+    async def test_execute_success(self, order_service, user_service):
         # Given
         command = CreateOrderCommand(order_service, user_service)
         order_data = CreateOrderDTO(
@@ -47,9 +48,32 @@ class TestCreateOrderCommand:
         )
         
         # When
-        result = command.execute(order_data, "test@example.com")
+        result = await command.execute(order_data, "test@example.com")
         
         # Then
         assert isinstance(result, OrderResponseDTO)
-        user_service.get_user_id_by_email.assert_called_once_with("test@example.com")
-        order_service.create_order.assert_called_once()
+        user_service.get_user_id_by_email.assert_awaited_once_with("test@example.com")
+        order_service.create_order.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_with_resolved_waiter_skips_lookup(self, order_service, user_service):
+        # Given
+        command = CreateOrderCommand(order_service, user_service)
+        order_data = CreateOrderDTO(
+            customer_name="Test Customer",
+            items=[
+                OrderItemDTO(
+                    product_name="Test Product",
+                    unit_price=Decimal("10.00"),
+                    quantity=2
+                )
+            ]
+        )
+
+        # When
+        result = await command.execute(order_data, "test@example.com", waiter_id=1)
+
+        # Then
+        assert isinstance(result, OrderResponseDTO)
+        user_service.get_user_id_by_email.assert_not_awaited()
+        order_service.create_order.assert_awaited_once()
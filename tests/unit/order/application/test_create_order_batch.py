@@ -0,0 +1,56 @@
+import pytest
+from src.order.application.create_order_batch import CreateOrderBatchCommand
+from src.order.application.dto.order_dto import CreateOrderBatchDTO
+
+class TestCreateOrderBatchCommand:
+    @pytest.fixture
+    def order_service(self, mocker, mock_order):
+        service = mocker.AsyncMock()
+        service.create_orders.side_effect = lambda orders: [mock_order for _ in orders]
+        return service
+
+    @pytest.fixture
+    def valid_order(self):
+        return {
+            "customer_name": "Test Customer",
+            "items": [{"product_name": "Test Product", "unit_price": "10.00", "quantity": 2}]
+        }
+
+    @pytest.mark.asyncio
+    async def test_execute_saves_valid_orders_and_reports_invalid(self, order_service, valid_order):
+        # Given
+        command = CreateOrderBatchCommand(order_service)
+        batch = CreateOrderBatchDTO(orders=[
+            {"customer_name": "Test Customer", "items": [
+                {"product_name": "Test Product", "unit_price": "0", "quantity": 1}
+            ]},
+            valid_order,
+            {"customer_name": "  ", "items": valid_order["items"]}
+        ])
+
+        # When
+        result = await command.execute(batch, waiter_id=1)
+
+        # Then
+        assert result.created == 1
+        assert result.failed == 2
+        assert [r.success for r in result.results] == [False, True, False]
+        assert "greater than 0" in result.results[0].error
+        assert "Customer name" in result.results[2].error
+        saved_orders = order_service.create_orders.await_args.args[0]
+        assert len(saved_orders) == 1
+        assert saved_orders[0].waiter_id == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_all_invalid_saves_nothing(self, order_service):
+        # Given
+        command = CreateOrderBatchCommand(order_service)
+        batch = CreateOrderBatchDTO(orders=[{"items": []}])
+
+        # When
+        result = await command.execute(batch, waiter_id=1)
+
+        # Then
+        assert result.created == 0
+        assert result.failed == 1
+        order_service.create_orders.assert_awaited_once_with([])
@@ -0,0 +1,38 @@
+import pytest
+from decimal import Decimal
+from src.order.application.get_order import GetOrderQuery
+from src.shared.domain.exceptions import EntityNotFoundException
+
+class TestGetOrderQuery:
+    @pytest.mark.asyncio
+    async def test_execute_returns_order(self, mocker, mock_order):
+        # Given
+        mock_service = mocker.AsyncMock()
+        mock_service.get_order_row.return_value = {
+            "id": mock_order.id,
+            "customer_name": mock_order.customer_name,
+            "items": [{"product_name": "Test Product", "unit_price": Decimal("10.00"), "quantity": 2}],
+            "total_price": Decimal("20.00"),
+            "waiter_id": mock_order.waiter_id,
+            "created_at": mock_order.created_at
+        }
+        query = GetOrderQuery(mock_service)
+
+        # When
+        order = await query.execute(mock_order.id)
+
+        # Then
+        mock_service.get_order_row.assert_awaited_once_with(mock_order.id)
+        assert order.id == mock_order.id
+        assert order.total_price == Decimal("20.00")
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_when_order_missing(self, mocker):
+        # Given
+        mock_service = mocker.AsyncMock()
+        mock_service.get_order_row.return_value = None
+        query = GetOrderQuery(mock_service)
+
+        # When / Then
+        with pytest.raises(EntityNotFoundException):
+            await query.execute(999)
@@ -2,6 +2,7 @@ import pytest
 from datetime import datetime, timedelta
 from decimal import Decimal
 from src.order.application.get_sales_report import GetSalesReportQuery
+from src.shared.domain.exceptions import ValidationException
 from src.shared.domain.value_objects import DateTimeRange
 
 class TestGetSalesReportQuery:
@@ -22,22 +23,59 @@ class TestGetSalesReportQuery:
             }
         ]
 
-    def test_execute_success(self, mocker, date_range, mock_report):
+    @pytest.mark.asyncio
+    async def test_execute_success(self, mocker, date_range, mock_report):
         # Given
-        mock_service = mocker.Mock()
+        mock_service = mocker.AsyncMock()
         mock_service.get_product_sales_report.return_value = mock_report
 
         query = GetSalesReportQuery(mock_service)
 
         # When
-        result = query.execute(date_range)
+        result = await query.execute(date_range)
 
         # Then
         assert len(result) == 1
         assert result[0].product_name == mock_report[0]["product_name"]
         assert result[0].total_quantity == mock_report[0]["total_quantity"]
         assert result[0].total_price == mock_report[0]["total_price"]
-        mock_service.get_product_sales_report.assert_called_once_with(
+        mock_service.get_product_sales_report.assert_awaited_once_with(
             start_date=date_range.start_date,
-            end_date=date_range.end_date
+            end_date=date_range.end_date,
+            limit=None,
+            min_quantity=None
         )
+
+    @pytest.mark.asyncio
+    async def test_execute_approximate(self, mocker, date_range, mock_report):
+        # Given
+        mock_service = mocker.AsyncMock()
+        mock_service.get_approximate_product_sales_report.return_value = [
+            {**mock_report[0], "max_error": 3}
+        ]
+
+        query = GetSalesReportQuery(mock_service)
+
+        # When
+        result = await query.execute(date_range, limit=10, approximate=True)
+
+        # Then
+        assert result[0].max_error == 3
+        mock_service.get_approximate_product_sales_report.assert_awaited_once_with(
+            start_date=date_range.start_date,
+            end_date=date_range.end_date,
+            limit=10,
+            min_quantity=None
+        )
+        mock_service.get_product_sales_report.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_execute_approximate_requires_limit(self, mocker, date_range):
+        # Given
+        mock_service = mocker.AsyncMock()
+        query = GetSalesReportQuery(mock_service)
+
+        # When / Then
+        with pytest.raises(ValidationException):
+            await query.execute(date_range, approximate=True)
+        mock_service.get_approximate_product_sales_report.assert_not_awaited()
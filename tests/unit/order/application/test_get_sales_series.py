@@ -0,0 +1,61 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from src.order.application.get_sales_series import GetSalesSeriesQuery
+from src.order.domain.model.sales_bucket import SalesBucket
+from src.shared.domain.exceptions import ValidationException
+from src.shared.domain.value_objects import DateTimeRange
+
+class TestGetSalesSeriesQuery:
+    @pytest.fixture
+    def date_range(self):
+        return DateTimeRange(
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 8)
+        )
+
+    @pytest.fixture
+    def mock_series(self):
+        return [
+            {
+                "bucket_start": datetime(2024, 1, 1),
+                "product_name": None,
+                "total_quantity": 5,
+                "total_price": Decimal("50.00")
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_success(self, mocker, date_range, mock_series):
+        # Given
+        mock_service = mocker.AsyncMock()
+        mock_service.get_sales_series.return_value = mock_series
+
+        query = GetSalesSeriesQuery(mock_service)
+
+        # When
+        result = await query.execute(date_range, SalesBucket.DAY)
+
+        # Then
+        assert len(result) == 1
+        assert result[0].bucket_start == mock_series[0]["bucket_start"]
+        assert result[0].product_name is None
+        assert result[0].total_quantity == 5
+        assert result[0].total_price == Decimal("50.00")
+        mock_service.get_sales_series.assert_awaited_once_with(
+            start_date=date_range.start_date,
+            end_date=date_range.end_date,
+            bucket=SalesBucket.DAY,
+            by_product=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_too_many_buckets(self, mocker, date_range):
+        # Given
+        mock_service = mocker.AsyncMock()
+        query = GetSalesSeriesQuery(mock_service, max_buckets=100)
+
+        # When / Then
+        with pytest.raises(ValidationException):
+            await query.execute(date_range, SalesBucket.HOUR)
+        mock_service.get_sales_series.assert_not_awaited()
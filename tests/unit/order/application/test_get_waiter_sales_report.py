@@ -0,0 +1,35 @@
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from src.order.application.get_waiter_sales_report import GetWaiterSalesReportQuery
+from src.shared.domain.value_objects import DateTimeRange
+
+class TestGetWaiterSalesReportQuery:
+    @pytest.mark.asyncio
+    async def test_execute_success(self, mocker):
+        # Given
+        date_range = DateTimeRange(
+            start_date=datetime.now() - timedelta(hours=8),
+            end_date=datetime.now()
+        )
+        mock_service = mocker.AsyncMock()
+        mock_service.get_waiter_sales_report.return_value = [
+            {"waiter_id": 1, "order_count": 3, "items_sold": 7, "total_price": Decimal("70.00")}
+        ]
+
+        query = GetWaiterSalesReportQuery(mock_service)
+
+        # When
+        result = await query.execute(date_range, limit=5)
+
+        # Then
+        assert len(result) == 1
+        assert result[0].waiter_id == 1
+        assert result[0].order_count == 3
+        assert result[0].items_sold == 7
+        assert result[0].total_price == Decimal("70.00")
+        mock_service.get_waiter_sales_report.assert_awaited_once_with(
+            start_date=date_range.start_date,
+            end_date=date_range.end_date,
+            limit=5
+        )
@@ -0,0 +1,71 @@
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from src.order.application.list_orders import ListOrdersQuery
+from src.shared.domain.exceptions import ValidationException
+from src.shared.domain.value_objects import DateTimeRange
+
+class TestListOrdersQuery:
+    @pytest.fixture
+    def date_range(self):
+        return DateTimeRange(
+            start_date=datetime.now() - timedelta(days=7),
+            end_date=datetime.now()
+        )
+
+    @pytest.fixture
+    def order_row(self, mock_order):
+        return {
+            "id": mock_order.id,
+            "customer_name": mock_order.customer_name,
+            "items": [{"product_name": "Test Product", "unit_price": Decimal("10.00"), "quantity": 2}],
+            "total_price": Decimal("20.00"),
+            "waiter_id": mock_order.waiter_id,
+            "created_at": mock_order.created_at
+        }
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_next_cursor_when_more_orders(self, mocker, date_range, order_row):
+        # Given
+        mock_service = mocker.AsyncMock()
+        mock_service.get_orders_page_rows.return_value = [order_row, order_row]
+        query = ListOrdersQuery(mock_service)
+
+        # When
+        page = await query.execute(date_range, limit=1)
+
+        # Then
+        assert len(page.items) == 1
+        assert page.items[0].total_price == Decimal("20.00")
+        assert ListOrdersQuery.decode_cursor(page.next_cursor) == (order_row["created_at"], order_row["id"])
+        mock_service.get_orders_page_rows.assert_awaited_once_with(
+            start_date=date_range.start_date,
+            end_date=date_range.end_date,
+            limit=2,
+            after=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_last_page_has_no_cursor(self, mocker, date_range, order_row):
+        # Given
+        mock_service = mocker.AsyncMock()
+        mock_service.get_orders_page_rows.return_value = [order_row]
+        query = ListOrdersQuery(mock_service)
+        cursor = ListOrdersQuery.encode_cursor(datetime(2024, 1, 1, 12, 0), 7)
+
+        # When
+        page = await query.execute(date_range, limit=1, cursor=cursor)
+
+        # Then
+        assert len(page.items) == 1
+        assert page.next_cursor is None
+        assert mock_service.get_orders_page_rows.await_args.kwargs["after"] == (datetime(2024, 1, 1, 12, 0), 7)
+
+    @pytest.mark.asyncio
+    async def test_execute_with_invalid_cursor_fails(self, mocker, date_range):
+        # Given
+        query = ListOrdersQuery(mocker.AsyncMock())
+
+        # When/Then
+        with pytest.raises(ValidationException, match="Invalid cursor"):
+            await query.execute(date_range, limit=1, cursor="not-a-cursor")
@@ -1,5 +1,6 @@
 import pytest
 
+from datetime import datetime, timezone
 from decimal import Decimal
 from src.order.domain.model.order import Order, OrderItem
 from src.shared.domain.exceptions import ValidationException
@@ -204,3 +205,29 @@ class TestOrder:
         # Then
         assert len(order.items) == 1
         assert order.total_price.amount == Decimal("50.00")
+
+    def test_from_trusted_skips_validation_and_combining(self, sample_items):
+        # When
+        order = Order.from_trusted(
+            id=1,
+            customer_name="Test Customer",
+            items=sample_items,
+            waiter_id=1,
+            created_at=datetime.now(timezone.utc)
+        )
+
+        # Then
+        assert order.items is sample_items
+        assert order.total_price.amount == Decimal("65.00")
+
+    def test_order_and_items_are_slotted(self, sample_items):
+        # When
+        order = Order.create(
+            customer_name="Test Customer",
+            items=sample_items,
+            waiter_id=1
+        )
+
+        # Then
+        assert not hasattr(order, "__dict__")
+        assert all(not hasattr(item, "__dict__") for item in order.items)
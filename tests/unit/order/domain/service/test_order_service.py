@@ -1,7 +1,7 @@
 import pytest
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import Mock
+from unittest.mock import AsyncMock
 from src.order.domain.service.order_service import OrderService
 from src.order.domain.model.order import Order, OrderItem
 from src.shared.domain.value_objects import Money
@@ -9,7 +9,7 @@ from src.shared.domain.value_objects import Money
 class TestOrderService:
     @pytest.fixture
     def order_repository(self):
-        return Mock()
+        return AsyncMock()
 
     @pytest.fixture
     def order_service(self, order_repository):
@@ -30,7 +30,8 @@ class TestOrderService:
             }
         ]
 
-    def test_create_order_success(self, order_repository):
+    @pytest.mark.asyncio
+    async def test_create_order_success(self, order_repository):
         # Given
         service = OrderService(order_repository)
         order = Order.create(
@@ -47,13 +48,14 @@ class TestOrderService:
         order_repository.save.return_value = order
 
         # When
-        result = service.create_order(order)
+        result = await service.create_order(order)
 
         # Then
         assert isinstance(result, Order)
-        order_repository.save.assert_called_once_with(order)
+        order_repository.save.assert_awaited_once_with(order)
 
-    def test_get_product_sales_report_success(self, order_service, order_repository):
+    @pytest.mark.asyncio
+    async def test_get_product_sales_report_success(self, order_service, order_repository):
         # Given
         start_date = datetime.now() - timedelta(days=7)
         end_date = datetime.now()
@@ -68,14 +70,28 @@ class TestOrderService:
         order_repository.get_product_sales_report.return_value = expected_report
 
         # When
-        result = order_service.get_product_sales_report(
+        result = await order_service.get_product_sales_report(
             start_date=start_date,
             end_date=end_date
         )
 
         # Then
         assert result == expected_report
-        order_repository.get_product_sales_report.assert_called_once_with(
+        order_repository.get_product_sales_report.assert_awaited_once_with(
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            limit=None,
+            min_quantity=None
         )
+
+    @pytest.mark.asyncio
+    async def test_create_orders_success(self, order_service, order_repository, mock_order):
+        # Given
+        order_repository.save_many.return_value = [mock_order]
+
+        # When
+        result = await order_service.create_orders([mock_order])
+
+        # Then
+        assert result == [mock_order]
+        order_repository.save_many.assert_awaited_once_with([mock_order])
@@ -0,0 +1,121 @@
+import pytest
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
+from src.order.infrastructure.persistence.cached_order_repository import CachedOrderRepository, snap_to_bucket
+
+REPORT = [{"product_name": "Test Product", "total_quantity": 2, "total_price": 20.0}]
+
+class TestCachedOrderRepository:
+    @pytest.fixture
+    def repository(self):
+        repository = AsyncMock()
+        repository.get_product_sales_report.return_value = REPORT
+        repository.save.side_effect = lambda order: order
+        return repository
+
+    @pytest.fixture
+    def cache(self):
+        return TTLCache(maxsize=10, ttl=60)
+
+    @pytest.mark.asyncio
+    async def test_report_is_cached_per_aligned_window(self, repository, cache):
+        # Given
+        cached_repository = CachedOrderRepository(repository, cache, bucket_seconds=60)
+        start = datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 2, 10, 1, tzinfo=timezone.utc)
+
+        # When
+        first = await cached_repository.get_product_sales_report(start, end)
+        second = await cached_repository.get_product_sales_report(start, end)
+
+        # Then
+        assert first == second == REPORT
+        repository.get_product_sales_report.assert_awaited_once_with(
+            datetime(2024, 1, 1, 10, 0),
+            datetime(2024, 1, 2, 10, 1),
+            None,
+            None
+        )
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unaligned_window_is_passed_through_uncached(self, repository, cache):
+        # Given
+        cached_repository = CachedOrderRepository(repository, cache, bucket_seconds=60)
+        start = datetime(2024, 1, 1, 10, 0, 5, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 2, 10, 0, 40, tzinfo=timezone.utc)
+
+        # When
+        await cached_repository.get_product_sales_report(start, end)
+        await cached_repository.get_waiter_sales_report(start, end)
+
+        # Then
+        repository.get_product_sales_report.assert_awaited_once_with(start, end, None, None)
+        repository.get_waiter_sales_report.assert_awaited_once_with(start, end, None)
+        assert len(cache) == 0
+
+    def test_snap_to_bucket_rounds_to_utc_boundaries(self):
+        # Given
+        value = datetime(2024, 1, 1, 7, 0, 5, tzinfo=timezone(timedelta(hours=-3)))
+
+        # When / Then
+        assert snap_to_bucket(value, bucket_seconds=60) == datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+        assert snap_to_bucket(value, up=True, bucket_seconds=60) == datetime(2024, 1, 1, 10, 1, tzinfo=timezone.utc)
+        assert snap_to_bucket(datetime(2024, 1, 1, 10, 1), up=True, bucket_seconds=60) == datetime(
+            2024, 1, 1, 10, 1, tzinfo=timezone.utc
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_inside_window_invalidates_report(self, repository, cache, mock_order):
+        # Given
+        cached_repository = CachedOrderRepository(repository, cache, bucket_seconds=60)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        await cached_repository.get_product_sales_report(start, end)
+
+        # When
+        await cached_repository.save(replace(mock_order, created_at=datetime(2024, 1, 1, 12, tzinfo=timezone.utc)))
+        await cached_repository.get_product_sales_report(start, end)
+
+        # Then
+        assert repository.get_product_sales_report.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_save_outside_window_keeps_report(self, repository, cache, mock_order):
+        # Given
+        cached_repository = CachedOrderRepository(repository, cache, bucket_seconds=60)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        await cached_repository.get_product_sales_report(start, end)
+
+        # When
+        await cached_repository.save(replace(mock_order, created_at=datetime(2024, 1, 3, tzinfo=timezone.utc)))
+        await cached_repository.get_product_sales_report(start, end)
+
+        # Then
+        repository.get_product_sales_report.assert_awaited_once()
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_report_is_cached_apart_and_invalidated(self, repository, cache, mock_order):
+        # Given
+        repository.get_waiter_sales_report.return_value = [
+            {"waiter_id": 1, "order_count": 1, "items_sold": 2, "total_price": 20.0}
+        ]
+        cached_repository = CachedOrderRepository(repository, cache, bucket_seconds=60)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        await cached_repository.get_product_sales_report(start, end)
+        await cached_repository.get_waiter_sales_report(start, end)
+        await cached_repository.get_waiter_sales_report(start, end)
+
+        # When
+        await cached_repository.save(replace(mock_order, created_at=datetime(2024, 1, 1, 12, tzinfo=timezone.utc)))
+        await cached_repository.get_waiter_sales_report(start, end)
+
+        # Then
+        assert repository.get_waiter_sales_report.await_count == 2
+        repository.get_product_sales_report.assert_awaited_once()
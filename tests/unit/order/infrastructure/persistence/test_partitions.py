@@ -0,0 +1,48 @@
+from datetime import date, datetime
+from sqlalchemy import create_engine
+from src.order.infrastructure.persistence.partitions import (
+    add_months,
+    ensure_monthly_partitions,
+    is_partitioned,
+    month_partitions,
+    month_start,
+    partition_name
+)
+
+class TestPartitions:
+    def test_month_start_truncates_to_first_day(self):
+        # When / Then
+        assert month_start(datetime(2026, 10, 18, 22, 30)) == date(2026, 10, 1)
+
+    def test_add_months_crosses_years(self):
+        # When / Then
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_partition_name_pads_month(self):
+        # When / Then
+        assert partition_name("order_items", date(2026, 3, 1)) == "order_items_y2026m03"
+
+    def test_month_partitions_cover_both_months_with_contiguous_bounds(self):
+        # When
+        partitions = month_partitions("orders", date(2026, 11, 15), date(2027, 1, 1))
+
+        # Then
+        assert partitions == [
+            ("orders_y2026m11", date(2026, 11, 1), date(2026, 12, 1)),
+            ("orders_y2026m12", date(2026, 12, 1), date(2027, 1, 1)),
+            ("orders_y2027m01", date(2027, 1, 1), date(2027, 2, 1))
+        ]
+
+    def test_ensure_monthly_partitions_is_a_no_op_without_partitioned_tables(self):
+        # Given
+        engine = create_engine("sqlite://")
+
+        # When
+        with engine.begin() as connection:
+            created = ensure_monthly_partitions(connection, date(2026, 10, 1), date(2027, 1, 1))
+            partitioned = is_partitioned(connection, "orders")
+
+        # Then
+        assert created == []
+        assert partitioned is False
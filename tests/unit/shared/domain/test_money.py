@@ -0,0 +1,57 @@
+import pickle
+import pytest
+from decimal import Decimal
+from src.shared.domain.value_objects import Money
+
+class TestMoney:
+    @pytest.mark.parametrize("amount", ["10.50", 10.5, Decimal("10.50")])
+    def test_create_converts_to_decimal(self, amount):
+        # When
+        money = Money(amount=amount)
+
+        # Then
+        assert money.amount == Decimal("10.50")
+        assert isinstance(money.amount, Decimal)
+        assert money.currency == "MXN"
+
+    @pytest.mark.parametrize("amount", [0, "-1", Decimal("NaN"), float("inf")])
+    def test_create_with_non_positive_amount_fails(self, amount):
+        # When/Then
+        with pytest.raises(ValueError, match="greater than 0"):
+            Money(amount=amount)
+
+    def test_create_with_invalid_format_fails(self):
+        # When/Then
+        with pytest.raises(ValueError, match="Invalid amount format"):
+            Money(amount="ten")
+
+    def test_money_is_immutable(self):
+        # Given
+        money = Money(amount=Decimal("10.00"))
+
+        # When/Then
+        with pytest.raises(AttributeError):
+            money.amount = Decimal("20.00")
+
+    def test_arithmetic_and_equality(self):
+        # Given
+        money = Money(amount=Decimal("10.00"))
+
+        # When
+        total = money * 2 + Money(amount=Decimal("5.00"))
+
+        # Then
+        assert total == Money(amount=Decimal("25.00"))
+        assert hash(total) == hash(Money(amount=Decimal("25.00")))
+        assert str(total) == "25.00"
+        assert pickle.loads(pickle.dumps(total)) == total
+
+    def test_multiply_by_zero_fails(self):
+        # When/Then
+        with pytest.raises(ValueError, match="greater than 0"):
+            Money(amount=Decimal("10.00")) * 0
+
+    def test_add_different_currencies_fails(self):
+        # When/Then
+        with pytest.raises(ValueError, match="different currencies"):
+            Money(amount=Decimal("10.00")) + Money(amount=Decimal("10.00"), currency="USD")
@@ -0,0 +1,39 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from src.order.application.dto.order_dto import OrderItemDTO, ProductSalesReportDTO
+from src.shared.infrastructure.api.responses import dto_response, json_dumps
+
+class TestResponses:
+    def test_json_dumps_matches_pydantic_json_mode(self):
+        # Given
+        dto = OrderItemDTO(product_name="Test Product", unit_price=Decimal("10.50"), quantity=2)
+        created_at = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+        # When
+        content = json.loads(json_dumps({"item": dto, "created_at": created_at}))
+
+        # Then
+        assert content["item"] == json.loads(dto.model_dump_json())
+        assert content["item"]["unit_price"] == "10.50"
+        assert content["created_at"] == "2024-01-01T12:30:00Z"
+
+    def test_dto_response_serializes_lists_with_status_code(self):
+        # Given
+        report = [
+            ProductSalesReportDTO.from_row({
+                "product_name": "Test Product",
+                "total_quantity": 3,
+                "total_price": Decimal("30.00")
+            })
+        ]
+
+        # When
+        response = dto_response(report, status_code=201)
+
+        # Then
+        assert response.status_code == 201
+        assert response.headers["content-type"] == "application/json"
+        assert json.loads(response.body) == [
+            {"product_name": "Test Product", "total_quantity": 3, "total_price": "30.00"}
+        ]
@@ -0,0 +1,85 @@
+import pytest
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestTTLCache:
+    @pytest.fixture
+    def timer(self):
+        return FakeTimer()
+
+    def test_get_returns_cached_value_and_counts_hit(self, timer):
+        # Given
+        cache = TTLCache(maxsize=2, ttl=10, timer=timer)
+        cache.set("key", "value")
+
+        # When
+        value = cache.get("key")
+
+        # Then
+        assert value == "value"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 0
+
+    def test_get_expired_entry_is_miss(self, timer):
+        # Given
+        cache = TTLCache(maxsize=2, ttl=10, timer=timer)
+        cache.set("key", "value")
+        timer.now = 10
+
+        # When
+        value = cache.get("key")
+
+        # Then
+        assert value is None
+        assert cache.stats()["misses"] == 1
+        assert len(cache) == 0
+
+    def test_set_with_custom_ttl(self, timer):
+        # Given
+        cache = TTLCache(maxsize=2, ttl=10, timer=timer)
+        cache.set("key", "value", ttl=1)
+        timer.now = 2
+
+        # When/Then
+        assert cache.get("key") is None
+
+    def test_set_evicts_least_recently_used(self, timer):
+        # Given
+        cache = TTLCache(maxsize=2, ttl=10, timer=timer)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        # When
+        cache.set("c", 3)
+
+        # Then
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_delete_and_clear(self, timer):
+        # Given
+        cache = TTLCache(maxsize=2, ttl=10, timer=timer)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # When
+        cache.delete("a")
+
+        # Then
+        assert cache.get("a") is None
+        cache.clear()
+        assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "maxsize": 2}
+
+    def test_invalid_maxsize_fails(self):
+        # When/Then
+        with pytest.raises(ValueError, match="maxsize must be greater than 0"):
+            TTLCache(maxsize=0, ttl=10)
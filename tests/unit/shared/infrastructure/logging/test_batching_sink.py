@@ -0,0 +1,84 @@
+import json
+import pytest
+from loguru import logger
+from src.shared.infrastructure.logging.batching_sink import BatchingSink
+
+@pytest.fixture
+def log_sink(tmp_path):
+    """Adds a BatchingSink handler that only receives records bound to SinkTest"""
+    handlers = []
+
+    def add(**options):
+        sink = BatchingSink(str(tmp_path / "app.log"), **options)
+        handlers.append(logger.add(
+            sink,
+            format=lambda record: "{exception}",
+            filter=lambda record: record["extra"].get("name") == "SinkTest"
+        ))
+        return sink
+
+    yield add
+    for handler_id in handlers:
+        logger.remove(handler_id)
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+class TestBatchingSink:
+    def test_writes_records_as_json_lines_on_stop(self, log_sink, tmp_path):
+        # Given
+        sink = log_sink()
+        test_logger = logger.bind(name="SinkTest")
+
+        # When
+        test_logger.info("Order {} created", 1)
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            test_logger.opt(exception=e).error("Failed")
+        sink.stop()
+
+        # Then
+        info, error = read_lines(tmp_path / "app.log")
+        assert info["level"] == "INFO"
+        assert info["logger"] == "SinkTest"
+        assert info["message"] == "Order 1 created"
+        assert "exception" not in info
+        assert error["level"] == "ERROR"
+        assert "ValueError: boom" in error["exception"]
+        assert sink.stats() == {"queued": 0, "written": 2, "dropped": 0}
+
+    def test_drops_records_when_the_queue_is_full(self, log_sink, tmp_path):
+        # Given
+        sink = log_sink(max_queue_size=2)
+        # Without the worker nothing drains the queue
+        sink._ensure_worker = lambda: None
+        test_logger = logger.bind(name="SinkTest")
+
+        # When
+        for i in range(5):
+            test_logger.info("Message {}", i)
+
+        # Then
+        assert sink.stats()["dropped"] == 3
+        assert sink.stats()["queued"] == 2
+
+    def test_rejects_unknown_overflow_policy(self, tmp_path):
+        # When / Then
+        with pytest.raises(ValueError):
+            BatchingSink(str(tmp_path / "app.log"), overflow="ignore")
+
+    def test_rotates_when_the_file_reaches_max_bytes(self, log_sink, tmp_path):
+        # Given
+        sink = log_sink(batch_size=1, max_bytes=1, backup_count=2)
+        test_logger = logger.bind(name="SinkTest")
+
+        # When
+        for i in range(4):
+            test_logger.info("Message {}", i)
+        sink.stop()
+
+        # Then
+        assert read_lines(tmp_path / "app.log.1")[-1]["message"] == "Message 3"
+        assert (tmp_path / "app.log.2").exists()
+        assert not (tmp_path / "app.log.3").exists()
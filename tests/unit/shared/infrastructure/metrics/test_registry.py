@@ -0,0 +1,68 @@
+import pytest
+from src.shared.infrastructure.metrics.registry import MetricFamily, MetricsRegistry, Sample
+
+class TestMetricsRegistry:
+    @pytest.fixture
+    def registry(self):
+        return MetricsRegistry()
+
+    def test_renders_counters_with_labels(self, registry):
+        # Given
+        requests = registry.counter("http_requests_total", "HTTP requests", ("method", "route"))
+
+        # When
+        requests.inc("GET", "/orders")
+        requests.inc("GET", "/orders")
+        requests.inc("POST", '/say "hi"')
+
+        # Then
+        lines = registry.render().splitlines()
+        assert lines[:2] == ["# HELP http_requests_total HTTP requests", "# TYPE http_requests_total counter"]
+        assert 'http_requests_total{method="GET",route="/orders"} 2' in lines
+        assert 'http_requests_total{method="POST",route="/say \\"hi\\""} 1' in lines
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        # Given
+        latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+
+        # When
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value, "/orders")
+
+        # Then
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{route="/orders",le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{route="/orders",le="1"} 3' in lines
+        assert 'latency_seconds_bucket{route="/orders",le="+Inf"} 4' in lines
+        assert 'latency_seconds_sum{route="/orders"} 3.65' in lines
+        assert 'latency_seconds_count{route="/orders"} 4' in lines
+
+    def test_collectors_are_called_on_render(self, registry):
+        # Given
+        sizes = iter([1, 2])
+        registry.register_collector(lambda: [
+            MetricFamily("cache_entries", "gauge", "Entries", [Sample("cache_entries", {"cache": "user"}, next(sizes))])
+        ])
+
+        # When / Then
+        assert 'cache_entries{cache="user"} 1' in registry.render()
+        assert 'cache_entries{cache="user"} 2' in registry.render()
+
+    def test_rejects_duplicate_names(self, registry):
+        # Given
+        registry.counter("requests_total", "Requests")
+
+        # When / Then
+        with pytest.raises(ValueError):
+            registry.histogram("requests_total", "Requests")
+
+    def test_clear_resets_values(self, registry):
+        # Given
+        requests = registry.counter("requests_total", "Requests")
+        requests.inc()
+
+        # When
+        registry.clear()
+
+        # Then
+        assert "requests_total 1" not in registry.render()
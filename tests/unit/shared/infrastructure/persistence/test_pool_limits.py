@@ -0,0 +1,29 @@
+import pytest
+from src.shared.infrastructure.persistence.database import pool_limits
+
+class TestPoolLimits:
+    def test_uses_configured_values_without_connection_budget(self):
+        # When / Then
+        assert pool_limits(5, 10) == (5, 10)
+
+    def test_splits_connection_budget_between_workers(self):
+        # Given 4 workers sharing 40 connections, one per worker kept for the sync engine
+        # When
+        size, overflow = pool_limits(5, 10, max_connections=40, workers=4, reserved=1)
+
+        # Then
+        assert (size, overflow) == (5, 4)
+        assert 4 * (size + overflow + 1) <= 40
+
+    def test_caps_pool_size_when_share_is_small(self):
+        # When / Then
+        assert pool_limits(5, 10, max_connections=12, workers=4) == (3, 0)
+
+    def test_unlimited_overflow_is_capped_to_share(self):
+        # When / Then
+        assert pool_limits(2, -1, max_connections=20, workers=2) == (2, 8)
+
+    def test_rejects_budget_smaller_than_worker_count(self):
+        # When / Then
+        with pytest.raises(ValueError):
+            pool_limits(5, 10, max_connections=4, workers=4, reserved=1)
@@ -15,9 +15,10 @@ class TestCreateUserCommand:
             created_at=datetime.utcnow()
         )
 
-    def test_execute_success(self, mocker, mock_user):
+    @pytest.mark.asyncio
+    async def test_execute_success(self, mocker, mock_user):
         # Given
-        mock_service = mocker.Mock()
+        mock_service = mocker.AsyncMock()
         mock_service.create_user.return_value = UserResponseDTO.from_entity(mock_user)
 
         command = CreateUserCommand(mock_service)
@@ -27,13 +28,13 @@ class TestCreateUserCommand:
         )
 
         # When
-        result = command.execute(user_data.model_dump())
+        result = await command.execute(user_data.model_dump())
 
         # Then
         assert isinstance(result, UserResponseDTO)
         assert result.email == str(mock_user.email)
         assert result.name == mock_user.name
-        mock_service.create_user.assert_called_once_with(
+        mock_service.create_user.assert_awaited_once_with(
             email="test@example.com",
             name="Test User"
         )
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock
 from datetime import datetime
 from src.user.domain.service.user_service import UserService
 from src.user.domain.model.user import User
@@ -10,7 +10,7 @@ from src.user.application.dto.user_dto import UserResponseDTO
 class TestUserService:
     @pytest.fixture
     def user_repository(self):
-        return Mock()
+        return AsyncMock()
 
     @pytest.fixture
     def user_service(self, user_repository):
@@ -25,13 +25,14 @@ class TestUserService:
             created_at=datetime.utcnow()
         )
 
-    def test_create_user_success(self, user_service, user_repository, sample_user):
+    @pytest.mark.asyncio
+    async def test_create_user_success(self, user_service, user_repository, sample_user):
         # Given
         user_repository.find_by_email.return_value = None
         user_repository.save.return_value = sample_user
 
         # When
-        result = user_service.create_user(
+        result = await user_service.create_user(
             email="test@example.com",
             name="Test User"
         )
@@ -40,39 +41,42 @@ class TestUserService:
         assert isinstance(result, UserResponseDTO)
         assert result.email == str(sample_user.email)
         assert result.name == sample_user.name
-        user_repository.save.assert_called_once()
+        user_repository.save.assert_awaited_once()
 
-    def test_create_user_with_existing_email_fails(self, user_service, user_repository, sample_user):
+    @pytest.mark.asyncio
+    async def test_create_user_with_existing_email_fails(self, user_service, user_repository, sample_user):
         # Given
         user_repository.find_by_email.return_value = sample_user
 
         # When/Then
         with pytest.raises(ValidationException, match="Email test@example.com is already registered"):
-            user_service.create_user(
+            await user_service.create_user(
                 email="test@example.com",
                 name="Test User"
             )
 
-    def test_get_user_by_email_success(self, user_service, user_repository, sample_user):
+    @pytest.mark.asyncio
+    async def test_get_user_by_email_success(self, user_service, user_repository, sample_user):
         # Given
         user_repository.find_by_email.return_value = sample_user
 
         # When
-        result = user_service.get_user_by_email("test@example.com")
+        result = await user_service.get_user_by_email("test@example.com")
 
         # Then
         assert isinstance(result, UserResponseDTO)
         assert result.email == str(sample_user.email)
         assert result.name == sample_user.name
-        user_repository.find_by_email.assert_called_once_with("test@example.com")
+        user_repository.find_by_email.assert_awaited_once_with("test@example.com")
 
-    def test_get_user_by_email_not_found(self, user_service, user_repository, sample_user_dict):
+    @pytest.mark.asyncio
+    async def test_get_user_by_email_not_found(self, user_service, user_repository, sample_user_dict):
         # Given
         user_repository.find_by_email.return_value = None
 
         # When
-        found_user = user_service.get_user_by_email(sample_user_dict["email"])
+        found_user = await user_service.get_user_by_email(sample_user_dict["email"])
 
         # Then
         assert found_user is None
-        user_repository.find_by_email.assert_called_once_with(sample_user_dict["email"])
+        user_repository.find_by_email.assert_awaited_once_with(sample_user_dict["email"])
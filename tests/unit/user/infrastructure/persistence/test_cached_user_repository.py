@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import AsyncMock
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
+from src.user.infrastructure.persistence.cached_user_repository import CachedUserRepository
+
+class TestCachedUserRepository:
+    @pytest.fixture
+    def repository(self, mock_user):
+        repository = AsyncMock()
+        repository.find_by_email.return_value = mock_user
+        repository.find_by_id.return_value = mock_user
+        repository.save.return_value = mock_user
+        return repository
+
+    @pytest.fixture
+    def cache(self):
+        return TTLCache(maxsize=10, ttl=60)
+
+    @pytest.mark.asyncio
+    async def test_find_by_email_is_cached(self, repository, cache, mock_user):
+        # Given
+        cached_repository = CachedUserRepository(repository, cache)
+
+        # When
+        first = await cached_repository.find_by_email(str(mock_user.email))
+        second = await cached_repository.find_by_email(str(mock_user.email))
+
+        # Then
+        assert first == second == mock_user
+        repository.find_by_email.assert_awaited_once_with(str(mock_user.email))
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_find_by_email_populates_id_key(self, repository, cache, mock_user):
+        # Given
+        cached_repository = CachedUserRepository(repository, cache)
+        await cached_repository.find_by_email(str(mock_user.email))
+
+        # When
+        user = await cached_repository.find_by_id(mock_user.id)
+
+        # Then
+        assert user == mock_user
+        repository.find_by_id.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_missing_user_is_not_cached(self, repository, cache):
+        # Given
+        repository.find_by_email.return_value = None
+        cached_repository = CachedUserRepository(repository, cache)
+
+        # When
+        await cached_repository.find_by_email("nonexistent@example.com")
+        await cached_repository.find_by_email("nonexistent@example.com")
+
+        # Then
+        assert repository.find_by_email.await_count == 2
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_save_refreshes_cache(self, repository, cache, mock_user):
+        # Given
+        cached_repository = CachedUserRepository(repository, cache)
+
+        # When
+        await cached_repository.save(mock_user)
+        user = await cached_repository.find_by_email(str(mock_user.email))
+
+        # Then
+        assert user == mock_user
+        repository.find_by_email.assert_not_awaited()